@@ -0,0 +1,103 @@
+"""
+Бенчмарк проверки ответа `GET /v1/account`.
+
+Сравнивает построение и обход дерева матчеров hamcrest на каждый вызов
+(прежняя реализация `GetV1Account.check_response_values`) с проверкой
+через `CompiledChecker`.
+
+Запуск:
+    python -m benchmarks.bench_checkers --iterations 20000
+"""
+import argparse
+import time
+from datetime import datetime
+
+from hamcrest import (
+    assert_that, has_property, starts_with, all_of, instance_of, has_properties, equal_to,
+    contains_inanyorder, has_length, none
+)
+
+from benchmarks.bench_model_validation import PAYLOAD
+from checkers.get_v1_account import GetV1Account
+from dm_api_account.models.UserDetailsEnvelope import ColorSchema, UserDetailsEnvelope
+from dm_api_account.models.UserEnvelope import UserRole
+
+LOGIN = 'DarrenDalton'
+
+
+def _matcher_tree(response, login):
+    assert_that(
+        response,
+        has_property(
+            "resource",
+            all_of(
+                has_properties({
+                    "login": starts_with(login),
+                    "roles": all_of(
+                        contains_inanyorder(UserRole.GUEST, UserRole.PLAYER),
+                        has_length(2)
+                    ),
+                    "online": instance_of(datetime),
+                    "registration": instance_of(datetime),
+                    "info": equal_to(""),
+                    "medium_picture_url": none(),
+                    "small_picture_url": none(),
+                    "status": none(),
+                    "name": none(),
+                    "location": none(),
+                    "icq": none(),
+                    "skype": none(),
+                    "original_picture_url": none(),
+                    "rating": has_properties({
+                        "enabled": equal_to(True),
+                        "quality": equal_to(0),
+                        "quantity": equal_to(0),
+                    }),
+                    "settings": has_properties({
+                        "colorSchema": equal_to(ColorSchema.MODERN),
+                        "nannyGreetingsMessage": none(),
+                        "paging": has_properties({
+                            "posts_per_page": equal_to(10),
+                            "commentsPerPage": equal_to(10),
+                            "topicsPerPage": equal_to(10),
+                            "messagesPerPage": equal_to(10),
+                            "entitiesPerPage": equal_to(10),
+                        }),
+                    }),
+                })
+            )
+        )
+    )
+
+
+def _run(check, response, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        check(response, LOGIN)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=10000)
+    args = parser.parse_args()
+
+    response = UserDetailsEnvelope.model_validate_json(PAYLOAD)
+    methods = {
+        'hamcrest matcher tree': _matcher_tree,
+        'CompiledChecker': lambda actual, login: GetV1Account.checker.check(actual, login=login),
+    }
+
+    results = {}
+    for name, check in methods.items():
+        _run(check, response, min(500, args.iterations))
+        results[name] = _run(check, response, args.iterations)
+
+    baseline = results['hamcrest matcher tree']
+    for name, elapsed in results.items():
+        per_call = elapsed / args.iterations * 1_000_000
+        print(f"{name:>22}: {per_call:7.1f} us/check  x{elapsed / baseline:.2f}")
+
+
+if __name__ == '__main__':
+    main()
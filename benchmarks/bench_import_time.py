@@ -0,0 +1,83 @@
+"""
+Бенчмарк времени импорта модулей пакета.
+
+Каждый модуль импортируется в отдельном процессе `python -X importtime`,
+из вывода берется накопленное время импорта модуля (минимум по повторам)
+и список всех загруженных модулей. Бенчмарк завершается с кодом 1, если
+время импорта превышает бюджет или при импорте загружаются тяжелые
+зависимости, которые должны подключаться лениво при первом использовании.
+
+Запуск:
+    python -m benchmarks.bench_import_time --budget-ms 400
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+MODULES = (
+    'rest_client.client',
+    'services.api_dm_account',
+    'services.api_mailhog',
+    'helpers.account_helper',
+    'load_generator.generator',
+)
+LAZY_DEPENDENCIES = ('allure', 'curlify', 'structlog', 'faker')
+
+_root = Path(__file__).resolve().parent.parent
+
+
+def _import_profile(module: str) -> tuple[int, dict[str, int]]:
+    """
+    Импорт модуля в новом процессе.
+
+    Returns:
+        tuple[int, dict[str, int]]: Накопленное время импорта модуля, мкс,
+        и собственное время импорта каждого загруженного модуля, мкс
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=_root, capture_output=True, text=True, check=True
+    )
+    total, self_times = 0, {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        self_times[name] = int(self_us)
+        if name == module:
+            total = int(cumulative_us)
+    return total, self_times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modules', nargs='+', default=list(MODULES))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=None, help='бюджет времени импорта одного модуля')
+    parser.add_argument('--top', type=int, default=5, help='сколько самых дорогих модулей показать')
+    args = parser.parse_args()
+
+    violations = []
+    for module in args.modules:
+        profiles = [_import_profile(module) for _ in range(args.repeat)]
+        total, self_times = min(profiles, key=lambda profile: profile[0])
+        print(f"{module:>26}: {total / 1000:7.1f} ms")
+
+        heaviest = sorted(self_times.items(), key=lambda item: item[1], reverse=True)[:args.top]
+        print('    ' + ', '.join(f"{name} {elapsed / 1000:.1f}" for name, elapsed in heaviest))
+
+        loaded = sorted({name.split('.')[0] for name in self_times} & set(LAZY_DEPENDENCIES))
+        if loaded:
+            violations.append(f"{module}: при импорте загружены {', '.join(loaded)}")
+        if args.budget_ms is not None and total / 1000 > args.budget_ms:
+            violations.append(f"{module}: {total / 1000:.1f} ms превышает бюджет {args.budget_ms:.0f} ms")
+
+    for violation in violations:
+        print(violation, file=sys.stderr)
+    sys.exit(1 if violations else 0)
+
+
+if __name__ == '__main__':
+    main()
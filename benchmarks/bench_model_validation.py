@@ -0,0 +1,101 @@
+"""
+Бенчмарк валидации ответов DM API моделями pydantic.
+
+Сравнивает разбор типичного ответа `GET /v1/account` через
+`json.loads` + `Model(**data)` (прежний способ), `Model.model_validate`
+и разбор сразу из байтов через `Model.model_validate_json` и
+`TypeAdapter.validate_json`. Для каждого способа выводится время разбора
+и пиковый объем временных аллокаций по `tracemalloc`. Отдельно измеряется
+`LazyModelView` с обращением только к `resource.login`.
+
+Запуск:
+    python -m benchmarks.bench_model_validation --iterations 20000
+"""
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Callable
+
+from pydantic import TypeAdapter
+
+from dm_api_account.models.UserDetailsEnvelope import UserDetailsEnvelope
+from rest_client.lazy_model import validate_envelope
+
+PAYLOAD = json.dumps({
+    "resource": {
+        "login": "DarrenDalton_3f2504e0w0n1",
+        "roles": ["Guest", "Player"],
+        "mediumPictureUrl": None,
+        "smallPictureUrl": None,
+        "status": None,
+        "rating": {"enabled": True, "quality": 0, "quantity": 0},
+        "online": "2025-08-12T22:43:04.123456+00:00",
+        "name": None,
+        "location": None,
+        "registration": "2025-08-12T22:43:04.123456+00:00",
+        "icq": None,
+        "skype": None,
+        "originalPictureUrl": None,
+        "info": "",
+        "settings": {
+            "colorSchema": "Modern",
+            "nannyGreetingsMessage": None,
+            "paging": {
+                "postsPerPage": 10,
+                "commentsPerPage": 10,
+                "topicsPerPage": 10,
+                "messagesPerPage": 10,
+                "entitiesPerPage": 10,
+            },
+        },
+    },
+    "metadata": None,
+}).encode()
+
+_adapter = TypeAdapter(UserDetailsEnvelope)
+
+METHODS: dict[str, Callable[[bytes], object]] = {
+    'Model(**json.loads)': lambda body: UserDetailsEnvelope(**json.loads(body)),
+    'model_validate(json.loads)': lambda body: UserDetailsEnvelope.model_validate(json.loads(body)),
+    'model_validate_json': UserDetailsEnvelope.model_validate_json,
+    'TypeAdapter.validate_json': _adapter.validate_json,
+    'LazyModelView resource.login': lambda body: validate_envelope(UserDetailsEnvelope, body, lazy=True).resource.login,
+}
+
+
+def _timing(method: Callable[[bytes], object], iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        method(PAYLOAD)
+    return time.perf_counter() - started
+
+
+def _peak_allocations(method: Callable[[bytes], object]) -> int:
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    method(PAYLOAD)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak - baseline
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=10000)
+    args = parser.parse_args()
+
+    results = {}
+    for name, method in METHODS.items():
+        _timing(method, min(500, args.iterations))
+        results[name] = (_timing(method, args.iterations), _peak_allocations(method))
+
+    baseline = results['Model(**json.loads)'][0]
+    for name, (elapsed, peak) in results.items():
+        per_call = elapsed / args.iterations * 1_000_000
+        print(f"{name:>29}: {per_call:7.1f} us/response  x{elapsed / baseline:.2f}  peak {peak:>6} B")
+
+
+if __name__ == '__main__':
+    main()
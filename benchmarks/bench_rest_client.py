@@ -0,0 +1,90 @@
+"""
+Бенчмарк накладных расходов RestClient.
+
+Сравнивает стоимость запроса в обычном режиме (с вложениями Allure и
+логированием), с `disable_log=True` и в `performance_mode` против
+локального HTTP сервера, чтобы измерять только работу клиента.
+
+Запуск:
+    python -m benchmarks.bench_rest_client --requests 2000
+"""
+import argparse
+import contextlib
+import io
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+from rest_client.client import RestClient
+from rest_client.configuration import Configuration
+
+PAYLOAD = json.dumps({
+    "resource": {
+        "login": "DarrenDalton12_08_2025_22_43_04",
+        "roles": ["Guest", "Player"],
+        "rating": {"enabled": True, "quality": 0, "quantity": 0},
+        "registration": "2025-08-12T22:43:04.123456+00:00",
+    },
+    "metadata": None,
+}).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _reply(self) -> None:
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _reply
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def _run(client: RestClient, requests: int) -> float:
+    body = {"login": "user", "password": "password", "email": "user@mail.ru"}
+    started = time.perf_counter()
+    for _ in range(requests):
+        client.post(path='/v1/account', json=body)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=1000)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    host = f'http://127.0.0.1:{server.server_port}'
+
+    modes = {
+        'logging': Configuration(host=host),
+        'disable_log': Configuration(host=host, disable_log=True),
+        'performance_mode': Configuration(host=host, performance_mode=True),
+    }
+    results = {}
+    for name, configuration in modes.items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            client = RestClient(configuration=configuration)
+            _run(client, min(50, args.requests))
+            results[name] = _run(client, args.requests)
+
+    server.shutdown()
+    baseline = results['performance_mode']
+    for name, elapsed in results.items():
+        per_request = elapsed / args.requests * 1_000_000
+        print(f"{name:>18}: {per_request:9.1f} us/request  x{elapsed / baseline:.2f}")
+
+
+if __name__ == '__main__':
+    main()
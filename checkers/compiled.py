@@ -0,0 +1,155 @@
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, Callable
+
+from hamcrest.core.core.isequal import IsEqual
+from hamcrest.core.core.isinstanceof import IsInstanceOf
+from hamcrest.core.core.isnone import IsNone
+from hamcrest.core.matcher import Matcher
+from hamcrest.core.string_description import StringDescription
+from hamcrest.library.text.stringstartswith import StringStartsWith
+
+
+@dataclass(frozen=True)
+class Arg:
+    """
+    Ожидание, зависящее от аргумента проверки.
+
+    Матчер строится при каждом вызове `CompiledChecker.check` из значения
+    именованного аргумента, например `Arg('login', starts_with)`.
+
+    Attributes:
+        name (str): Имя аргумента `check`
+        matcher_factory (Callable[[Any], Matcher]): Фабрика матчера по значению аргумента
+    """
+    name: str
+    matcher_factory: Callable[[Any], Matcher]
+
+
+def _predicate(matcher: Matcher) -> Callable[[Any], bool]:
+    """
+    Быстрая проверка для распространенных матчеров hamcrest,
+    для остальных используется `matcher.matches`.
+    """
+    if isinstance(matcher, IsEqual):
+        expected = matcher.object
+        return lambda value: value == expected
+    if isinstance(matcher, IsNone):
+        return lambda value: value is None
+    if isinstance(matcher, IsInstanceOf):
+        expected_type = matcher.expected_type
+        return lambda value: isinstance(value, expected_type)
+    if isinstance(matcher, StringStartsWith):
+        prefix = matcher.substring
+        return lambda value: isinstance(value, str) and value.startswith(prefix)
+    return matcher.matches
+
+
+def _as_matcher(expected: Any) -> Matcher:
+    return expected if isinstance(expected, Matcher) else IsEqual(expected)
+
+
+@dataclass(frozen=True)
+class _Check:
+    path: str
+    getter: Callable[[Any], Any]
+    matcher: Matcher | None
+    predicate: Callable[[Any], bool] | None
+    arg: Arg | None
+
+
+def _flatten(spec: dict[str, Any], prefix: str = '') -> list[tuple[str, Any]]:
+    items = []
+    for name, expected in spec.items():
+        path = f"{prefix}.{name}" if prefix else name
+        if isinstance(expected, dict):
+            items.extend(_flatten(expected, path))
+        else:
+            items.append((path, expected))
+    return items
+
+
+class CompiledChecker:
+    """
+    Проверка объекта по спецификации ожидаемой структуры.
+
+    Спецификация - вложенный словарь атрибутов, листья которого содержат
+    матчеры hamcrest, значения для сравнения на равенство или `Arg`.
+    При создании она превращается в плоский список проверок с готовыми
+    `attrgetter`, а распространенные матчеры (`equal_to`, `none`,
+    `instance_of`, `starts_with`) заменяются прямыми сравнениями, поэтому
+    проверка не обходит дерево матчеров. Описания матчеров hamcrest
+    строятся только для несовпавших атрибутов.
+
+    Args:
+        spec (dict[str, Any]): Спецификация ожидаемой структуры
+    """
+
+    def __init__(self, spec: dict[str, Any]):
+        self.checks: list[_Check] = []
+        for path, expected in _flatten(spec):
+            getter = attrgetter(path)
+            if isinstance(expected, Arg):
+                self.checks.append(_Check(path, getter, None, None, expected))
+            else:
+                matcher = _as_matcher(expected)
+                self.checks.append(_Check(path, getter, matcher, _predicate(matcher), None))
+
+    def mismatches(self, actual: Any, **args: Any) -> list[str]:
+        """
+        Поиск несовпадений без выбрасывания исключения.
+
+        Args:
+            actual (Any): Проверяемый объект
+            **args: Значения для ожиданий `Arg`
+
+        Returns:
+            list[str]: Описания несовпадений в формате hamcrest
+        """
+        mismatches = []
+        for check in self.checks:
+            matcher, predicate = check.matcher, check.predicate
+            if check.arg is not None:
+                matcher = _as_matcher(check.arg.matcher_factory(args[check.arg.name]))
+                predicate = _predicate(matcher)
+
+            try:
+                value = check.getter(actual)
+            except AttributeError:
+                mismatches.append(self._describe(check.path, matcher, None, missing=True))
+                continue
+
+            if not predicate(value):
+                mismatches.append(self._describe(check.path, matcher, value))
+        return mismatches
+
+    def check(self, actual: Any, **args: Any) -> None:
+        """
+        Проверка объекта.
+
+        Args:
+            actual (Any): Проверяемый объект
+            **args: Значения для ожиданий `Arg`
+
+        Raises:
+            AssertionError: Если хотя бы один атрибут не соответствует спецификации
+        """
+        mismatches = self.mismatches(actual, **args)
+        if mismatches:
+            raise AssertionError('\n' + '\n'.join(mismatches))
+
+    @staticmethod
+    def _describe(path: str, matcher: Matcher, value: Any, missing: bool = False) -> str:
+        expected = StringDescription()
+        matcher.describe_to(expected)
+
+        mismatch = StringDescription()
+        if missing:
+            mismatch.append_text('no property ').append_description_of(path)
+        else:
+            mismatch.append_text('property ').append_description_of(path).append_text(' ')
+            matcher.describe_mismatch(value, mismatch)
+        return (
+            f"Expected: object with property '{path}' matching {expected}\n"
+            f"     but: {mismatch}"
+        )
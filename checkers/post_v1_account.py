@@ -1,10 +1,23 @@
 from datetime import datetime
 
 import allure
-from hamcrest import assert_that, all_of, starts_with, has_property, instance_of, has_properties, equal_to
+from hamcrest import assert_that, starts_with, instance_of, equal_to
+
+from checkers.compiled import Arg, CompiledChecker
 
 
 class PostV1Account:
+    checker = CompiledChecker({
+        "resource": {
+            "login": Arg("login", starts_with),
+            "registration": instance_of(datetime),
+            "rating": {
+                "enabled": equal_to(True),
+                "quality": equal_to(0),
+                "quantity": equal_to(0),
+            },
+        }
+    })
 
     @classmethod
     @allure.step("Проверка ответа POST v1/account")
@@ -13,20 +26,4 @@ class PostV1Account:
 
         assert_that(str(response.resource.registration), starts_with(today))
 
-        assert_that(
-            response, all_of(
-                has_property('resource', has_property('login', starts_with(prepare_user.login))),
-                has_property('resource', has_property('registration', instance_of(datetime))),
-                has_property(
-                    'resource', has_properties(
-                        'rating', has_properties(
-                            {
-                                "enabled": equal_to(True),
-                                "quality": equal_to(0),
-                                "quantity": equal_to(0)
-                            }
-                        )
-                    )
-                ),
-            )
-        )
+        cls.checker.check(response, login=prepare_user.login)
@@ -1,6 +1,5 @@
 from typing import Any
 
-import allure
 from requests.models import Response
 
 from dm_api_account.models.ChangeEmail import ChangeEmail
@@ -10,6 +9,8 @@ from dm_api_account.models.ResetPassword import ResetPassword
 from dm_api_account.models.UserDetailsEnvelope import UserDetailsEnvelope
 from dm_api_account.models.UserEnvelope import UserEnvelope
 from rest_client.client import RestClient
+from rest_client.lazy_model import LazyModelView, validate_envelope
+from rest_client.utilites import step
 
 
 class AccountApi(RestClient):
@@ -22,7 +23,7 @@ class AccountApi(RestClient):
 
     _v1_account = '/v1/account'
 
-    @allure.step("Регистрация нового пользователя")
+    @step("Регистрация нового пользователя")
     def post_v1_account(self, reg_data: Registration, **kwargs: Any) -> Response:
         """
         Регистрация нового пользователя.
@@ -43,13 +44,19 @@ class AccountApi(RestClient):
 
         return response
 
-    @allure.step("Получение информации о текущем пользователе")
-    def get_v1_account(self, validate_response: bool = True, **kwargs: Any) -> Response | UserDetailsEnvelope:
+    @step("Получение информации о текущем пользователе")
+    def get_v1_account(
+            self,
+            validate_response: bool = True,
+            lazy_response: bool = False,
+            **kwargs: Any
+    ) -> Response | UserDetailsEnvelope | LazyModelView:
         """
         Получение информации о текущем пользователе.
 
         Args:
             validate_response (bool): Включение валлидации pydantic
+            lazy_response (bool): Вернуть LazyModelView с валидацией полей при обращении
             **kwargs: Дополнительные параметры для HTTP запроса
 
         Returns:
@@ -61,23 +68,25 @@ class AccountApi(RestClient):
         )
 
         if validate_response:
-            return UserDetailsEnvelope(**response.json())
+            return validate_envelope(UserDetailsEnvelope, response.content, lazy=lazy_response)
 
         return response
 
-    @allure.step("Активация зарегистрированного пользователя по токену")
+    @step("Активация зарегистрированного пользователя по токену")
     def put_v1_account_token(
             self,
             token: str,
             validate_response: bool = True,
+            lazy_response: bool = False,
             **kwargs: Any
-    ) -> UserEnvelope | Response:
+    ) -> UserEnvelope | LazyModelView | Response:
         """
         Активация зарегистрированного пользователя по токену.
         
         Args:
             token (str): Токен активации, полученный при регистрации
             validate_response (bool): Включение валлидации pydantic
+            lazy_response (bool): Вернуть LazyModelView с валидацией полей при обращении
             **kwargs: Дополнительные параметры для HTTP запроса
             
         Returns:
@@ -93,19 +102,25 @@ class AccountApi(RestClient):
             **kwargs
         )
         if validate_response:
-            return UserEnvelope(**response.json())
+            return validate_envelope(UserEnvelope, response.content, lazy=lazy_response)
 
         return response
 
-    @allure.step("Сброс пароля пользователя")
-    def post_v1_account_password(self, login_data: ResetPassword, validate_response: bool = True,
-                                 **kwargs: Any) -> UserEnvelope | Response:
+    @step("Сброс пароля пользователя")
+    def post_v1_account_password(
+            self,
+            login_data: ResetPassword,
+            validate_response: bool = True,
+            lazy_response: bool = False,
+            **kwargs: Any
+    ) -> UserEnvelope | LazyModelView | Response:
         """
         Сброс пароля пользователя.
         
         Args:
             login_data (ResetPassword): Данные для сброса пароля
             validate_response (bool): Включение валлидации pydantic
+            lazy_response (bool): Вернуть LazyModelView с валидацией полей при обращении
             **kwargs: Дополнительные параметры для HTTP запроса
             
         Returns:
@@ -118,18 +133,24 @@ class AccountApi(RestClient):
         )
 
         if validate_response:
-            return UserEnvelope(**response.json())
+            return validate_envelope(UserEnvelope, response.content, lazy=lazy_response)
         return response
 
-    @allure.step("Изменение пароля пользователя")
-    def put_v1_account_change_password(self, change_password_data: ChangePassword, validate_response: bool = True,
-                                       **kwargs: Any) -> UserEnvelope | Response:
+    @step("Изменение пароля пользователя")
+    def put_v1_account_change_password(
+            self,
+            change_password_data: ChangePassword,
+            validate_response: bool = True,
+            lazy_response: bool = False,
+            **kwargs: Any
+    ) -> UserEnvelope | LazyModelView | Response:
         """
         Изменение пароля пользователя.
         
         Args:
             change_password_data (ChangePassword): Данные для изменения пароля
             validate_response (bool): Включение валлидации pydantic
+            lazy_response (bool): Вернуть LazyModelView с валидацией полей при обращении
             **kwargs: Дополнительные параметры для HTTP запроса
             
         Returns:
@@ -137,28 +158,29 @@ class AccountApi(RestClient):
         """
         response = self.put(
             path=f'{self._v1_account}/password',
-            headers=self.session.headers,
             json=change_password_data.model_dump(exclude_none=True, by_alias=True),
             **kwargs
         )
 
         if validate_response:
-            return UserEnvelope(**response.json())
+            return validate_envelope(UserEnvelope, response.content, lazy=lazy_response)
         return response
 
-    @allure.step("Изменение email адреса зарегистрированного пользователя")
+    @step("Изменение email адреса зарегистрированного пользователя")
     def put_v1_account_change_email(
             self,
             change_email_data: ChangeEmail,
             validate_response: bool = True,
+            lazy_response: bool = False,
             **kwargs: Any
-    ) -> UserEnvelope | Response:
+    ) -> UserEnvelope | LazyModelView | Response:
         """
         Изменение email адреса зарегистрированного пользователя.
         
         Args:
             change_email_data (ChangeEmail): Новые данные пользователя с обновленным email
             validate_response (bool): Включение валлидации pydantic
+            lazy_response (bool): Вернуть LazyModelView с валидацией полей при обращении
             **kwargs: Дополнительные параметры для HTTP запроса
             
         Returns:
@@ -172,5 +194,5 @@ class AccountApi(RestClient):
         )
 
         if validate_response:
-            return UserEnvelope(**response.json())
+            return validate_envelope(UserEnvelope, response.content, lazy=lazy_response)
         return response
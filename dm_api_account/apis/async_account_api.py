@@ -0,0 +1,192 @@
+from typing import Any
+
+from httpx import Response
+
+from dm_api_account.models.ChangeEmail import ChangeEmail
+from dm_api_account.models.ChangePassword import ChangePassword
+from dm_api_account.models.Registration import Registration
+from dm_api_account.models.ResetPassword import ResetPassword
+from dm_api_account.models.UserDetailsEnvelope import UserDetailsEnvelope
+from dm_api_account.models.UserEnvelope import UserEnvelope
+from rest_client.async_client import AsyncRestClient
+from rest_client.lazy_model import LazyModelView, validate_envelope
+from rest_client.utilites import async_step
+
+
+class AsyncAccountApi(AsyncRestClient):
+    """
+    Асинхронный API клиент для работы с аккаунтами пользователей.
+
+    Повторяет методы `AccountApi` поверх `AsyncRestClient`.
+    """
+
+    _v1_account = '/v1/account'
+
+    @async_step("Регистрация нового пользователя")
+    async def post_v1_account(self, reg_data: Registration, **kwargs: Any) -> Response:
+        """
+        Регистрация нового пользователя.
+
+        Args:
+            reg_data (Registration): Данные для регистрации пользователя
+            **kwargs: Дополнительные параметры для HTTP запроса
+
+        Returns:
+            Response: HTTP ответ от сервера с результатом регистрации
+        """
+        return await self.post(
+            path=self._v1_account,
+            json=reg_data.model_dump(exclude_none=True),
+            **kwargs
+        )
+
+    @async_step("Получение информации о текущем пользователе")
+    async def get_v1_account(
+            self,
+            validate_response: bool = True,
+            lazy_response: bool = False,
+            **kwargs: Any
+    ) -> Response | UserDetailsEnvelope | LazyModelView:
+        """
+        Получение информации о текущем пользователе.
+
+        Args:
+            validate_response (bool): Включение валлидации pydantic
+            lazy_response (bool): Вернуть LazyModelView с валидацией полей при обращении
+            **kwargs: Дополнительные параметры для HTTP запроса
+
+        Returns:
+            Response | UserDetailsEnvelope: HTTP ответ от сервера с информацией о пользователе | UserDetailsEnvelope
+        """
+        response = await self.get(
+            path=self._v1_account,
+            **kwargs
+        )
+
+        if validate_response:
+            return validate_envelope(UserDetailsEnvelope, response.content, lazy=lazy_response)
+
+        return response
+
+    @async_step("Активация зарегистрированного пользователя по токену")
+    async def put_v1_account_token(
+            self,
+            token: str,
+            validate_response: bool = True,
+            lazy_response: bool = False,
+            **kwargs: Any
+    ) -> UserEnvelope | LazyModelView | Response:
+        """
+        Активация зарегистрированного пользователя по токену.
+
+        Args:
+            token (str): Токен активации, полученный при регистрации
+            validate_response (bool): Включение валлидации pydantic
+            lazy_response (bool): Вернуть LazyModelView с валидацией полей при обращении
+            **kwargs: Дополнительные параметры для HTTP запроса
+
+        Returns:
+            Response | UserEnvelope: HTTP ответ от сервера с результатом активации | UserEnvelope
+        """
+        headers = {
+            'accept': 'text/plain'
+        }
+        response = await self.put(
+            path=f'{self._v1_account}/{token}',
+            headers=headers,
+            **kwargs
+        )
+        if validate_response:
+            return validate_envelope(UserEnvelope, response.content, lazy=lazy_response)
+
+        return response
+
+    @async_step("Сброс пароля пользователя")
+    async def post_v1_account_password(
+            self,
+            login_data: ResetPassword,
+            validate_response: bool = True,
+            lazy_response: bool = False,
+            **kwargs: Any
+    ) -> UserEnvelope | LazyModelView | Response:
+        """
+        Сброс пароля пользователя.
+
+        Args:
+            login_data (ResetPassword): Данные для сброса пароля
+            validate_response (bool): Включение валлидации pydantic
+            lazy_response (bool): Вернуть LazyModelView с валидацией полей при обращении
+            **kwargs: Дополнительные параметры для HTTP запроса
+
+        Returns:
+            Response | UserEnvelope: HTTP ответ от сервера с результатом сброса пароля | UserEnvelope
+        """
+        response = await self.post(
+            path=f'{self._v1_account}/password',
+            json=login_data.model_dump(exclude_none=True),
+            **kwargs
+        )
+
+        if validate_response:
+            return validate_envelope(UserEnvelope, response.content, lazy=lazy_response)
+        return response
+
+    @async_step("Изменение пароля пользователя")
+    async def put_v1_account_change_password(
+            self,
+            change_password_data: ChangePassword,
+            validate_response: bool = True,
+            lazy_response: bool = False,
+            **kwargs: Any
+    ) -> UserEnvelope | LazyModelView | Response:
+        """
+        Изменение пароля пользователя.
+
+        Args:
+            change_password_data (ChangePassword): Данные для изменения пароля
+            validate_response (bool): Включение валлидации pydantic
+            lazy_response (bool): Вернуть LazyModelView с валидацией полей при обращении
+            **kwargs: Дополнительные параметры для HTTP запроса
+
+        Returns:
+            Response | UserEnvelope: HTTP ответ от сервера с результатом изменения пароля | UserEnvelope
+        """
+        response = await self.put(
+            path=f'{self._v1_account}/password',
+            json=change_password_data.model_dump(exclude_none=True, by_alias=True),
+            **kwargs
+        )
+
+        if validate_response:
+            return validate_envelope(UserEnvelope, response.content, lazy=lazy_response)
+        return response
+
+    @async_step("Изменение email адреса зарегистрированного пользователя")
+    async def put_v1_account_change_email(
+            self,
+            change_email_data: ChangeEmail,
+            validate_response: bool = True,
+            lazy_response: bool = False,
+            **kwargs: Any
+    ) -> UserEnvelope | LazyModelView | Response:
+        """
+        Изменение email адреса зарегистрированного пользователя.
+
+        Args:
+            change_email_data (ChangeEmail): Новые данные пользователя с обновленным email
+            validate_response (bool): Включение валлидации pydantic
+            lazy_response (bool): Вернуть LazyModelView с валидацией полей при обращении
+            **kwargs: Дополнительные параметры для HTTP запроса
+
+        Returns:
+            Response | UserEnvelope: HTTP ответ от сервера с результатом изменения email | UserEnvelope
+        """
+        response = await self.put(
+            path=f'{self._v1_account}/email',
+            json=change_email_data.model_dump(exclude_none=True),
+            **kwargs
+        )
+
+        if validate_response:
+            return validate_envelope(UserEnvelope, response.content, lazy=lazy_response)
+        return response
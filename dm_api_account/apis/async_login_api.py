@@ -0,0 +1,82 @@
+from typing import Any
+
+from httpx import Response
+
+from dm_api_account.models.LoginCredentials import LoginCredentials
+from dm_api_account.models.UserEnvelope import UserEnvelope
+from rest_client.async_client import AsyncRestClient
+from rest_client.lazy_model import LazyModelView, validate_envelope
+from rest_client.utilites import async_step
+
+
+class AsyncLoginApi(AsyncRestClient):
+    """
+    Асинхронный API клиент для аутентификации пользователей.
+
+    Повторяет методы `LoginApi` поверх `AsyncRestClient`.
+    """
+
+    _v1_login = '/v1/account/login'
+
+    @async_step("Аутентификация пользователя")
+    async def post_v1_account_login(
+            self,
+            login_data: LoginCredentials,
+            validate_response: bool = True,
+            lazy_response: bool = False,
+            **kwargs: Any
+    ) -> UserEnvelope | LazyModelView | Response:
+        """
+        Аутентификация пользователя по учетным данным.
+
+        Args:
+            login_data (LoginCredentials): Данные для входа в систему
+            validate_response (bool): Включение валлидации pydantic
+            lazy_response (bool): Вернуть LazyModelView с валидацией полей при обращении
+            **kwargs: Дополнительные параметры для HTTP запроса
+
+        Returns:
+            Response | UserEnvelope: HTTP ответ от сервера с результатом аутентификации | UserEnvelope
+        """
+        response = await self.post(
+            path=self._v1_login,
+            json=login_data.model_dump(exclude_none=True, by_alias=True),
+            **kwargs
+        )
+
+        if validate_response:
+            return validate_envelope(UserEnvelope, response.content, lazy=lazy_response)
+
+        return response
+
+    @async_step("Выход пользователя из системы на текущем устройстве")
+    async def delete_v1_account_login(self, **kwargs: Any) -> Response:
+        """
+        Выход пользователя из системы на текущем устройстве.
+
+        Args:
+            **kwargs: Дополнительные параметры для HTTP запроса
+
+        Returns:
+            Response: HTTP ответ от сервера с результатом выхода
+        """
+        return await self.delete(
+            path=f'{self._v1_login}',
+            **kwargs
+        )
+
+    @async_step("Выход пользователя из системы на всех устройствах")
+    async def delete_v1_account_login_all(self, **kwargs: Any) -> Response:
+        """
+        Выход пользователя из системы на всех устройствах.
+
+        Args:
+            **kwargs: Дополнительные параметры для HTTP запроса
+
+        Returns:
+            Response: HTTP ответ от сервера с результатом выхода
+        """
+        return await self.delete(
+            path=f'{self._v1_login}/all',
+            **kwargs
+        )
@@ -1,11 +1,12 @@
 from typing import Any
 
-import allure
 from requests.models import Response
 
 from dm_api_account.models.LoginCredentials import LoginCredentials
 from dm_api_account.models.UserEnvelope import UserEnvelope
 from rest_client.client import RestClient
+from rest_client.lazy_model import LazyModelView, validate_envelope
+from rest_client.utilites import step
 
 
 class LoginApi(RestClient):
@@ -18,14 +19,21 @@ class LoginApi(RestClient):
 
     _v1_login = '/v1/account/login'
 
-    @allure.step("Аутентификация пользователя")
-    def post_v1_account_login(self, login_data: LoginCredentials, validate_response: bool = True,
-                              **kwargs: Any) -> UserEnvelope | Response:
+    @step("Аутентификация пользователя")
+    def post_v1_account_login(
+            self,
+            login_data: LoginCredentials,
+            validate_response: bool = True,
+            lazy_response: bool = False,
+            **kwargs: Any
+    ) -> UserEnvelope | LazyModelView | Response:
         """
         Аутентификация пользователя по учетным данным.
         
         Args:
             login_data (LoginCredentials): Данные для входа в систему
+            validate_response (bool): Включение валлидации pydantic
+            lazy_response (bool): Вернуть LazyModelView с валидацией полей при обращении
             **kwargs: Дополнительные параметры для HTTP запроса
             
         Returns:
@@ -38,11 +46,11 @@ class LoginApi(RestClient):
         )
 
         if validate_response:
-            return UserEnvelope(**response.json())
+            return validate_envelope(UserEnvelope, response.content, lazy=lazy_response)
 
         return response
 
-    @allure.step("Выход пользователя из системы на текущем устройстве")
+    @step("Выход пользователя из системы на текущем устройстве")
     def delete_v1_account_login(self, **kwargs: Any) -> Response:
         """
         Выход пользователя из системы на текущем устройстве.
@@ -65,7 +73,7 @@ class LoginApi(RestClient):
             **kwargs
         )
 
-    @allure.step("Выход пользователя из системы на всех устройствах")
+    @step("Выход пользователя из системы на всех устройствах")
     def delete_v1_account_login_all(self, **kwargs: Any) -> Response:
         """
         Выход пользователя из системы на всех устройствах.
@@ -1,8 +1,7 @@
-import time
-from json import loads, JSONDecodeError
-from typing import Any, Callable, NoReturn
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
-import allure
+from requests.exceptions import HTTPError
 from requests.models import Response
 
 from dm_api_account.models.ChangeEmail import ChangeEmail
@@ -11,6 +10,11 @@ from dm_api_account.models.LoginCredentials import LoginCredentials
 from dm_api_account.models.Registration import Registration
 from dm_api_account.models.ResetPassword import ResetPassword
 from dm_api_account.models.UserEnvelope import UserEnvelope
+from helpers.auth_token_cache import AuthTokenCache
+from helpers.mail_listener import MailListener
+from helpers.mailbox_index import MailboxIndex, MailKind
+from helpers.poller import Poller
+from rest_client.utilites import step
 from services.api_dm_account import ApiDmAccount
 from services.api_mailhog import ApiMailhog
 
@@ -28,42 +32,7 @@ def retry_if_result_none(result: Any) -> bool:
     return result is None
 
 
-def retrier(function: Callable[..., str | NoReturn]) -> Callable[..., str | NoReturn]:
-    """
-    Декоратор для повторного выполнения функции до получения результата.
-    
-    Выполняет функцию до 5 раз с интервалом в 1 секунду, пока не получит
-    не-None результат или не превысит лимит попыток.
-    
-    Args:
-        function (Callable[..., T]): Функция для декорирования
-        
-    Returns:
-        Callable[..., T]: Обернутая функция с логикой повторных попыток
-        
-    Raises:
-        AssertionError: Если превышено количество попыток (5)
-    """
-
-    def wrapper(*args: Any, **kwargs: Any) -> Any:
-        token = None
-        count = 0
-        sleep = 1
-
-        while token is None:
-            print(f"Попытка получения токена номер: {count}")
-            token = function(*args, **kwargs)
-            count += 1
-
-            if token:
-                return token
-
-            if count == 10:
-                raise AssertionError("Превышено количество попыток получения токена")
-            sleep = sleep * (count / 3)
-            time.sleep(sleep)
-
-    return wrapper
+token_poller = Poller(timeout=30.0, error_message="Превышено время ожидания получения токена")
 
 
 class AccountHelper:
@@ -72,13 +41,96 @@ class AccountHelper:
     
     Предоставляет высокоуровневые методы для регистрации, авторизации
     и управления пользователями через API.
+
+    При `search_by_email=True` токены из писем ищутся по адресу получателя
+    через поиск Mailhog, а не перебором последних писем ящика.
+    `mailbox_scan_limit` ограничивает глубину постраничного обхода ящика
+    при поиске токена по логину.
+    `auth_token_cache` позволяет `auth_user` повторно использовать
+    действующий токен вместо нового входа в систему. Если сервис отклоняет
+    токен из кэша (401), выполняется повторный вход и запрос один раз
+    повторяется с новым токеном.
+    `mail_listener` позволяет получать токены из писем по мере их прихода
+    через WebSocket Mailhog; обход и поиск по ящику остаются запасным
+    вариантом, если слушатель не подключен или письмо не пришло вовремя.
+    При `delete_consumed_mail=True` письмо удаляется из Mailhog после
+    использования его токена, чтобы размер ящика не рос.
+    `mailbox_index` хранит токены из уже прочитанных писем; помощники,
+    работающие с одним ящиком, могут использовать общий индекс. По
+    умолчанию берется индекс слушателя или создается новый.
     """
 
-    def __init__(self, api_dm_account: ApiDmAccount, api_mailhog: ApiMailhog):
+    def __init__(
+            self,
+            api_dm_account: ApiDmAccount,
+            api_mailhog: ApiMailhog,
+            search_by_email: bool = False,
+            mailbox_scan_limit: int = 500,
+            auth_token_cache: AuthTokenCache | None = None,
+            mail_listener: MailListener | None = None,
+            delete_consumed_mail: bool = False,
+            mailbox_index: MailboxIndex | None = None
+    ):
+        if mailbox_index is None:
+            mailbox_index = MailboxIndex() if mail_listener is None else mail_listener.mailbox_index
         self.dm_account = api_dm_account
         self.mailhog = api_mailhog
+        self.mailbox_index = mailbox_index
+        self.search_by_email = search_by_email
+        self.mailbox_scan_limit = mailbox_scan_limit
+        self.auth_token_cache = auth_token_cache
+        self.mail_listener = mail_listener
+        self.delete_consumed_mail = delete_consumed_mail
+        self._cached_credentials: tuple[str, str, bool, str] | None = None
+        if auth_token_cache is not None:
+            for api in (self.dm_account.account_api, self.dm_account.login_api):
+                api.response_hooks.append(self._handle_rejected_token)
+
+    def _handle_rejected_token(self, response: Response, **kwargs: Any) -> Response | None:
+        """
+        Обработка ответа 401 на запрос с токеном аутентификации.
 
-    @allure.step("Регистрация нового пользователя с последующей активацией")
+        Отклоненный токен удаляется из кэша. Если это токен, который
+        `auth_user` взял из кэша, выполняется повторный вход, а запрос
+        один раз отправляется заново с новым токеном.
+
+        Args:
+            response (Response): HTTP ответ
+            **kwargs: Параметры отправки запроса requests
+
+        Returns:
+            Response | None: Ответ на повторный запрос или None, если ответ не заменяется
+        """
+        if response.status_code != 401:
+            return None
+        token = response.request.headers.get('x-dm-auth-token')
+        if not token:
+            return None
+        self.auth_token_cache.invalidate_token(token)
+
+        credentials = self._cached_credentials
+        if credentials is None or credentials[3] != token:
+            return None
+        self._cached_credentials = None
+
+        login, password, remember_me, _ = credentials
+        new_token = self._login_and_cache(login=login, password=password, remember_me=remember_me)
+
+        request = response.request.copy()
+        request.headers['x-dm-auth-token'] = new_token
+        response.close()
+        return response.connection.send(request, **kwargs)
+
+    def _set_auth_token(self, token: str) -> None:
+        headers = {"x-dm-auth-token": token}
+        self.dm_account.account_api.set_headers(headers)
+        self.dm_account.login_api.set_headers(headers)
+
+    def _current_auth_token(self, token: str | None, **kwargs: Any) -> str | None:
+        return token or (kwargs.get('headers') or {}).get('x-dm-auth-token') \
+            or self.dm_account.login_api.headers.get('x-dm-auth-token')
+
+    @step("Регистрация нового пользователя с последующей активацией")
     def register_new_user(
             self,
             login: str,
@@ -114,20 +166,76 @@ class AccountHelper:
 
         self.dm_account.account_api.post_v1_account(reg_data=reg_data)
 
-        token = self.get_activation_token_by_login(login=login)
+        if self.search_by_email:
+            token = self.get_activation_token_by_email(email=email)
+        else:
+            token = self.get_activation_token_by_login(login=login)
         assert token is not None, f'Токен для пользователя {login}, не был получен'
 
         response = self.dm_account.account_api.put_v1_account_token(
             token=token,
             validate_response=validate_response
         )
+        self._delete_consumed_mail(kind=MailKind.ACTIVATION, login=login, email=email)
 
         if validate_response:
             return response
 
         return response
 
-    @allure.step("Авторизация пользователя в системе")
+    @step("Пакетная регистрация пользователей с последующей активацией")
+    def register_users(
+            self,
+            batch: list[Registration],
+            validate_response: bool = True,
+            max_workers: int = 16
+    ) -> list[Response | UserEnvelope]:
+        """
+        Пакетная регистрация пользователей с последующей активацией.
+
+        Этапы выполняются конвейером: сначала параллельно отправляются все
+        запросы регистрации, затем токены активации всех пользователей
+        собираются за один проход по почтовому ящику, после чего аккаунты
+        параллельно активируются.
+
+        Args:
+            batch (list[Registration]): Данные для регистрации пользователей
+            validate_response (bool): Отключение валлидации pydantic
+            max_workers (int): Количество параллельных запросов
+
+        Returns:
+            list[Response | UserEnvelope]: Ответы активации в порядке `batch`
+
+        Raises:
+            AssertionError: Если токены активации не были получены
+        """
+        if not batch:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batch))) as executor:
+            list(executor.map(lambda reg_data: self.dm_account.account_api.post_v1_account(reg_data=reg_data), batch))
+
+            tokens = self.get_activation_tokens_by_logins(logins=[reg_data.login for reg_data in batch])
+
+            responses = list(
+                executor.map(
+                    lambda reg_data: self.dm_account.account_api.put_v1_account_token(
+                        token=tokens[reg_data.login],
+                        validate_response=validate_response
+                    ),
+                    batch
+                )
+            )
+            if self.delete_consumed_mail:
+                list(
+                    executor.map(
+                        lambda reg_data: self._delete_consumed_mail(kind=MailKind.ACTIVATION, login=reg_data.login),
+                        batch
+                    )
+                )
+            return responses
+
+    @step("Авторизация пользователя в системе")
     def user_login(
             self,
             login: str,
@@ -173,13 +281,15 @@ class AccountHelper:
 
         return response
 
-    @allure.step("Авторизация клиента и установка токена аутентификации в заголовки")
+    @step("Авторизация клиента и установка токена аутентификации в заголовки")
     def auth_user(self, login: str, password: str, remember_me: bool = True, validate_response=False) -> None:
         """
         Авторизация клиента и установка токена аутентификации в заголовки.
         
         Выполняет вход в систему и устанавливает полученный токен
-        в заголовки для последующих запросов.
+        в заголовки для последующих запросов. Если задан `auth_token_cache`
+        и в нем есть токен пользователя, вход не выполняется; если сервис
+        отклонит этот токен, вход выполнится при первом ответе 401.
         
         Args:
             login (str): Логин пользователя
@@ -190,7 +300,22 @@ class AccountHelper:
         Raises:
             AssertionError: Если пользователь не смог авторизоваться
         """
+        self._cached_credentials = None
+        if self.auth_token_cache is not None:
+            token = self.auth_token_cache.get(host=self.dm_account.configuration.host, login=login)
+            if token is not None:
+                self._set_auth_token(token)
+                self._cached_credentials = (login, password, remember_me, token)
+                return
+
+        self._login_and_cache(
+            login=login,
+            password=password,
+            remember_me=remember_me,
+            validate_response=validate_response
+        )
 
+    def _login_and_cache(self, login: str, password: str, remember_me: bool, validate_response=False) -> str:
         response = self.user_login(
             login=login,
             password=password,
@@ -198,13 +323,15 @@ class AccountHelper:
             validate_response=validate_response
         )
 
-        token = {"x-dm-auth-token": response.headers["x-dm-auth-token"]}
+        token = response.headers["x-dm-auth-token"]
+        self._set_auth_token(token)
 
-        self.dm_account.account_api.set_headers(token)
-        self.dm_account.login_api.set_headers(token)
+        if self.auth_token_cache is not None:
+            self.auth_token_cache.put(host=self.dm_account.configuration.host, login=login, token=token)
+        return token
 
-    @retrier
-    @allure.step("Получение токена активации для пользователя по логину")
+    @token_poller
+    @step("Получение токена активации для пользователя по логину")
     def get_activation_token_by_login(self, login: str) -> str:
         """
         Получение токена активации для пользователя по логину.
@@ -221,23 +348,10 @@ class AccountHelper:
         Raises:
             AssertionError: Если письма не были получены
         """
-        token = None
-        response = self.mailhog.mailhog_api.get_api_v2_messages()
-
-        for item in response.json()['items']:
-            try:
-                user_data = loads(item['Content']['Body'])
-            except JSONDecodeError:
-                continue
-            user_login = user_data.get('Login')
-            if user_login == login:
-                token = user_data['ConfirmationLinkUrl'].split('/')[-1]
-                break
-
-        return token
+        return self._get_token_from_mailbox(login=login, kind=MailKind.ACTIVATION)
 
-    @retrier
-    @allure.step("Получение токена сброса пароля для пользователя по логину")
+    @token_poller
+    @step("Получение токена сброса пароля для пользователя по логину")
     def get_reset_password_token_by_login(self, login: str) -> str:
         """
         Получение токена сброса пароля для пользователя по логину.
@@ -255,22 +369,179 @@ class AccountHelper:
         Raises:
             AssertionError: Если письма не были получены
         """
-        token = None
-        response = self.mailhog.mailhog_api.get_api_v2_messages()
-        for item in response.json()['items']:
-            try:
-                user_data = loads(item['Content']['Body'])
-            except JSONDecodeError:
-                continue
-            user_login = user_data.get('Login')
-            if user_login == login:
-                if 'ConfirmationLinkUri' in user_data:
-                    token = user_data['ConfirmationLinkUri'].split('/')[-1]
+        return self._get_token_from_mailbox(login=login, kind=MailKind.RESET_PASSWORD)
+
+    @token_poller
+    @step("Получение токенов активации для группы пользователей")
+    def get_activation_tokens_by_logins(self, logins: list[str]) -> dict[str, str]:
+        """
+        Получение токенов активации для группы пользователей за один проход.
+
+        Почтовый ящик обходится от новых писем к старым, пока не найдены
+        письма всех пользователей группы; глубина обхода увеличивается
+        на размер группы. Письма, просмотренные предыдущим полным обходом
+        (`MailboxScan`), повторно не запрашиваются.
+
+        Args:
+            logins (list[str]): Логины пользователей
+
+        Returns:
+            dict[str, str]: Токены активации по логину
+
+        Raises:
+            AssertionError: Если письма не были получены
+        """
+        index = self.mailbox_index
+        pending = {login for login in logins if index.get_token(login=login, kind=MailKind.ACTIVATION) is None}
+        max_messages = self.mailbox_scan_limit + len(pending)
+        scan = index.scan()
+        if pending:
+            for item in self.mailhog.mailhog_api.iter_api_v2_messages(max_messages=max_messages):
+                if scan.reached_frontier(item):
                     break
+                login = index.ingest_message(item)
+                if login in pending and index.get_token(login=login, kind=MailKind.ACTIVATION):
+                    pending.discard(login)
+                    if not pending:
+                        scan.interrupt()
+                        break
+            scan.finish()
+
+        if pending:
+            return {}
+        return {login: index.get_token(login=login, kind=MailKind.ACTIVATION) for login in logins}
+
+    def _get_token_from_mailbox(self, login: str, kind: MailKind) -> str | None:
+        """
+        Получение токена из общего индекса почтового ящика.
 
-        return token
+        Если подключен `mail_listener`, сначала ожидается письмо от него.
+        Иначе письма Mailhog обходятся постранично от новых к старым и
+        добавляются в индекс. Обход прекращается на первом письме
+        пользователя, для которого в индексе уже есть токен нужного типа:
+        все более новые письма к этому моменту уже просмотрены. Обход также
+        прекращается на границе предыдущего полного обхода (`MailboxScan`),
+        поэтому повторный опрос до прихода письма запрашивает одну страницу.
+
+        Args:
+            login (str): Логин пользователя для поиска токена
+            kind (MailKind): Тип письма с токеном
+
+        Returns:
+            str | None: Токен или None, если письмо еще не пришло
+        """
+        token = self._wait_for_mail(kind=kind, login=login)
+        if token is not None:
+            return token
+
+        index = self.mailbox_index
+        scan = index.scan()
+        for item in self.mailhog.mailhog_api.iter_api_v2_messages(max_messages=self.mailbox_scan_limit):
+            if scan.reached_frontier(item):
+                break
+            if index.ingest_message(item) == login and index.get_token(login=login, kind=kind):
+                scan.interrupt()
+                break
+        scan.finish()
+
+        return index.get_token(login=login, kind=kind)
+
+    @token_poller
+    @step("Получение токена активации для пользователя по email")
+    def get_activation_token_by_email(self, email: str) -> str:
+        """
+        Получение токена активации для пользователя по email.
+
+        Ищет письмо с токеном активации через поиск Mailhog по получателю,
+        поэтому объем ответа не зависит от размера почтового ящика.
+
+        Args:
+            email (str): Email адрес пользователя для поиска токена
+
+        Returns:
+            str: Токен активации пользователя
+
+        Raises:
+            AssertionError: Если письма не были получены
+        """
+        return self._search_token_by_email(email=email, kind=MailKind.ACTIVATION)
+
+    @token_poller
+    @step("Получение токена сброса пароля для пользователя по email")
+    def get_reset_password_token_by_email(self, email: str) -> str:
+        """
+        Получение токена сброса пароля для пользователя по email.
+
+        Ищет письмо с токеном сброса пароля через поиск Mailhog по получателю.
+
+        Args:
+            email (str): Email адрес пользователя для поиска токена
+
+        Returns:
+            str: Токен сброса пароля пользователя
+
+        Raises:
+            AssertionError: Если письма не были получены
+        """
+        return self._search_token_by_email(email=email, kind=MailKind.RESET_PASSWORD)
+
+    def _search_token_by_email(self, email: str, kind: MailKind) -> str | None:
+        """
+        Получение токена по адресу получателя через поиск Mailhog.
+
+        Если подключен `mail_listener`, сначала ожидается письмо от него.
+
+        Args:
+            email (str): Email адрес получателя письма
+            kind (MailKind): Тип письма с токеном
 
-    @allure.step("Смена пароля пользователя")
+        Returns:
+            str | None: Токен или None, если письмо еще не пришло
+        """
+        token = self._wait_for_mail(kind=kind, email=email)
+        if token is not None:
+            return token
+
+        response = self.mailhog.mailhog_api.get_api_v2_search(query=email, kind='to')
+        self.mailbox_index.ingest(response.json()['items'])
+
+        return self.mailbox_index.get_token_by_email(email=email, kind=kind)
+
+    def _delete_consumed_mail(self, kind: MailKind, login: str, email: str | None = None) -> None:
+        """
+        Удаление письма, токен из которого уже использован.
+
+        Письмо ищется в индексе тем же способом, что и токен: по адресу
+        получателя при `search_by_email`, иначе по логину. Письмо, которое
+        уже удалено (ответ 404), пропускается.
+
+        Args:
+            kind (MailKind): Тип письма
+            login (str): Логин пользователя
+            email (str | None): Email адрес пользователя
+        """
+        if not self.delete_consumed_mail:
+            return
+
+        index = self.mailbox_index
+        if self.search_by_email and email is not None:
+            message_id = index.get_message_id_by_email(email=email, kind=kind)
+        else:
+            message_id = index.get_message_id(login=login, kind=kind)
+        if message_id is None:
+            return
+        try:
+            self.mailhog.mailhog_api.delete_api_v1_message(message_id=message_id)
+        except HTTPError as error:
+            if error.response is None or error.response.status_code != 404:
+                raise
+
+    def _wait_for_mail(self, kind: MailKind, login: str | None = None, email: str | None = None) -> str | None:
+        if self.mail_listener is None or not self.mail_listener.connected:
+            return None
+        return self.mail_listener.wait_token(kind=kind, login=login, email=email)
+
+    @step("Смена пароля пользователя")
     def change_password(
             self,
             login: str,
@@ -312,7 +583,10 @@ class AccountHelper:
             validate_response=validate_response
         )
 
-        reset_token = self.get_reset_password_token_by_login(login=login)
+        if self.search_by_email:
+            reset_token = self.get_reset_password_token_by_email(email=email)
+        else:
+            reset_token = self.get_reset_password_token_by_login(login=login)
         assert reset_token is not None, f'Токен для сброса пароля пользователя {login} не был получен'
 
         change_password_data = ChangePassword(
@@ -326,6 +600,9 @@ class AccountHelper:
             change_password_data=change_password_data,
             validate_response=validate_response
         )
+        self._delete_consumed_mail(kind=MailKind.RESET_PASSWORD, login=login, email=email)
+        if self.auth_token_cache is not None:
+            self.auth_token_cache.invalidate(host=self.dm_account.configuration.host, login=login)
 
         if validate_response:
             return response
@@ -333,7 +610,7 @@ class AccountHelper:
         assert response.status_code == 200, 'Не удалось изменить пароль'
         return response
 
-    @allure.step("Смена почты пользователя")
+    @step("Смена почты пользователя")
     def change_email(
             self,
             login: str,
@@ -352,13 +629,15 @@ class AccountHelper:
             change_email_data=change_email_data,
             validate_response=validate_response
         )
+        if self.auth_token_cache is not None:
+            self.auth_token_cache.invalidate(host=self.dm_account.configuration.host, login=login)
 
         if validate_response:
             return response
 
         return response
 
-    @allure.step("Выход пользователя из системы на текущем устройстве")
+    @step("Выход пользователя из системы на текущем устройстве")
     def logout_user(self, token: str | None = None, **kwargs: Any) -> Response:
         """
         Выход пользователя из системы на текущем устройстве.
@@ -380,6 +659,12 @@ class AccountHelper:
             передачи токена через аргумент `token` или `headers`.
         """
 
+        if self.auth_token_cache is not None:
+            self._cached_credentials = None
+            current_token = self._current_auth_token(token, **kwargs)
+            if current_token:
+                self.auth_token_cache.invalidate_token(current_token)
+
         if token:
             kwargs['headers'] = {**kwargs.get('headers'), 'x-dm-auth-token': token}
 
@@ -387,7 +672,7 @@ class AccountHelper:
 
         return response
 
-    @allure.step("Выход пользователя из системы на всех устройствах")
+    @step("Выход пользователя из системы на всех устройствах")
     def logout_user_all_device(self, token: str | None = None, **kwargs: Any) -> Response:
         """
         Выход пользователя из системы на всех устройствах.
@@ -409,6 +694,12 @@ class AccountHelper:
             Требует предварительной авторизации пользователя или явной
             передачи токена через аргумент `token` или `headers`.
         """
+        if self.auth_token_cache is not None:
+            self._cached_credentials = None
+            current_token = self._current_auth_token(token, **kwargs)
+            if current_token:
+                self.auth_token_cache.invalidate_token(current_token)
+
         if token:
             kwargs['headers'] = {**kwargs.get('headers'), 'x-dm-auth-token': token}
 
@@ -416,7 +707,7 @@ class AccountHelper:
 
         return response
 
-    @allure.step("Активация зарегистрированного пользователя по токену")
+    @step("Активация зарегистрированного пользователя по токену")
     def activate_user(self, token: str, validate_response: bool = True, ) -> Response | UserEnvelope:
         """
         Активация зарегистрированного пользователя по токену.
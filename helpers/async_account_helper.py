@@ -0,0 +1,469 @@
+import asyncio
+from typing import Any
+
+from httpx import Response
+
+from dm_api_account.models.ChangeEmail import ChangeEmail
+from dm_api_account.models.ChangePassword import ChangePassword
+from dm_api_account.models.LoginCredentials import LoginCredentials
+from dm_api_account.models.Registration import Registration
+from dm_api_account.models.ResetPassword import ResetPassword
+from dm_api_account.models.UserEnvelope import UserEnvelope
+from helpers.account_helper import token_poller
+from helpers.mailbox_index import MailboxIndex, MailKind
+from rest_client.utilites import async_step
+from services.async_api_dm_account import AsyncApiDmAccount
+from services.async_api_mailhog import AsyncApiMailhog
+
+
+class AsyncAccountHelper:
+    """
+    Асинхронный вспомогательный класс для работы с аккаунтами пользователей.
+
+    Повторяет сценарии `AccountHelper` поверх асинхронных клиентов, поэтому
+    регистрацию и авторизацию большого числа пользователей можно выполнять
+    параллельно через `asyncio.gather`.
+    """
+
+    def __init__(
+            self,
+            api_dm_account: AsyncApiDmAccount,
+            api_mailhog: AsyncApiMailhog,
+            search_by_email: bool = False,
+            mailbox_scan_limit: int = 500,
+            mailbox_index: MailboxIndex | None = None
+    ):
+        self.dm_account = api_dm_account
+        self.mailhog = api_mailhog
+        self.search_by_email = search_by_email
+        self.mailbox_scan_limit = mailbox_scan_limit
+        self.mailbox_index = MailboxIndex() if mailbox_index is None else mailbox_index
+
+    @async_step("Регистрация нового пользователя с последующей активацией")
+    async def register_new_user(
+            self,
+            login: str,
+            password: str,
+            email: str,
+            validate_response=True
+    ) -> Response | UserEnvelope:
+        """
+        Регистрация нового пользователя с последующей активацией.
+
+        Args:
+            login (str): Логин пользователя
+            password (str): Пароль пользователя
+            email (str): Email адрес пользователя
+            validate_response (bool): Отключение валлидации pydantic
+
+        Returns:
+            Response | UserEnvelope: HTTP ответ от сервера после активации пользователя
+
+        Raises:
+            AssertionError: Если токен активации не был получен
+        """
+        reg_data = Registration(
+            login=login,
+            password=password,
+            email=email
+        )
+
+        await self.dm_account.account_api.post_v1_account(reg_data=reg_data)
+
+        if self.search_by_email:
+            token = await self.get_activation_token_by_email(email=email)
+        else:
+            token = await self.get_activation_token_by_login(login=login)
+        assert token is not None, f'Токен для пользователя {login}, не был получен'
+
+        return await self.dm_account.account_api.put_v1_account_token(
+            token=token,
+            validate_response=validate_response
+        )
+
+    @async_step("Пакетная регистрация пользователей с последующей активацией")
+    async def register_users(
+            self,
+            batch: list[Registration],
+            validate_response: bool = True
+    ) -> list[Response | UserEnvelope]:
+        """
+        Пакетная регистрация пользователей с последующей активацией.
+
+        Регистрация и активация выполняются параллельно, токены активации
+        собираются за один проход по почтовому ящику.
+
+        Args:
+            batch (list[Registration]): Данные для регистрации пользователей
+            validate_response (bool): Отключение валлидации pydantic
+
+        Returns:
+            list[Response | UserEnvelope]: Ответы активации в порядке `batch`
+
+        Raises:
+            AssertionError: Если токены активации не были получены
+        """
+        if not batch:
+            return []
+
+        await asyncio.gather(*(self.dm_account.account_api.post_v1_account(reg_data=reg_data) for reg_data in batch))
+
+        tokens = await self.get_activation_tokens_by_logins(logins=[reg_data.login for reg_data in batch])
+
+        return list(
+            await asyncio.gather(
+                *(
+                    self.dm_account.account_api.put_v1_account_token(
+                        token=tokens[reg_data.login],
+                        validate_response=validate_response
+                    )
+                    for reg_data in batch
+                )
+            )
+        )
+
+    @async_step("Авторизация пользователя в системе")
+    async def user_login(
+            self,
+            login: str,
+            password: str,
+            remember_me: bool = True,
+            validate_response=False,
+            validate_headers=False,
+    ) -> Response | UserEnvelope:
+        """
+        Авторизация пользователя в системе.
+
+        Args:
+            login (str): Логин пользователя
+            password (str): Пароль пользователя
+            remember_me (bool, optional): Флаг "запомнить меня". По умолчанию True
+            validate_response (bool): Отключение валлидации pydantic
+            validate_headers (bool): Отключение валлидации headers
+
+        Returns:
+            Response | UserEnvelope: HTTP ответ от сервера с результатом авторизации
+        """
+        login_data = LoginCredentials(
+            login=login,
+            password=password,
+            rememberMe=remember_me
+        )
+
+        response = await self.dm_account.login_api.post_v1_account_login(
+            login_data=login_data,
+            validate_response=validate_response
+        )
+
+        if validate_headers and not validate_response:
+            assert response.headers["x-dm-auth-token"], "Токен для пользователя не был получен"
+
+        return response
+
+    @async_step("Авторизация клиента и установка токена аутентификации в заголовки")
+    async def auth_user(self, login: str, password: str, remember_me: bool = True) -> None:
+        """
+        Авторизация клиента и установка токена аутентификации в заголовки.
+
+        Args:
+            login (str): Логин пользователя
+            password (str): Пароль пользователя
+            remember_me (bool, optional): Флаг "запомнить меня". По умолчанию True
+        """
+        response = await self.user_login(
+            login=login,
+            password=password,
+            remember_me=remember_me
+        )
+
+        token = {"x-dm-auth-token": response.headers["x-dm-auth-token"]}
+
+        self.dm_account.account_api.set_headers(token)
+        self.dm_account.login_api.set_headers(token)
+
+    @token_poller
+    @async_step("Получение токена активации для пользователя по логину")
+    async def get_activation_token_by_login(self, login: str) -> str:
+        """
+        Получение токена активации для пользователя по логину.
+
+        Args:
+            login (str): Логин пользователя для поиска токена
+
+        Returns:
+            str: Токен активации пользователя
+
+        Raises:
+            AssertionError: Если письма не были получены
+        """
+        return await self._get_token_from_mailbox(login=login, kind=MailKind.ACTIVATION)
+
+    @token_poller
+    @async_step("Получение токена сброса пароля для пользователя по логину")
+    async def get_reset_password_token_by_login(self, login: str) -> str:
+        """
+        Получение токена сброса пароля для пользователя по логину.
+
+        Args:
+            login (str): Логин пользователя для поиска токена
+
+        Returns:
+            str: Токен сброса пароля пользователя
+
+        Raises:
+            AssertionError: Если письма не были получены
+        """
+        return await self._get_token_from_mailbox(login=login, kind=MailKind.RESET_PASSWORD)
+
+    @token_poller
+    @async_step("Получение токена активации для пользователя по email")
+    async def get_activation_token_by_email(self, email: str) -> str:
+        """
+        Получение токена активации для пользователя по email.
+
+        Args:
+            email (str): Email адрес пользователя для поиска токена
+
+        Returns:
+            str: Токен активации пользователя
+
+        Raises:
+            AssertionError: Если письма не были получены
+        """
+        return await self._search_token_by_email(email=email, kind=MailKind.ACTIVATION)
+
+    @token_poller
+    @async_step("Получение токена сброса пароля для пользователя по email")
+    async def get_reset_password_token_by_email(self, email: str) -> str:
+        """
+        Получение токена сброса пароля для пользователя по email.
+
+        Args:
+            email (str): Email адрес пользователя для поиска токена
+
+        Returns:
+            str: Токен сброса пароля пользователя
+
+        Raises:
+            AssertionError: Если письма не были получены
+        """
+        return await self._search_token_by_email(email=email, kind=MailKind.RESET_PASSWORD)
+
+    @token_poller
+    @async_step("Получение токенов активации для группы пользователей")
+    async def get_activation_tokens_by_logins(self, logins: list[str]) -> dict[str, str]:
+        """
+        Получение токенов активации для группы пользователей за один проход.
+
+        Args:
+            logins (list[str]): Логины пользователей
+
+        Returns:
+            dict[str, str]: Токены активации по логину
+
+        Raises:
+            AssertionError: Если письма не были получены
+        """
+        index = self.mailbox_index
+        pending = {login for login in logins if index.get_token(login=login, kind=MailKind.ACTIVATION) is None}
+        max_messages = self.mailbox_scan_limit + len(pending)
+        scan = index.scan()
+        if pending:
+            async for item in self.mailhog.mailhog_api.iter_api_v2_messages(max_messages=max_messages):
+                if scan.reached_frontier(item):
+                    break
+                login = index.ingest_message(item)
+                if login in pending and index.get_token(login=login, kind=MailKind.ACTIVATION):
+                    pending.discard(login)
+                    if not pending:
+                        scan.interrupt()
+                        break
+            scan.finish()
+
+        if pending:
+            return {}
+        return {login: index.get_token(login=login, kind=MailKind.ACTIVATION) for login in logins}
+
+    async def _get_token_from_mailbox(self, login: str, kind: MailKind) -> str | None:
+        """
+        Получение токена из общего индекса почтового ящика.
+
+        Args:
+            login (str): Логин пользователя для поиска токена
+            kind (MailKind): Тип письма с токеном
+
+        Returns:
+            str | None: Токен или None, если письмо еще не пришло
+        """
+        index = self.mailbox_index
+        scan = index.scan()
+        async for item in self.mailhog.mailhog_api.iter_api_v2_messages(max_messages=self.mailbox_scan_limit):
+            if scan.reached_frontier(item):
+                break
+            if index.ingest_message(item) == login and index.get_token(login=login, kind=kind):
+                scan.interrupt()
+                break
+        scan.finish()
+
+        return index.get_token(login=login, kind=kind)
+
+    async def _search_token_by_email(self, email: str, kind: MailKind) -> str | None:
+        """
+        Получение токена по адресу получателя через поиск Mailhog.
+
+        Args:
+            email (str): Email адрес получателя письма
+            kind (MailKind): Тип письма с токеном
+
+        Returns:
+            str | None: Токен или None, если письмо еще не пришло
+        """
+        response = await self.mailhog.mailhog_api.get_api_v2_search(query=email, kind='to')
+        self.mailbox_index.ingest(response.json()['items'])
+
+        return self.mailbox_index.get_token_by_email(email=email, kind=kind)
+
+    @async_step("Смена пароля пользователя")
+    async def change_password(
+            self,
+            login: str,
+            email: str,
+            old_password: str,
+            new_password: str,
+            validate_response: bool = True
+    ) -> Response | UserEnvelope:
+        """
+        Смена пароля пользователя с использованием токена сброса пароля.
+
+        Args:
+            login (str): Логин пользователя
+            email (str): Email адрес пользователя
+            old_password (str): Текущий пароль пользователя
+            new_password (str): Новый пароль пользователя
+            validate_response (bool): Включение валлидации pydantic
+
+        Returns:
+            Response | UserEnvelope: HTTP ответ от сервера с результатом смены пароля
+
+        Raises:
+            AssertionError: Если токен сброса пароля не получен или смена пароля не удалась
+        """
+        login_data = ResetPassword(
+            login=login,
+            email=email
+        )
+
+        await self.dm_account.account_api.post_v1_account_password(
+            login_data=login_data,
+            validate_response=validate_response
+        )
+
+        if self.search_by_email:
+            reset_token = await self.get_reset_password_token_by_email(email=email)
+        else:
+            reset_token = await self.get_reset_password_token_by_login(login=login)
+        assert reset_token is not None, f'Токен для сброса пароля пользователя {login} не был получен'
+
+        change_password_data = ChangePassword(
+            login=login,
+            token=reset_token,
+            oldPassword=old_password,
+            newPassword=new_password
+        )
+
+        response = await self.dm_account.account_api.put_v1_account_change_password(
+            change_password_data=change_password_data,
+            validate_response=validate_response
+        )
+
+        if not validate_response:
+            assert response.status_code == 200, 'Не удалось изменить пароль'
+        return response
+
+    @async_step("Смена почты пользователя")
+    async def change_email(
+            self,
+            login: str,
+            password: str,
+            new_email: str,
+            validate_response: bool = True
+    ) -> Response | UserEnvelope:
+        """
+        Смена почты пользователя.
+
+        Args:
+            login (str): Логин пользователя
+            password (str): Пароль пользователя
+            new_email (str): Новый email адрес пользователя
+            validate_response (bool): Включение валлидации pydantic
+
+        Returns:
+            Response | UserEnvelope: HTTP ответ от сервера с результатом смены почты
+        """
+        change_email_data = ChangeEmail(
+            login=login,
+            password=password,
+            email=new_email
+        )
+
+        return await self.dm_account.account_api.put_v1_account_change_email(
+            change_email_data=change_email_data,
+            validate_response=validate_response
+        )
+
+    @async_step("Выход пользователя из системы на текущем устройстве")
+    async def logout_user(self, token: str | None = None, **kwargs: Any) -> Response:
+        """
+        Выход пользователя из системы на текущем устройстве.
+
+        Args:
+            token (str | None): Опциональный токен `x-dm-auth-token` для разлогина
+                конкретной сессии.
+            **kwargs: Дополнительные параметры для HTTP запроса
+
+        Returns:
+            Response: HTTP ответ от сервера с результатом выхода
+        """
+        if token:
+            kwargs['headers'] = {**kwargs.get('headers', {}), 'x-dm-auth-token': token}
+
+        return await self.dm_account.login_api.delete_v1_account_login(**kwargs)
+
+    @async_step("Выход пользователя из системы на всех устройствах")
+    async def logout_user_all_device(self, token: str | None = None, **kwargs: Any) -> Response:
+        """
+        Выход пользователя из системы на всех устройствах.
+
+        Args:
+            token (str | None): Опциональный токен `x-dm-auth-token` для разлогина
+                конкретной сессии.
+            **kwargs: Дополнительные параметры для HTTP запроса
+
+        Returns:
+            Response: HTTP ответ от сервера с результатом выхода
+        """
+        if token:
+            kwargs['headers'] = {**kwargs.get('headers', {}), 'x-dm-auth-token': token}
+
+        return await self.dm_account.login_api.delete_v1_account_login_all(**kwargs)
+
+    @async_step("Активация зарегистрированного пользователя по токену")
+    async def activate_user(self, token: str, validate_response: bool = True) -> Response | UserEnvelope:
+        """
+        Активация зарегистрированного пользователя по токену.
+
+        Args:
+            token (str): Токен активации, полученный при регистрации
+            validate_response (bool): Включение валлидации pydantic
+
+        Returns:
+            Response | UserEnvelope: HTTP ответ от сервера с результатом активации
+        """
+        response = await self.dm_account.account_api.put_v1_account_token(
+            token=token,
+            validate_response=validate_response
+        )
+
+        if not validate_response:
+            assert response.status_code == 200, 'Не удалось активировать токен'
+        return response
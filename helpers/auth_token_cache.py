@@ -0,0 +1,159 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from threading import RLock
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class AuthTokenCache:
+    """
+    Кэш токенов `x-dm-auth-token` по паре (хост, логин) с ограниченным временем жизни.
+
+    Без `path` кэш живет в памяти процесса. С `path` записи дополнительно
+    сохраняются в JSON файл под файловой блокировкой, поэтому параллельные
+    воркеры pytest используют токены друг друга. Файл считается основным
+    источником: при изменении файла (по времени изменения и размеру) записи
+    в памяти перечитываются, поэтому токен, удаленный другим воркером,
+    больше не выдается.
+
+    Args:
+        ttl (float): Время жизни токена, сек
+        path (str | Path | None): Путь к файлу кэша
+    """
+
+    def __init__(self, ttl: float = 3600.0, path: str | Path | None = None):
+        self.ttl = ttl
+        self.path = Path(path) if path else None
+        self._lock = RLock()
+        self._entries: dict[str, tuple[str, float]] = {}
+        self._file_version: tuple[int, int] | None = None
+
+    @staticmethod
+    def _key(host: str, login: str) -> str:
+        return f"{host}|{login}"
+
+    def get(self, host: str, login: str) -> str | None:
+        """
+        Получение действующего токена.
+
+        Args:
+            host (str): Базовый URL DM API
+            login (str): Логин пользователя
+
+        Returns:
+            str | None: Токен или None, если его нет или срок жизни истек
+        """
+        key = self._key(host, login)
+        with self._lock:
+            if self.path is not None:
+                self._sync()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            token, expires_at = entry
+            if expires_at <= time.time():
+                self.invalidate(host, login)
+                return None
+            return token
+
+    def put(self, host: str, login: str, token: str) -> None:
+        """
+        Сохранение токена.
+
+        Args:
+            host (str): Базовый URL DM API
+            login (str): Логин пользователя
+            token (str): Токен `x-dm-auth-token`
+        """
+        entry = (token, time.time() + self.ttl)
+        key = self._key(host, login)
+        with self._lock:
+            self._entries[key] = entry
+            if self.path is not None:
+                with self._file(write=True) as entries:
+                    entries[key] = entry
+
+    def invalidate(self, host: str, login: str) -> None:
+        """
+        Удаление токена пользователя.
+
+        Args:
+            host (str): Базовый URL DM API
+            login (str): Логин пользователя
+        """
+        key = self._key(host, login)
+        with self._lock:
+            self._entries.pop(key, None)
+            if self.path is not None:
+                with self._file(write=True) as entries:
+                    entries.pop(key, None)
+
+    def invalidate_token(self, token: str) -> None:
+        """
+        Удаление записи с указанным токеном, например после ответа 401.
+
+        При работе с файлом запись удаляется и из файла, даже если этот
+        процесс ее еще не читал.
+
+        Args:
+            token (str): Отклоненный токен `x-dm-auth-token`
+        """
+        with self._lock:
+            for key, (cached_token, _) in list(self._entries.items()):
+                if cached_token == token:
+                    del self._entries[key]
+            if self.path is not None:
+                with self._file(write=True) as entries:
+                    for key, (cached_token, _) in list(entries.items()):
+                        if cached_token == token:
+                            del entries[key]
+
+    def _sync(self) -> None:
+        """
+        Перечитывание записей из файла, если файл изменился с прошлого чтения.
+        """
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            version = None
+        else:
+            version = (stat.st_mtime_ns, stat.st_size)
+        if version is not None and version == self._file_version:
+            return
+
+        if version is None:
+            self._entries = {}
+        else:
+            with self._file() as entries:
+                self._entries = dict(entries)
+        self._file_version = version
+
+    @contextmanager
+    def _file(self, write: bool = False) -> Iterator[dict[str, tuple[str, float]]]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a+', encoding='utf-8') as file:
+            if fcntl is not None:
+                fcntl.flock(file, fcntl.LOCK_EX if write else fcntl.LOCK_SH)
+            try:
+                file.seek(0)
+                content = file.read()
+                entries = {key: tuple(value) for key, value in json.loads(content).items()} if content else {}
+                yield entries
+                if write:
+                    now = time.time()
+                    alive = {key: value for key, value in entries.items() if value[1] > now}
+                    file.seek(0)
+                    file.truncate()
+                    file.write(json.dumps(alive))
+                    file.flush()
+                    os.fsync(file.fileno())
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(file, fcntl.LOCK_UN)
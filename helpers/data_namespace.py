@@ -0,0 +1,85 @@
+import itertools
+import os
+import uuid
+from threading import Lock
+
+MAX_LOGIN_LENGTH = 100
+
+
+class DataNamespace:
+    """
+    Пространство уникальных логинов и email адресов для одного процесса тестов.
+
+    Каждое имя содержит идентификатор запуска, идентификатор воркера и номер
+    внутри воркера, поэтому параллельные воркеры и повторные запуски
+    не пересекаются ни по логинам, ни по адресам писем. Читаемая часть
+    логина обрезается так, чтобы логин не превышал `MAX_LOGIN_LENGTH`.
+
+    Args:
+        run_id (str | None): Идентификатор запуска, общий для всех воркеров
+        worker_id (str): Идентификатор воркера
+        email_domain (str): Домен email адресов
+    """
+
+    def __init__(self, run_id: str | None = None, worker_id: str = 'w0', email_domain: str = 'mail.ru'):
+        self.run_id = run_id or uuid.uuid4().hex[:8]
+        self.worker_id = worker_id
+        self.email_domain = email_domain
+        self._counter = itertools.count(1)
+        self._lock = Lock()
+
+    @property
+    def prefix(self) -> str:
+        """
+        Общая часть имен пространства.
+        """
+        return f"{self.run_id}{self.worker_id}"
+
+    def login(self, base: str = 'user') -> str:
+        """
+        Генерация уникального логина.
+
+        Args:
+            base (str): Читаемая часть логина, например имя из Faker
+
+        Returns:
+            str: Логин вида `<base>_<run_id><worker_id>n<номер>`
+        """
+        with self._lock:
+            number = next(self._counter)
+        suffix = f"_{self.prefix}n{number}"
+        return f"{base[:MAX_LOGIN_LENGTH - len(suffix)]}{suffix}"
+
+    def email(self, login: str) -> str:
+        """
+        Email адрес для логина из пространства.
+
+        Args:
+            login (str): Логин пользователя
+
+        Returns:
+            str: Email адрес
+        """
+        return f"{login}@{self.email_domain}"
+
+    def owns(self, value: str) -> bool:
+        """
+        Проверка, что логин или email адрес создан в этом пространстве.
+
+        Args:
+            value (str): Логин или email адрес
+
+        Returns:
+            bool: True, если значение принадлежит пространству
+        """
+        return f"_{self.prefix}n" in value
+
+
+def xdist_worker_id() -> str | None:
+    """
+    Идентификатор воркера pytest-xdist, если тесты запущены через него.
+
+    Returns:
+        str | None: Идентификатор вида `gw0` или None
+    """
+    return os.environ.get('PYTEST_XDIST_WORKER')
@@ -0,0 +1,223 @@
+import json
+import sys
+import traceback
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from threading import Event, Lock, Thread
+from typing import Any
+from urllib.parse import urlsplit, urlunsplit
+
+from helpers.mailbox_index import MailboxIndex, MailKind
+from rest_client.websocket import WebSocketClient
+
+WaiterKey = tuple[str, str, MailKind]
+
+
+class MailListener:
+    """
+    Фоновый слушатель новых писем Mailhog через `/api/v2/websocket`.
+
+    Одно соединение на сессию: каждое пришедшее письмо добавляется в
+    `mailbox_index`, после чего разрешаются ожидания
+    токенов этого пользователя. Ожидания хранятся в таблице futures по
+    ключу (логин или адрес получателя, тип письма), поэтому токен
+    возвращается сразу после прихода письма, без запросов к ящику и пауз.
+
+    При разрыве соединения все ожидания завершаются с None, чтобы
+    вызывающий код перешел на поллинг, а слушатель переподключается
+    через `reconnect_delay`. Письмо, обработка которого завершилась
+    ошибкой, пропускается; ошибка выводится в `sys.__stderr__`.
+
+    Args:
+        host (str): Адрес Mailhog
+        mailbox_index (MailboxIndex | None): Индекс писем, который пополняет слушатель
+        timeout (float): Время ожидания письма по умолчанию, сек
+        reconnect_delay (float): Пауза перед переподключением, сек
+        path (str): Путь WebSocket Mailhog
+    """
+
+    def __init__(
+            self,
+            host: str,
+            mailbox_index: MailboxIndex | None = None,
+            timeout: float = 10.0,
+            reconnect_delay: float = 1.0,
+            path: str = '/api/v2/websocket'
+    ):
+        self.host = host
+        self.mailbox_index = MailboxIndex() if mailbox_index is None else mailbox_index
+        self.timeout = timeout
+        self.reconnect_delay = reconnect_delay
+        self.path = path
+        self.received = 0
+        self._lock = Lock()
+        self._waiters: dict[WaiterKey, list[Future]] = {}
+        self._connected = Event()
+        self._stopped = Event()
+        self._client: WebSocketClient | None = None
+        self._thread: Thread | None = None
+
+    @property
+    def url(self) -> str:
+        parts = urlsplit(self.host)
+        scheme = 'wss' if parts.scheme == 'https' else 'ws'
+        return urlunsplit((scheme, parts.netloc, parts.path.rstrip('/') + self.path, '', ''))
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    def start(self, connect_timeout: float = 5.0) -> bool:
+        """
+        Запуск слушателя в фоновом потоке.
+
+        Args:
+            connect_timeout (float): Время ожидания первого подключения, сек
+
+        Returns:
+            bool: Удалось ли подключиться за `connect_timeout`
+        """
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = Thread(target=self._run, name='mailhog-listener', daemon=True)
+            self._thread.start()
+        return self._connected.wait(connect_timeout)
+
+    def stop(self) -> None:
+        """
+        Остановка слушателя и завершение всех ожиданий.
+        """
+        self._stopped.set()
+        client = self._client
+        if client is not None:
+            client.close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self._client = WebSocketClient(self.url).connect()
+            except OSError:
+                self._stopped.wait(self.reconnect_delay)
+                continue
+
+            if self._stopped.is_set():
+                self._client.close()
+                self._client = None
+                break
+            self._connected.set()
+            try:
+                for message in self._client:
+                    try:
+                        item = json.loads(message)
+                    except ValueError:
+                        continue
+                    if not isinstance(item, dict):
+                        continue
+                    try:
+                        self.dispatch(item)
+                    except Exception:
+                        self._report_error(item)
+            finally:
+                self._connected.clear()
+                self._client.close()
+                self._client = None
+                self._release_waiters()
+            self._stopped.wait(self.reconnect_delay)
+
+    def dispatch(self, item: dict[str, Any]) -> None:
+        """
+        Обработка нового письма: добавление в индекс и разрешение ожиданий.
+
+        Args:
+            item (dict[str, Any]): Письмо в формате Mailhog
+        """
+        with self._lock:
+            self.received += 1
+            self.mailbox_index.ingest_message(item)
+            for key in list(self._waiters):
+                token = self._lookup(key)
+                if token is not None:
+                    for future in self._waiters.pop(key):
+                        future.set_result(token)
+
+    @staticmethod
+    def _report_error(item: dict[str, Any]) -> None:
+        stderr = sys.__stderr__
+        if stderr is None:
+            return
+        try:
+            stderr.write(f"mailhog-listener: письмо {item.get('ID')} пропущено\n{traceback.format_exc()}")
+            stderr.flush()
+        except Exception:
+            pass
+
+    def _lookup(self, key: WaiterKey) -> str | None:
+        by, value, kind = key
+        index = self.mailbox_index
+        if by == 'login':
+            return index.get_token(login=value, kind=kind)
+        return index.get_token_by_email(email=value, kind=kind)
+
+    def _release_waiters(self) -> None:
+        with self._lock:
+            waiters, self._waiters = self._waiters, {}
+        for futures in waiters.values():
+            for future in futures:
+                future.set_result(None)
+
+    def wait_token(
+            self,
+            kind: MailKind,
+            login: str | None = None,
+            email: str | None = None,
+            timeout: float | None = None
+    ) -> str | None:
+        """
+        Ожидание токена из письма пользователя.
+
+        Токен, уже находящийся в индексе, возвращается сразу. Если слушатель
+        не подключен, ожидание не начинается.
+
+        Args:
+            kind (MailKind): Тип письма с токеном
+            login (str | None): Логин пользователя
+            email (str | None): Email адрес получателя, если логин не задан
+            timeout (float | None): Время ожидания, сек. По умолчанию `self.timeout`
+
+        Returns:
+            str | None: Токен или None, если письмо не пришло за время ожидания
+            или слушатель не подключен
+
+        Raises:
+            ValueError: Если не задан ни логин, ни email адрес
+        """
+        if login is None and email is None:
+            raise ValueError("Для ожидания токена требуется login или email")
+        key = ('login', login, kind) if login is not None else ('email', email.lower(), kind)
+        with self._lock:
+            token = self._lookup(key)
+            if token is not None or not self.connected:
+                return token
+            future = Future()
+            self._waiters.setdefault(key, []).append(future)
+
+        try:
+            return future.result(self.timeout if timeout is None else timeout)
+        except FutureTimeoutError:
+            return None
+        finally:
+            with self._lock:
+                futures = self._waiters.get(key)
+                if futures and future in futures:
+                    futures.remove(future)
+                    if not futures:
+                        del self._waiters[key]
+
+    def __enter__(self) -> "MailListener":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,237 @@
+from datetime import datetime
+from enum import Enum
+from threading import Lock
+from typing import Any, Callable, Iterable
+
+from helpers.message_store import ParsedMessage, ParsedMessageStore
+
+_Entry = tuple[datetime, str, str | None]
+
+
+class MailKind(str, Enum):
+    """
+    Тип письма DM API, из которого извлекается токен.
+    """
+    ACTIVATION = "activation"
+    RESET_PASSWORD = "reset_password"
+
+
+def _put_newest(tokens: dict[tuple[str, MailKind], _Entry], key: tuple[str, MailKind], entry: _Entry) -> None:
+    current = tokens.get(key)
+    if current is None or entry[0] > current[0]:
+        tokens[key] = entry
+
+
+class MailboxIndex:
+    """
+    Индекс почтового ящика Mailhog по паре (логин, тип письма).
+
+    Каждое письмо разбирается ровно один раз: результаты разбора хранятся
+    в `messages` по `ID` письма, после чего поиск токена выполняется
+    за O(1). Если для пользователя пришло несколько писем одного типа,
+    в индексе остается самое новое.
+    Дополнительно токены индексируются по адресу получателя.
+
+    `recipient_filter` ограничивает индекс письмами нужных получателей:
+    тела остальных писем не разбираются. Так параллельные воркеры
+    видят только свои письма.
+
+    Индекс пополняется из нескольких потоков (слушатель писем, helper'ы,
+    пополнение пула пользователей), поэтому запись токенов и границы
+    обхода выполняется под блокировкой.
+    """
+
+    def __init__(
+            self,
+            recipient_filter: Callable[[str], bool] | None = None,
+            messages: ParsedMessageStore | None = None
+    ) -> None:
+        self.recipient_filter = recipient_filter
+        self.messages = ParsedMessageStore() if messages is None else messages
+        self._tokens: dict[tuple[str, MailKind], _Entry] = {}
+        self._recipient_tokens: dict[tuple[str, MailKind], _Entry] = {}
+        self.scan_frontier: str | None = None
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def scan(self) -> "MailboxScan":
+        """
+        Начало обхода почтового ящика от новых писем к старым.
+
+        Returns:
+            MailboxScan: Состояние обхода
+        """
+        return MailboxScan(self)
+
+    def ingest(self, items: Iterable[dict[str, Any]]) -> int:
+        """
+        Добавление писем Mailhog в индекс.
+
+        Уже обработанные письма пропускаются без повторного разбора тела.
+        Письма без `ID` разбираются при каждом вызове.
+
+        Args:
+            items (Iterable[dict[str, Any]]): Письма в формате `/api/v2/messages`
+
+        Returns:
+            int: Количество новых писем, добавленных в индекс
+        """
+        added = 0
+        for item in items:
+            if item.get('ID') not in self.messages:
+                self.ingest_message(item)
+                added += 1
+
+        return added
+
+    def ingest_message(self, item: dict[str, Any]) -> str | None:
+        """
+        Добавление одного письма Mailhog в индекс.
+
+        Повторно переданное письмо не разбирается, для него сразу
+        возвращается сохраненный логин. Письмо без `ID` разбирается
+        каждый раз.
+
+        Args:
+            item (dict[str, Any]): Письмо в формате `/api/v2/messages`
+
+        Returns:
+            str | None: Логин пользователя из тела письма или None,
+            если письмо не содержит данных DM API
+        """
+        parsed = self.messages.get(item.get('ID'))
+        if parsed is not None:
+            return parsed.login
+
+        parsed = self.messages.parse(item, recipient_filter=self.recipient_filter)
+        if parsed.login is None:
+            return None
+
+        if parsed.confirmation_link_url is not None:
+            self._put(parsed, MailKind.ACTIVATION, parsed.confirmation_link_url)
+        if parsed.confirmation_link_uri is not None:
+            self._put(parsed, MailKind.RESET_PASSWORD, parsed.confirmation_link_uri)
+
+        return parsed.login
+
+    def _put(self, parsed: ParsedMessage, kind: MailKind, link: str) -> None:
+        entry = (parsed.created, link.split('/')[-1], parsed.message_id)
+        with self._lock:
+            _put_newest(self._tokens, (parsed.login, kind), entry)
+            for recipient in parsed.recipients:
+                _put_newest(self._recipient_tokens, (recipient, kind), entry)
+
+    def get_token(self, login: str, kind: MailKind) -> str | None:
+        """
+        Получение токена из индекса.
+
+        Args:
+            login (str): Логин пользователя
+            kind (MailKind): Тип письма
+
+        Returns:
+            str | None: Токен из самого нового письма или None, если письма нет
+        """
+        entry = self._tokens.get((login, kind))
+        return entry[1] if entry else None
+
+    def get_token_by_email(self, email: str, kind: MailKind) -> str | None:
+        """
+        Получение токена из индекса по адресу получателя.
+
+        Args:
+            email (str): Email адрес получателя письма
+            kind (MailKind): Тип письма
+
+        Returns:
+            str | None: Токен из самого нового письма или None, если письма нет
+        """
+        entry = self._recipient_tokens.get((email.lower(), kind))
+        return entry[1] if entry else None
+
+    def get_message_id(self, login: str, kind: MailKind) -> str | None:
+        """
+        Получение `ID` письма, из которого взят токен `get_token`.
+
+        Args:
+            login (str): Логин пользователя
+            kind (MailKind): Тип письма
+
+        Returns:
+            str | None: `ID` самого нового письма или None, если письма нет
+        """
+        entry = self._tokens.get((login, kind))
+        return entry[2] if entry else None
+
+    def get_message_id_by_email(self, email: str, kind: MailKind) -> str | None:
+        """
+        Получение `ID` письма, из которого взят токен `get_token_by_email`.
+
+        Args:
+            email (str): Email адрес получателя письма
+            kind (MailKind): Тип письма
+
+        Returns:
+            str | None: `ID` самого нового письма или None, если письма нет
+        """
+        entry = self._recipient_tokens.get((email.lower(), kind))
+        return entry[2] if entry else None
+
+
+class MailboxScan:
+    """
+    Обход почтового ящика от новых писем к старым с остановкой на уже
+    просмотренных письмах.
+
+    Обход, который дошел до конца ящика (или до лимита) либо до границы
+    предыдущего такого обхода, запоминает `ID` самого нового письма как
+    границу `MailboxIndex.scan_frontier`: все более старые письма к этому
+    моменту уже в индексе. Следующий обход читает только письма новее
+    границы, поэтому повторный опрос ящика до прихода письма стоит одного
+    запроса страницы, а не `mailbox_scan_limit` писем.
+
+    Обход, прерванный через `interrupt` (например, когда токен найден),
+    границу не сдвигает: письма старше точки остановки не просмотрены.
+
+    Args:
+        index (MailboxIndex): Индекс, который пополняется при обходе
+    """
+
+    def __init__(self, index: MailboxIndex):
+        self.index = index
+        self.frontier = index.scan_frontier
+        self.complete = True
+        self._newest: str | None = None
+        self._started = False
+
+    def reached_frontier(self, item: dict[str, Any]) -> bool:
+        """
+        Проверка, что письмо уже просмотрено предыдущим полным обходом.
+
+        Args:
+            item (dict[str, Any]): Очередное письмо обхода
+
+        Returns:
+            bool: True, если обход можно завершить
+        """
+        message_id = item.get('ID')
+        if not self._started:
+            self._started = True
+            self._newest = message_id
+        return message_id is not None and message_id == self.frontier
+
+    def interrupt(self) -> None:
+        """
+        Отметка, что обход остановлен до конца ящика и границы.
+        """
+        self.complete = False
+
+    def finish(self) -> None:
+        """
+        Завершение обхода: сдвиг границы, если обход был полным.
+        """
+        if self.complete and self._newest is not None:
+            with self.index._lock:
+                self.index.scan_frontier = self._newest
@@ -0,0 +1,177 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
+from json import loads
+from threading import Lock
+from typing import Any, Callable
+
+
+class BodyMarker(str, Enum):
+    """
+    Отметка вместо разобранного тела письма.
+    """
+    NOT_JSON = "not_json"
+    SKIPPED = "skipped"
+
+
+def _parse_created(created: str | None) -> datetime:
+    """
+    Разбор поля `Created` письма Mailhog.
+
+    Mailhog отдает время в формате RFC3339 с точностью до наносекунд,
+    поэтому дробная часть приводится к микросекундам.
+
+    Args:
+        created (str | None): Значение поля `Created`
+
+    Returns:
+        datetime: Время получения письма или datetime.min, если поле отсутствует
+    """
+    if not created:
+        return datetime.min
+    value = created.replace('Z', '+00:00')
+    if '.' in value:
+        head, tail = value.split('.', 1)
+        digits = len(tail) - len(tail.lstrip('0123456789'))
+        value = f"{head}.{tail[:digits][:6].ljust(6, '0')}{tail[digits:]}"
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.min
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _get_recipients(item: dict[str, Any]) -> tuple[str, ...]:
+    """
+    Получение адресов получателей письма Mailhog в нижнем регистре.
+
+    Args:
+        item (dict[str, Any]): Письмо в формате `/api/v2/messages`
+
+    Returns:
+        tuple[str, ...]: Адреса получателей
+    """
+    return tuple(
+        f"{recipient['Mailbox']}@{recipient['Domain']}".lower()
+        for recipient in item.get('To') or []
+        if recipient.get('Mailbox') and recipient.get('Domain')
+    )
+
+
+def _decode_body(body: Any) -> dict[str, Any] | BodyMarker:
+    """
+    Разбор тела письма DM API.
+
+    Письма DM API содержат JSON объект, поэтому тела, которые не
+    начинаются с `{`, отбрасываются без попытки разбора и без исключения.
+
+    Args:
+        body (Any): Значение `Content.Body`
+
+    Returns:
+        dict[str, Any] | BodyMarker: Разобранное тело или `BodyMarker.NOT_JSON`
+    """
+    if not isinstance(body, str) or not body.lstrip().startswith('{'):
+        return BodyMarker.NOT_JSON
+    try:
+        data = loads(body)
+    except ValueError:
+        return BodyMarker.NOT_JSON
+    return data if isinstance(data, dict) else BodyMarker.NOT_JSON
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedMessage:
+    """
+    Письмо Mailhog после однократного разбора.
+
+    Attributes:
+        message_id (str | None): `ID` письма
+        recipients (tuple[str, ...]): Адреса получателей в нижнем регистре
+        created (datetime): Время получения письма (UTC)
+        body (dict[str, Any] | BodyMarker): Разобранное тело или отметка,
+            что тело не JSON или не разбиралось
+        login (str | None): Поле `Login` тела письма
+        confirmation_link_url (str | None): Ссылка активации `ConfirmationLinkUrl`
+        confirmation_link_uri (str | None): Ссылка сброса пароля `ConfirmationLinkUri`
+    """
+    message_id: str | None
+    recipients: tuple[str, ...]
+    created: datetime
+    body: dict[str, Any] | BodyMarker
+    login: str | None = None
+    confirmation_link_url: str | None = None
+    confirmation_link_uri: str | None = None
+
+    @property
+    def is_json(self) -> bool:
+        return not isinstance(self.body, BodyMarker)
+
+
+class ParsedMessageStore:
+    """
+    Хранилище разобранных писем Mailhog по `ID`.
+
+    Тело каждого письма разбирается один раз; повторные опросы ящика
+    получают сохраненный результат, в том числе для писем, тело которых
+    не является JSON. Письма без `ID` не сохраняются и разбираются
+    при каждом вызове, чтобы разные письма не попали под один ключ.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._messages: dict[str, ParsedMessage] = {}
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __contains__(self, message_id: str | None) -> bool:
+        return message_id in self._messages
+
+    def get(self, message_id: str | None) -> ParsedMessage | None:
+        return self._messages.get(message_id)
+
+    def parse(
+            self,
+            item: dict[str, Any],
+            recipient_filter: Callable[[str], bool] | None = None
+    ) -> ParsedMessage:
+        """
+        Разбор письма или получение ранее разобранного.
+
+        Args:
+            item (dict[str, Any]): Письмо в формате `/api/v2/messages`
+            recipient_filter (Callable[[str], bool] | None): Разбирать тело
+                только писем подходящих получателей, тела остальных
+                отмечаются как `BodyMarker.SKIPPED`
+
+        Returns:
+            ParsedMessage: Разобранное письмо
+        """
+        message_id = item.get('ID')
+        parsed = self._messages.get(message_id) if message_id is not None else None
+        if parsed is not None:
+            return parsed
+
+        recipients = _get_recipients(item)
+        created = _parse_created(item.get('Created'))
+        if recipient_filter is not None and not any(map(recipient_filter, recipients)):
+            parsed = ParsedMessage(message_id, recipients, created, BodyMarker.SKIPPED)
+        else:
+            body = _decode_body((item.get('Content') or {}).get('Body'))
+            if isinstance(body, BodyMarker):
+                parsed = ParsedMessage(message_id, recipients, created, body)
+            else:
+                parsed = ParsedMessage(
+                    message_id, recipients, created, body,
+                    login=body.get('Login'),
+                    confirmation_link_url=body.get('ConfirmationLinkUrl'),
+                    confirmation_link_uri=body.get('ConfirmationLinkUri'),
+                )
+
+        if message_id is None:
+            return parsed
+        with self._lock:
+            return self._messages.setdefault(message_id, parsed)
@@ -0,0 +1,95 @@
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence, TypeVar
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class WorkerResult:
+    """
+    Результат работы воркера параллельного запуска.
+
+    Attributes:
+        worker_id (str): Идентификатор воркера
+        returncode (int): Код завершения pytest
+        output (str): Вывод воркера
+    """
+    worker_id: str
+    returncode: int
+    output: str
+
+    @property
+    def failed(self) -> bool:
+        # 5 - в шарде воркера не оказалось тестов
+        return self.returncode not in (0, 5)
+
+
+def worker_ids(workers: int) -> list[str]:
+    return [f"w{index}" for index in range(workers)]
+
+
+def shard(items: Sequence[T], worker_id: str, workers: int) -> tuple[list[T], list[T]]:
+    """
+    Разделение собранных тестов между воркерами по кругу.
+
+    Все воркеры собирают тесты в одинаковом порядке, поэтому каждый
+    тест попадает ровно в один шард.
+
+    Args:
+        items (Sequence[T]): Собранные тесты
+        worker_id (str): Идентификатор воркера вида `w<номер>`
+        workers (int): Количество воркеров
+
+    Returns:
+        tuple[list[T], list[T]]: Тесты воркера и остальные тесты
+    """
+    index = int(worker_id.lstrip('w'))
+    selected, deselected = [], []
+    for position, item in enumerate(items):
+        (selected if position % workers == index else deselected).append(item)
+    return selected, deselected
+
+
+def run_workers(
+        args: Sequence[str],
+        workers: int,
+        run_id: str,
+        cwd: str | Path | None = None
+) -> list[WorkerResult]:
+    """
+    Запуск воркеров pytest в отдельных процессах и ожидание их завершения.
+
+    Каждый воркер получает исходные аргументы запуска, свой `--worker-id`
+    и общий `--run-id`.
+
+    Args:
+        args (Sequence[str]): Аргументы исходного запуска pytest
+        workers (int): Количество воркеров
+        run_id (str): Идентификатор запуска
+        cwd (str | Path | None): Рабочая директория воркеров
+
+    Returns:
+        list[WorkerResult]: Результаты воркеров в порядке их номеров
+    """
+    started = []
+    for worker_id in worker_ids(workers):
+        output = tempfile.TemporaryFile(mode='w+', encoding='utf-8')
+        process = subprocess.Popen(
+            [sys.executable, '-m', 'pytest', *args, '--worker-id', worker_id, '--run-id', run_id],
+            cwd=cwd,
+            stdout=output,
+            stderr=subprocess.STDOUT,
+        )
+        started.append((worker_id, process, output))
+
+    results = []
+    for worker_id, process, output in started:
+        returncode = process.wait()
+        with output:
+            output.seek(0)
+            results.append(WorkerResult(worker_id, returncode, output.read()))
+    return results
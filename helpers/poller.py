@@ -0,0 +1,178 @@
+import asyncio
+import inspect
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PollStats:
+    """
+    Статистика одного вызова поллинга.
+
+    Attributes:
+        name (str): Имя опрашиваемой функции
+        attempts (int): Количество выполненных попыток
+        waited (float): Суммарное время ожидания между попытками, сек
+        elapsed (float): Полное время вызова, сек
+        success (bool): Был ли получен результат до истечения дедлайна
+    """
+    name: str
+    attempts: int
+    waited: float
+    elapsed: float
+    success: bool
+
+
+class Poller:
+    """
+    Движок поллинга с общим дедлайном и экспоненциальной задержкой с джиттером.
+
+    Повторяет вызов функции, пока она не вернет непустой результат или не
+    истечет `timeout`. Задержка между попытками растет в `multiplier` раз,
+    не превышая `max_delay`, и случайно уменьшается на долю до `jitter`,
+    чтобы параллельные опросы не синхронизировались. Статистика каждого
+    вызова сохраняется в `stats`.
+
+    Может использоваться как декоратор обычных функций и корутин:
+
+        @Poller(timeout=30)
+        def get_token(...): ...
+    """
+
+    def __init__(
+            self,
+            timeout: float = 30.0,
+            initial_delay: float = 0.1,
+            max_delay: float = 2.0,
+            multiplier: float = 2.0,
+            jitter: float = 0.5,
+            error_message: str = "Превышено время ожидания результата",
+            stats_size: int = 1000
+    ):
+        self.timeout = timeout
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.error_message = error_message
+        self.stats: deque[PollStats] = deque(maxlen=stats_size)
+
+    def __call__(self, function: Callable[..., T]) -> Callable[..., T]:
+        if inspect.iscoroutinefunction(function):
+            @wraps(function)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> T:
+                return await self.poll_async(function, *args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            return self.poll(function, *args, **kwargs)
+
+        return wrapper
+
+    def delay(self, attempt: int) -> float:
+        """
+        Расчет задержки перед следующей попыткой.
+
+        Args:
+            attempt (int): Номер выполненной попытки, начиная с 1
+
+        Returns:
+            float: Задержка в секундах
+        """
+        base = min(self.max_delay, self.initial_delay * self.multiplier ** (attempt - 1))
+        return base * (1 - random.uniform(0, self.jitter))
+
+    def poll(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Опрос функции до получения непустого результата.
+
+        Args:
+            function (Callable[..., T]): Опрашиваемая функция
+            *args: Позиционные аргументы функции
+            **kwargs: Именованные аргументы функции
+
+        Returns:
+            T: Первый непустой результат функции
+
+        Raises:
+            AssertionError: Если результат не получен до истечения дедлайна
+        """
+        started = time.monotonic()
+        deadline = started + self.timeout
+        attempts = 0
+        waited = 0.0
+
+        while True:
+            result = function(*args, **kwargs)
+            attempts += 1
+            if result:
+                self._record(function, attempts, waited, started, success=True)
+                return result
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._record(function, attempts, waited, started, success=False)
+                raise AssertionError(f"{self.error_message} за {self.timeout} сек, попыток: {attempts}")
+
+            sleep = min(self.delay(attempts), remaining)
+            time.sleep(sleep)
+            waited += sleep
+
+    async def poll_async(self, function: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """
+        Асинхронный опрос корутины до получения непустого результата.
+
+        Ожидание между попытками выполняется через `asyncio.sleep`
+        и не блокирует event loop.
+
+        Args:
+            function (Callable[..., Awaitable[T]]): Опрашиваемая корутина
+            *args: Позиционные аргументы функции
+            **kwargs: Именованные аргументы функции
+
+        Returns:
+            T: Первый непустой результат функции
+
+        Raises:
+            AssertionError: Если результат не получен до истечения дедлайна
+        """
+        started = time.monotonic()
+        deadline = started + self.timeout
+        attempts = 0
+        waited = 0.0
+
+        while True:
+            result = await function(*args, **kwargs)
+            attempts += 1
+            if result:
+                self._record(function, attempts, waited, started, success=True)
+                return result
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._record(function, attempts, waited, started, success=False)
+                raise AssertionError(f"{self.error_message} за {self.timeout} сек, попыток: {attempts}")
+
+            sleep = min(self.delay(attempts), remaining)
+            await asyncio.sleep(sleep)
+            waited += sleep
+
+    def _record(self, function: Callable[..., Any], attempts: int, waited: float, started: float,
+                success: bool) -> None:
+        self.stats.append(
+            PollStats(
+                name=getattr(function, '__qualname__', repr(function)),
+                attempts=attempts,
+                waited=waited,
+                elapsed=time.monotonic() - started,
+                success=success,
+            )
+        )
@@ -0,0 +1,250 @@
+import json
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from threading import Condition, Event, Lock, Thread
+from typing import Callable
+
+from dm_api_account.models.Registration import Registration
+from helpers.account_helper import AccountHelper
+
+
+@dataclass(frozen=True)
+class PooledUser:
+    """
+    Заранее зарегистрированный и активированный пользователь.
+
+    Attributes:
+        login (str): Логин пользователя
+        password (str): Пароль пользователя
+        email (str): Email адрес пользователя
+        auth_token (str | None): Токен `x-dm-auth-token`, полученный при подготовке
+    """
+    login: str
+    password: str
+    email: str
+    auth_token: str | None = None
+
+
+class UserPoolStore:
+    """
+    Локальное хранилище пула пользователей в формате JSONL.
+
+    Файл ведется как журнал: добавление пользователя и его выдача
+    дописываются отдельными строками, поэтому каждая операция стоит O(1),
+    а при следующем запуске восстанавливаются только невыданные пользователи.
+    Без `path` хранилище работает только в памяти.
+
+    Args:
+        path (str | Path | None): Путь к файлу журнала
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path else None
+        self._lock = Lock()
+
+    def load(self) -> list[PooledUser]:
+        """
+        Восстановление невыданных пользователей из журнала.
+
+        Returns:
+            list[PooledUser]: Пользователи в порядке добавления
+        """
+        if self.path is None or not self.path.exists():
+            return []
+
+        users: dict[str, PooledUser] = {}
+        with self.path.open(encoding='utf-8') as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record['event'] == 'add':
+                    users[record['user']['login']] = PooledUser(**record['user'])
+                elif record['event'] == 'lease':
+                    users.pop(record['login'], None)
+        return list(users.values())
+
+    def add(self, user: PooledUser) -> None:
+        self._append({'event': 'add', 'user': asdict(user)})
+
+    def lease(self, user: PooledUser) -> None:
+        self._append({'event': 'lease', 'login': user.login})
+
+    def _append(self, record: dict) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open('a', encoding='utf-8') as file:
+                file.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+
+class UserPool:
+    """
+    Пул заранее подготовленных пользователей.
+
+    Пользователи регистрируются, активируются и авторизуются заранее,
+    тест получает свободного пользователя за O(1). Когда в пуле остается
+    меньше `low_watermark` пользователей, фоновый поток пополняет его до
+    `size`, поэтому тесты не ждут доставки писем активации.
+
+    Каждый запрос пополнения получает номер; ошибка пополнения запоминается
+    с номером запроса, который выполнялся, поэтому `lease` на пустом пуле
+    завершается ошибкой только если не удалась попытка, запрошенная им
+    самим или позже, а не одна из предыдущих.
+
+    Args:
+        account_helper_factory (Callable[[], AccountHelper]): Фабрика helper'ов;
+            фоновый поток использует собственный экземпляр
+        credentials_factory (Callable[[], Registration]): Генератор данных нового пользователя
+        store (UserPoolStore): Хранилище пула
+        size (int): Целевой размер пула
+        low_watermark (int | None): Порог запуска пополнения, по умолчанию половина `size`
+    """
+
+    def __init__(
+            self,
+            account_helper_factory: Callable[[], AccountHelper],
+            credentials_factory: Callable[[], Registration],
+            store: UserPoolStore | None = None,
+            size: int = 10,
+            low_watermark: int | None = None
+    ):
+        self.account_helper_factory = account_helper_factory
+        self.credentials_factory = credentials_factory
+        self.store = store or UserPoolStore()
+        self.size = size
+        self.low_watermark = size // 2 if low_watermark is None else low_watermark
+
+        self._users: deque[PooledUser] = deque(self.store.load())
+        self._available = Condition()
+        self._refill_requested = Event()
+        self._stopped = Event()
+        self._thread: Thread | None = None
+        self._requested = 0
+        self._error: tuple[int, BaseException] | None = None
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def start(self) -> "UserPool":
+        """
+        Запуск фонового пополнения пула.
+        """
+        if self._thread is None:
+            self._thread = Thread(target=self._refill_loop, name='user-pool-refill', daemon=True)
+            self._thread.start()
+            self._request_refill()
+        return self
+
+    def stop(self) -> None:
+        """
+        Остановка фонового пополнения пула.
+        """
+        self._stopped.set()
+        self._refill_requested.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def fill(self, count: int, account_helper: AccountHelper | None = None) -> list[PooledUser]:
+        """
+        Синхронная подготовка пользователей и добавление их в пул.
+
+        Args:
+            count (int): Количество пользователей
+            account_helper (AccountHelper | None): Helper для подготовки, по умолчанию новый
+
+        Returns:
+            list[PooledUser]: Подготовленные пользователи
+        """
+        users = self._provision(account_helper or self.account_helper_factory(), count)
+        for user in users:
+            self._put(user)
+        return users
+
+    def lease(self, timeout: float = 60.0) -> PooledUser:
+        """
+        Выдача свободного пользователя.
+
+        Выданный пользователь удаляется из пула и больше не выдается.
+        Если пул пуст, ожидает пополнения не дольше `timeout`.
+
+        Args:
+            timeout (float): Максимальное время ожидания, сек
+
+        Returns:
+            PooledUser: Свободный пользователь
+
+        Raises:
+            AssertionError: Если пользователь не появился за `timeout`
+        """
+        with self._available:
+            if not self._users:
+                generation = self._request_refill()
+                self._available.wait_for(lambda: self._users or self._failed(generation), timeout=timeout)
+            if not self._users:
+                error = self._error[1] if self._failed(generation) else 'истекло время ожидания'
+                raise AssertionError(f"Пул пользователей пуст: {error}")
+            user = self._users.popleft()
+            remaining = len(self._users)
+
+        self.store.lease(user)
+        if remaining < self.low_watermark:
+            self._request_refill()
+        return user
+
+    def _request_refill(self) -> int:
+        with self._available:
+            self._requested += 1
+            generation = self._requested
+        if self._thread is None:
+            self.start()
+        else:
+            self._refill_requested.set()
+        return generation
+
+    def _failed(self, generation: int) -> bool:
+        return self._error is not None and self._error[0] >= generation
+
+    def _put(self, user: PooledUser) -> None:
+        self.store.add(user)
+        with self._available:
+            self._users.append(user)
+            self._error = None
+            self._available.notify()
+
+    def _provision(self, account_helper: AccountHelper, count: int) -> list[PooledUser]:
+        batch = [self.credentials_factory() for _ in range(count)]
+        account_helper.register_users(batch=batch, validate_response=False)
+
+        users = []
+        for credentials in batch:
+            response = account_helper.user_login(login=credentials.login, password=credentials.password)
+            users.append(
+                PooledUser(
+                    login=credentials.login,
+                    password=credentials.password,
+                    email=credentials.email,
+                    auth_token=response.headers.get('x-dm-auth-token'),
+                )
+            )
+        return users
+
+    def _refill_loop(self) -> None:
+        account_helper = self.account_helper_factory()
+        while not self._stopped.is_set():
+            self._refill_requested.wait()
+            self._refill_requested.clear()
+            with self._available:
+                generation = self._requested
+            try:
+                missing = self.size - len(self._users)
+                if missing > 0 and not self._stopped.is_set():
+                    for user in self._provision(account_helper, missing):
+                        self._put(user)
+            except BaseException as error:
+                with self._available:
+                    self._error = (generation, error)
+                    self._available.notify_all()
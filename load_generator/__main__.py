@@ -0,0 +1,98 @@
+"""
+Генератор нагрузки на DM API account по сценариям AccountHelper.
+
+Без адресов сервисов поднимает локальный стенд в текущем процессе:
+
+    python -m load_generator --rate 50 --concurrency 16 --duration 30
+    python -m load_generator --scenario login=10 --scenario register=1 --json report.json
+    python -m load_generator --dm-api-account http://5.63.153.31:5051 --mailhog http://5.63.153.31:5025
+"""
+import argparse
+import contextlib
+import json
+
+from helpers.account_helper import AccountHelper
+from helpers.mailbox_index import MailboxIndex
+from load_generator.generator import LoadGenerator
+from load_generator.scenarios import DEFAULT_WEIGHTS, build_scenarios
+from local_stand.stand import LocalStand
+from rest_client.configuration import Configuration
+from services.api_dm_account import ApiDmAccount
+from services.api_mailhog import ApiMailhog
+
+
+def _weight(value: str) -> tuple[str, float]:
+    name, _, weight = value.partition('=')
+    try:
+        return name, float(weight or 1)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"ожидается <сценарий>=<вес>, получено {value!r}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rate', type=float, default=20.0, help='сценариев в секунду')
+    parser.add_argument('--concurrency', type=int, default=8, help='количество потоков')
+    parser.add_argument('--duration', type=float, default=10.0, help='длительность прогона, сек')
+    parser.add_argument('--iterations', type=int, default=None, help='ограничение количества сценариев')
+    parser.add_argument('--seed-users', type=int, default=10, help='пользователей, регистрируемых заранее')
+    parser.add_argument('--seed', type=int, default=None, help='начальное значение выбора сценариев')
+    parser.add_argument(
+        '--scenario', type=_weight, action='append', default=None, metavar='NAME=WEIGHT',
+        help=f"сценарий и его вес, доступны: {', '.join(DEFAULT_WEIGHTS)}"
+    )
+    parser.add_argument('--dm-api-account', default=None, help='адрес DM API account, по умолчанию локальный стенд')
+    parser.add_argument('--mailhog', default=None, help='адрес Mailhog, по умолчанию локальный стенд')
+    parser.add_argument('--json', default=None, help='путь для сохранения отчета в JSON')
+    args = parser.parse_args()
+
+    scenarios = build_scenarios(dict(args.scenario) if args.scenario else None)
+
+    with contextlib.ExitStack() as stack:
+        dm_api_account_url, mailhog_url = args.dm_api_account, args.mailhog
+        if dm_api_account_url is None or mailhog_url is None:
+            stand = stack.enter_context(LocalStand())
+            dm_api_account_url, mailhog_url = stand.dm_api_account_url, stand.mailhog_url
+
+        pool_size = max(args.concurrency, 10)
+        shared_account = ApiDmAccount(
+            configuration=Configuration(
+                host=dm_api_account_url, performance_mode=True, pool_connections=pool_size, pool_maxsize=pool_size
+            )
+        )
+        shared_mailhog = ApiMailhog(
+            configuration=Configuration(
+                host=mailhog_url, performance_mode=True, pool_connections=pool_size, pool_maxsize=pool_size
+            )
+        )
+
+        mailbox_index = MailboxIndex()
+
+        def account_helper_factory() -> AccountHelper:
+            return AccountHelper(
+                api_dm_account=shared_account.fork(),
+                api_mailhog=shared_mailhog.fork(),
+                search_by_email=True,
+                mailbox_index=mailbox_index
+            )
+
+        generator = LoadGenerator(
+            account_helper_factory=account_helper_factory,
+            scenarios=scenarios,
+            rate=args.rate,
+            concurrency=args.concurrency,
+            duration=args.duration,
+            iterations=args.iterations,
+            seed_users=args.seed_users,
+            seed=args.seed,
+        )
+        report = generator.run()
+
+    print(report.format())
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as file:
+            json.dump(report.to_dict(), file, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
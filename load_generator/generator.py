@@ -0,0 +1,199 @@
+import random
+import time
+from dataclasses import dataclass
+from threading import Lock, Thread
+from typing import Any, Callable
+
+from dm_api_account.models.Registration import Registration
+from helpers.account_helper import AccountHelper
+from helpers.data_namespace import DataNamespace
+from load_generator.scenarios import LoadUser, Scenario, ScenarioContext, UserRing
+from load_generator.stats import LoadStats
+
+
+@dataclass(frozen=True)
+class LoadReport:
+    """
+    Результат прогона генератора нагрузки.
+
+    Attributes:
+        duration (float): Фактическая длительность прогона, сек
+        iterations (int): Количество выполненных сценариев
+        scenarios (dict[str, dict[str, Any]]): Сводка по сценариям
+        endpoints (dict[str, dict[str, Any]]): Сводка по эндпоинтам
+    """
+    duration: float
+    iterations: int
+    scenarios: dict[str, dict[str, Any]]
+    endpoints: dict[str, dict[str, Any]]
+
+    @property
+    def throughput(self) -> float:
+        return self.iterations / self.duration if self.duration else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'duration': self.duration,
+            'iterations': self.iterations,
+            'throughput': self.throughput,
+            'scenarios': self.scenarios,
+            'endpoints': self.endpoints,
+        }
+
+    def format(self) -> str:
+        lines = [f"{self.iterations} сценариев за {self.duration:.1f} с ({self.throughput:.1f}/с)"]
+        for title, table in (('Сценарий', self.scenarios), ('Эндпоинт', self.endpoints)):
+            lines.append('')
+            lines.append(f"{title:<36} {'count':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}  outcomes")
+            for name, summary in sorted(table.items()):
+                outcomes = ' '.join(f"{outcome}:{count}" for outcome, count in summary['outcomes'].items())
+                lines.append(
+                    f"{name:<36} {summary['count']:>7} {summary['p50_ms']:>8.1f} {summary['p95_ms']:>8.1f} "
+                    f"{summary['p99_ms']:>8.1f} {summary['error_rate']:>7.1%}  {outcomes}"
+                )
+        return '\n'.join(lines)
+
+
+class LoadGenerator:
+    """
+    Генератор нагрузки на основе сценариев `AccountHelper`.
+
+    Сценарии выбираются случайно пропорционально весам и запускаются
+    с частотой `rate` в секунду в `concurrency` потоках. Если все потоки
+    заняты, очередной сценарий стартует сразу после освобождения потока,
+    поэтому фактическая частота может быть ниже заданной.
+    Каждый поток использует собственный helper из `account_helper_factory`.
+
+    Args:
+        account_helper_factory (Callable[[], AccountHelper]): Фабрика helper'ов
+        scenarios (list[Scenario]): Сценарии с весами
+        rate (float): Целевая частота запуска сценариев, 1/сек
+        concurrency (int): Количество потоков
+        duration (float): Длительность прогона, сек
+        iterations (int | None): Ограничение количества сценариев
+        seed_users (int): Количество пользователей, регистрируемых до начала прогона
+        namespace (DataNamespace | None): Пространство логинов и адресов
+        seed (int | None): Начальное значение генератора случайных чисел
+    """
+
+    def __init__(
+            self,
+            account_helper_factory: Callable[[], AccountHelper],
+            scenarios: list[Scenario],
+            rate: float,
+            concurrency: int = 8,
+            duration: float = 10.0,
+            iterations: int | None = None,
+            seed_users: int = 10,
+            namespace: DataNamespace | None = None,
+            seed: int | None = None
+    ):
+        if not scenarios:
+            raise ValueError("Не задано ни одного сценария")
+        if rate <= 0:
+            raise ValueError("Частота должна быть больше нуля")
+
+        self.account_helper_factory = account_helper_factory
+        self.scenarios = scenarios
+        self.rate = rate
+        self.concurrency = concurrency
+        self.duration = duration
+        self.iterations = iterations
+        self.seed_users = seed_users
+        self.namespace = namespace or DataNamespace()
+        self.stats = LoadStats()
+        self.users = UserRing()
+
+        self._random = random.Random(seed)
+        self._lock = Lock()
+        self._issued = 0
+        self._started = 0.0
+
+    def run(self) -> LoadReport:
+        """
+        Выполнение прогона.
+
+        Returns:
+            LoadReport: Статистика по сценариям и эндпоинтам
+        """
+        self._seed_users()
+
+        self._issued = 0
+        self._started = time.perf_counter()
+        threads = [
+            Thread(target=self._worker, name=f'load-generator-{index}', daemon=True)
+            for index in range(self.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        duration = time.perf_counter() - self._started
+
+        return LoadReport(
+            duration=duration,
+            iterations=sum(stats.count for stats in self.stats.scenarios.values()),
+            scenarios={name: stats.summary() for name, stats in self.stats.scenarios.items()},
+            endpoints={name: stats.summary() for name, stats in self.stats.endpoints.items()},
+        )
+
+    def _instrument(self, account_helper: AccountHelper) -> AccountHelper:
+        for api in (
+                account_helper.dm_account.account_api,
+                account_helper.dm_account.login_api,
+                account_helper.mailhog.mailhog_api,
+        ):
+            api.response_hooks.append(self.stats.record_response)
+        return account_helper
+
+    def _seed_users(self) -> None:
+        if self.seed_users <= 0:
+            return
+        from faker import Faker
+        faker = Faker()
+        batch = []
+        for _ in range(self.seed_users):
+            login = self.namespace.login('load')
+            batch.append(
+                Registration(
+                    login=login,
+                    password=faker.password(length=10, special_chars=False),
+                    email=self.namespace.email(login)
+                )
+            )
+        self.account_helper_factory().register_users(batch=batch, validate_response=False)
+        for registration in batch:
+            self.users.put(LoadUser(login=registration.login, password=registration.password, email=registration.email))
+
+    def _next_start(self) -> tuple[float, Scenario] | None:
+        with self._lock:
+            if self.iterations is not None and self._issued >= self.iterations:
+                return None
+            start_at = self._started + self._issued / self.rate
+            if start_at - self._started >= self.duration:
+                return None
+            self._issued += 1
+            scenario = self._random.choices(self.scenarios, weights=[item.weight for item in self.scenarios])[0]
+        return start_at, scenario
+
+    def _worker(self) -> None:
+        from faker import Faker
+        context = ScenarioContext(
+            account_helper=self._instrument(self.account_helper_factory()),
+            namespace=self.namespace,
+            users=self.users,
+            faker=Faker(),
+        )
+        while (planned := self._next_start()) is not None:
+            start_at, scenario = planned
+            delay = start_at - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+            started = time.perf_counter()
+            try:
+                scenario.run(context)
+            except Exception as error:
+                self.stats.record_scenario(scenario.name, time.perf_counter() - started, error)
+            else:
+                self.stats.record_scenario(scenario.name, time.perf_counter() - started)
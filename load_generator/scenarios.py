@@ -0,0 +1,185 @@
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import Condition
+from typing import TYPE_CHECKING, Callable, Iterator
+
+from helpers.account_helper import AccountHelper
+from helpers.data_namespace import DataNamespace
+
+if TYPE_CHECKING:
+    from faker import Faker
+
+
+@dataclass
+class LoadUser:
+    """
+    Активированный пользователь, на котором выполняются сценарии нагрузки.
+
+    Сценарии смены пароля и почты обновляют поля на месте.
+    """
+    login: str
+    password: str
+    email: str
+
+
+class UserRing:
+    """
+    Набор пользователей, разделяемый потоками генератора нагрузки.
+
+    Пользователь выдается одному сценарию за раз и возвращается после
+    успешного выполнения. Если сценарий упал, состояние пользователя
+    неизвестно, и он больше не выдается.
+    """
+
+    def __init__(self) -> None:
+        self._users: deque[LoadUser] = deque()
+        self._available = Condition()
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def put(self, user: LoadUser) -> None:
+        with self._available:
+            self._users.append(user)
+            self._available.notify()
+
+    @contextmanager
+    def lease(self, timeout: float = 10.0) -> Iterator[LoadUser]:
+        """
+        Выдача свободного пользователя на время сценария.
+
+        Args:
+            timeout (float): Максимальное время ожидания свободного пользователя, сек
+
+        Raises:
+            LookupError: Если свободный пользователь не появился за `timeout`
+        """
+        with self._available:
+            if not self._available.wait_for(lambda: self._users, timeout=timeout):
+                raise LookupError("Нет свободных пользователей для сценария")
+            user = self._users.popleft()
+        yield user
+        self.put(user)
+
+
+@dataclass
+class ScenarioContext:
+    """
+    Окружение сценария в потоке генератора нагрузки.
+
+    Attributes:
+        account_helper (AccountHelper): Helper потока
+        namespace (DataNamespace): Пространство уникальных логинов и адресов
+        users (UserRing): Общий набор активированных пользователей
+        faker (Faker): Генератор данных потока
+    """
+    account_helper: AccountHelper
+    namespace: DataNamespace
+    users: UserRing
+    faker: "Faker"
+
+    def new_password(self) -> str:
+        return self.faker.password(length=10, special_chars=False)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    Сценарий нагрузки с относительным весом.
+
+    Attributes:
+        name (str): Название сценария
+        weight (float): Вес при случайном выборе сценария
+        run (Callable[[ScenarioContext], None]): Шаги сценария
+    """
+    name: str
+    weight: float
+    run: Callable[[ScenarioContext], None]
+
+
+def register(context: ScenarioContext) -> None:
+    login = context.namespace.login('load')
+    user = LoadUser(login=login, password=context.new_password(), email=context.namespace.email(login))
+    context.account_helper.register_new_user(
+        login=user.login,
+        password=user.password,
+        email=user.email,
+        validate_response=False
+    )
+    context.users.put(user)
+
+
+def login(context: ScenarioContext) -> None:
+    with context.users.lease() as user:
+        context.account_helper.user_login(login=user.login, password=user.password)
+
+
+def change_email(context: ScenarioContext) -> None:
+    with context.users.lease() as user:
+        new_email = context.namespace.email(context.namespace.login('mail'))
+        context.account_helper.change_email(
+            login=user.login,
+            password=user.password,
+            new_email=new_email,
+            validate_response=False
+        )
+        user.email = new_email
+        token = context.account_helper.get_activation_token_by_email(email=new_email)
+        context.account_helper.activate_user(token=token, validate_response=False)
+
+
+def change_password(context: ScenarioContext) -> None:
+    with context.users.lease() as user:
+        new_password = context.new_password()
+        context.account_helper.change_password(
+            login=user.login,
+            email=user.email,
+            old_password=user.password,
+            new_password=new_password,
+            validate_response=False
+        )
+        user.password = new_password
+
+
+def logout_all(context: ScenarioContext) -> None:
+    with context.users.lease() as user:
+        context.account_helper.auth_user(login=user.login, password=user.password)
+        context.account_helper.logout_user_all_device()
+
+
+SCENARIOS: dict[str, Callable[[ScenarioContext], None]] = {
+    'register': register,
+    'login': login,
+    'change_email': change_email,
+    'change_password': change_password,
+    'logout_all': logout_all,
+}
+
+DEFAULT_WEIGHTS: dict[str, float] = {
+    'register': 2,
+    'login': 5,
+    'change_email': 1,
+    'change_password': 1,
+    'logout_all': 1,
+}
+
+
+def build_scenarios(weights: dict[str, float] | None = None) -> list[Scenario]:
+    """
+    Сборка списка сценариев по весам.
+
+    Args:
+        weights (dict[str, float] | None): Веса по названию сценария, по умолчанию `DEFAULT_WEIGHTS`
+
+    Returns:
+        list[Scenario]: Сценарии с положительным весом
+
+    Raises:
+        ValueError: Если указан неизвестный сценарий
+    """
+    weights = DEFAULT_WEIGHTS if weights is None else weights
+    unknown = set(weights) - set(SCENARIOS)
+    if unknown:
+        raise ValueError(f"Неизвестные сценарии: {', '.join(sorted(unknown))}")
+    return [Scenario(name=name, weight=weight, run=SCENARIOS[name]) for name, weight in weights.items() if weight > 0]
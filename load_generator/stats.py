@@ -0,0 +1,79 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
+from urllib.parse import urlsplit
+
+from requests.models import PreparedRequest, Response
+
+from rest_client.metrics import Histogram, path_template
+
+
+def endpoint_name(request: PreparedRequest) -> str:
+    """
+    Название эндпоинта для статистики: метод и шаблон пути.
+
+    Args:
+        request (PreparedRequest): Отправленный запрос
+
+    Returns:
+        str: Название вида `PUT /v1/account/{token}`
+    """
+    return f"{request.method} {path_template(urlsplit(request.url).path)}"
+
+
+@dataclass
+class LatencyStats:
+    """
+    Задержки и коды ответов одного эндпоинта или сценария.
+    """
+    latencies: Histogram = field(default_factory=Histogram)
+    outcomes: Counter = field(default_factory=Counter)
+
+    @property
+    def count(self) -> int:
+        return self.latencies.count
+
+    @property
+    def errors(self) -> int:
+        return sum(count for outcome, count in self.outcomes.items() if not _is_success(outcome))
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            **self.latencies.summary(),
+            'error_rate': self.errors / self.count if self.count else 0.0,
+            'outcomes': dict(sorted(self.outcomes.items(), key=lambda item: str(item[0]))),
+        }
+
+
+def _is_success(outcome: int | str) -> bool:
+    return isinstance(outcome, int) and outcome < 400 or outcome == 'ok'
+
+
+class LoadStats:
+    """
+    Потокобезопасный сборщик статистики генератора нагрузки.
+
+    Эндпоинты учитываются через response hook клиентов (`record_response`),
+    сценарии - по времени выполнения и исключению (`record_scenario`).
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.endpoints: dict[str, LatencyStats] = {}
+        self.scenarios: dict[str, LatencyStats] = {}
+
+    def record_response(self, response: Response, **kwargs: Any) -> None:
+        self._record(self.endpoints, endpoint_name(response.request), response.elapsed.total_seconds(),
+                     response.status_code)
+
+    def record_scenario(self, name: str, elapsed: float, error: BaseException | None = None) -> None:
+        self._record(self.scenarios, name, elapsed, 'ok' if error is None else type(error).__name__)
+
+    def _record(self, table: dict[str, LatencyStats], name: str, elapsed: float, outcome: int | str) -> None:
+        with self._lock:
+            stats = table.get(name)
+            if stats is None:
+                stats = table[name] = LatencyStats()
+            stats.latencies.record(elapsed)
+            stats.outcomes[outcome] += 1
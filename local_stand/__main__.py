@@ -0,0 +1,35 @@
+"""
+Запуск локального стенда DM API account и Mailhog.
+
+    python -m local_stand --dm-api-account http://127.0.0.1:5051 --mailhog http://127.0.0.1:5025
+"""
+import argparse
+import time
+
+from local_stand.stand import LocalStand
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dm-api-account', default='http://127.0.0.1:5051')
+    parser.add_argument('--mailhog', default='http://127.0.0.1:5025')
+    parser.add_argument('--user', nargs=2, metavar=('LOGIN', 'PASSWORD'), action='append', default=[],
+                        help='активированный пользователь, создаваемый при запуске')
+    args = parser.parse_args()
+
+    stand = LocalStand(dm_api_account_url=args.dm_api_account, mailhog_url=args.mailhog)
+    for login, password in args.user:
+        stand.store.add_user(login=login, password=password, email=f'{login}@mail.ru')
+
+    with stand:
+        print(f"DM API account: {stand.dm_api_account_url}")
+        print(f"Mailhog: {stand.mailhog_url}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
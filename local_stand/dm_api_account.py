@@ -0,0 +1,248 @@
+import re
+import secrets
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Any
+
+from local_stand.handler import JsonRequestHandler
+from local_stand.mailbox import Mailbox
+
+_email_pattern = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+
+INACTIVE_USER_MESSAGE = 'User is inactive. Address the technical support for more details'
+UNAUTHENTICATED_MESSAGE = 'User must be authenticated'
+
+
+@dataclass
+class StandUser:
+    login: str
+    password: str
+    email: str
+    activated: bool = False
+    registration: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @property
+    def roles(self) -> list[str]:
+        return ['Guest', 'Player'] if self.activated else ['Guest']
+
+    def user(self) -> dict[str, Any]:
+        return {
+            'login': self.login,
+            'roles': self.roles,
+            'mediumPictureUrl': None,
+            'smallPictureUrl': None,
+            'status': None,
+            'rating': {'enabled': True, 'quality': 0, 'quantity': 0},
+            'online': datetime.now(timezone.utc).isoformat(),
+            'name': None,
+            'location': None,
+            'registration': self.registration.isoformat(),
+        }
+
+    def user_details(self) -> dict[str, Any]:
+        return {
+            **self.user(),
+            'icq': None,
+            'skype': None,
+            'originalPictureUrl': None,
+            'info': '',
+            'settings': {
+                'colorSchema': 'Modern',
+                'nannyGreetingsMessage': None,
+                'paging': {
+                    'postsPerPage': 10,
+                    'commentsPerPage': 10,
+                    'topicsPerPage': 10,
+                    'messagesPerPage': 10,
+                    'entitiesPerPage': 10,
+                },
+            },
+        }
+
+
+class AccountStore:
+    """
+    Хранилище пользователей локального стенда DM API.
+
+    Письма активации и сброса пароля отправляются в `Mailbox` в том же
+    JSON формате, что и у настоящего сервиса.
+    """
+
+    def __init__(self, mailbox: Mailbox, public_url: str = 'http://localhost:5051'):
+        self.mailbox = mailbox
+        self.public_url = public_url
+        self.lock = Lock()
+        self.users: dict[str, StandUser] = {}
+        self.activation_tokens: dict[str, str] = {}
+        self.reset_tokens: dict[str, str] = {}
+        self.auth_tokens: dict[str, str] = {}
+
+    def add_user(self, login: str, password: str, email: str, activated: bool = True) -> StandUser:
+        with self.lock:
+            user = self.users[login] = StandUser(login=login, password=password, email=email, activated=activated)
+            return user
+
+    def send_activation(self, user: StandUser) -> None:
+        token = str(uuid.uuid4())
+        self.activation_tokens[token] = user.login
+        self.mailbox.send(
+            to=user.email,
+            subject='Добро пожаловать',
+            body={'Login': user.login, 'ConfirmationLinkUrl': f'{self.public_url}/activate/{token}'},
+        )
+
+    def send_reset(self, user: StandUser) -> None:
+        token = str(uuid.uuid4())
+        self.reset_tokens[token] = user.login
+        self.mailbox.send(
+            to=user.email,
+            subject='Восстановление пароля',
+            body={'Login': user.login, 'ConfirmationLinkUri': f'{self.public_url}/password/{token}'},
+        )
+
+    def issue_auth_token(self, user: StandUser) -> str:
+        token = secrets.token_urlsafe(32)
+        self.auth_tokens[token] = user.login
+        return token
+
+
+def _validation_failed(errors: dict[str, list[str]]) -> tuple[int, dict[str, Any], None]:
+    return 400, {
+        'type': 'https://tools.ietf.org/html/rfc7231#section-6.5.1',
+        'title': 'Validation failed',
+        'status': 400,
+        'errors': errors,
+    }, None
+
+
+def _problem(status: int, title: str) -> tuple[int, dict[str, Any], None]:
+    return status, {'title': title, 'status': status}, None
+
+
+def _envelope(user: StandUser) -> dict[str, Any]:
+    return {'resource': user.user(), 'metadata': None}
+
+
+class DmApiAccountHandler(JsonRequestHandler):
+    """
+    Обработчик эндпоинтов DM API account локального стенда.
+    """
+
+    store: AccountStore
+
+    def _current_user(self) -> StandUser | None:
+        login = self.store.auth_tokens.get(self.headers.get('x-dm-auth-token', ''))
+        return self.store.users.get(login) if login else None
+
+    def register(self):
+        data = self.read_json() or {}
+        login, password, email = data.get('login', ''), data.get('password', ''), data.get('email', '')
+        errors: dict[str, list[str]] = {}
+        with self.store.lock:
+            if len(login) < 2:
+                errors['Login'] = ['Short']
+            elif login in self.store.users:
+                errors['Login'] = ['Taken']
+            if not _email_pattern.fullmatch(email):
+                errors['Email'] = ['Invalid']
+            elif any(user.email.lower() == email.lower() for user in self.store.users.values()):
+                errors['Email'] = ['Taken']
+            if len(password) < 6:
+                errors['Password'] = ['Short']
+            if errors:
+                return _validation_failed(errors)
+
+            user = self.store.users[login] = StandUser(login=login, password=password, email=email)
+            self.store.send_activation(user)
+        return 201, None, None
+
+    def activate(self, token: str):
+        with self.store.lock:
+            login = self.store.activation_tokens.pop(token, None)
+            if login is None:
+                return _problem(410, 'Activation token is invalid! Address the technical support for more details')
+            user = self.store.users[login]
+            user.activated = True
+        return 200, _envelope(user), None
+
+    def get_account(self):
+        user = self._current_user()
+        if user is None:
+            return _problem(401, UNAUTHENTICATED_MESSAGE)
+        return 200, {'resource': user.user_details(), 'metadata': None}, None
+
+    def login(self):
+        data = self.read_json() or {}
+        with self.store.lock:
+            user = self.store.users.get(data.get('login', ''))
+            if user is None or user.password != data.get('password'):
+                return _validation_failed({'Password': ['WrongPassword']})
+            if not user.activated:
+                return _problem(403, INACTIVE_USER_MESSAGE)
+            token = self.store.issue_auth_token(user)
+        return 200, _envelope(user), {'X-Dm-Auth-Token': token}
+
+    def logout(self):
+        with self.store.lock:
+            if self.store.auth_tokens.pop(self.headers.get('x-dm-auth-token', ''), None) is None:
+                return _problem(401, UNAUTHENTICATED_MESSAGE)
+        return 204, None, None
+
+    def logout_all(self):
+        with self.store.lock:
+            login = self.store.auth_tokens.get(self.headers.get('x-dm-auth-token', ''))
+            if login is None:
+                return _problem(401, UNAUTHENTICATED_MESSAGE)
+            for token in [token for token, owner in self.store.auth_tokens.items() if owner == login]:
+                del self.store.auth_tokens[token]
+        return 204, None, None
+
+    def reset_password(self):
+        data = self.read_json() or {}
+        with self.store.lock:
+            user = self.store.users.get(data.get('login', ''))
+            if user is None or user.email.lower() != str(data.get('email', '')).lower():
+                return _validation_failed({'Login': ['Invalid']})
+            self.store.send_reset(user)
+        return 201, _envelope(user), None
+
+    def change_password(self):
+        data = self.read_json() or {}
+        with self.store.lock:
+            user = self.store.users.get(data.get('login', ''))
+            if user is None or self.store.reset_tokens.get(data.get('token', '')) != user.login:
+                return _validation_failed({'Token': ['Invalid']})
+            if user.password != data.get('oldPassword'):
+                return _validation_failed({'OldPassword': ['Invalid']})
+            if len(data.get('newPassword') or '') < 6:
+                return _validation_failed({'NewPassword': ['Short']})
+            del self.store.reset_tokens[data['token']]
+            user.password = data['newPassword']
+        return 200, _envelope(user), None
+
+    def change_email(self):
+        data = self.read_json() or {}
+        with self.store.lock:
+            user = self.store.users.get(data.get('login', ''))
+            if user is None or user.password != data.get('password'):
+                return _validation_failed({'Password': ['WrongPassword']})
+            if not _email_pattern.fullmatch(data.get('email', '')):
+                return _validation_failed({'Email': ['Invalid']})
+            user.email = data['email']
+            user.activated = False
+            self.store.send_activation(user)
+        return 200, _envelope(user), None
+
+    routes = [
+        ('POST', re.compile(r'/v1/account'), register),
+        ('GET', re.compile(r'/v1/account'), get_account),
+        ('POST', re.compile(r'/v1/account/login'), login),
+        ('DELETE', re.compile(r'/v1/account/login'), logout),
+        ('DELETE', re.compile(r'/v1/account/login/all'), logout_all),
+        ('POST', re.compile(r'/v1/account/password'), reset_password),
+        ('PUT', re.compile(r'/v1/account/password'), change_password),
+        ('PUT', re.compile(r'/v1/account/email'), change_email),
+        ('PUT', re.compile(r'/v1/account/(?P<token>[^/]+)'), activate),
+    ]
@@ -0,0 +1,59 @@
+import json
+import re
+from http.server import BaseHTTPRequestHandler
+from typing import Any, Callable
+from urllib.parse import parse_qs, urlsplit
+
+Route = tuple[str, re.Pattern, Callable[..., tuple[int, Any, dict[str, str] | None]]]
+
+
+class JsonRequestHandler(BaseHTTPRequestHandler):
+    """
+    Базовый обработчик HTTP запросов локального стенда.
+
+    Маршруты задаются списком `routes` из кортежей (метод, регулярное
+    выражение пути, обработчик). Обработчик получает именованные группы
+    пути как аргументы и возвращает (статус, тело ответа, заголовки).
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    routes: list[Route] = []
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    @property
+    def query(self) -> dict[str, str]:
+        return {key: values[-1] for key, values in parse_qs(urlsplit(self.path).query).items()}
+
+    def read_json(self) -> Any:
+        if not self.body:
+            return None
+        try:
+            return json.loads(self.body)
+        except ValueError:
+            return None
+
+    def send_json(self, status: int, body: Any = None, headers: dict[str, str] | None = None) -> None:
+        payload = b'' if body is None else json.dumps(body).encode()
+        self.send_response(status)
+        if body is not None:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _dispatch(self) -> None:
+        self.body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        path = urlsplit(self.path).path
+        for method, pattern, handler in self.routes:
+            match = pattern.fullmatch(path)
+            if method == self.command and match:
+                self.send_json(*handler(self, **match.groupdict()))
+                return
+        self.send_json(404, {'title': 'Not Found', 'status': 404})
+
+    do_GET = do_POST = do_PUT = do_DELETE = _dispatch
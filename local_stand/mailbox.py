@@ -0,0 +1,205 @@
+import json
+import re
+import select
+import uuid
+from datetime import datetime, timezone
+from queue import Empty, Queue
+from threading import Lock
+from typing import Any
+from urllib.parse import urlsplit
+
+from local_stand.handler import JsonRequestHandler
+from rest_client.websocket import OPCODE_CLOSE, OPCODE_PING, OPCODE_PONG, WebSocketError, accept_key, encode_frame, \
+    read_frame
+
+
+class Mailbox:
+    """
+    Почтовый ящик локального стенда в формате Mailhog API v2.
+
+    Письма хранятся от новых к старым, как их отдает Mailhog.
+    Подписчики из `subscribe` получают каждое новое письмо в свою очередь.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._messages: list[dict[str, Any]] = []
+        self._subscribers: list[Queue] = []
+
+    def send(self, to: str, subject: str, body: dict[str, Any], sender: str = 'dm@localhost') -> dict[str, Any]:
+        """
+        Доставка письма в ящик.
+
+        Args:
+            to (str): Адрес получателя
+            subject (str): Тема письма
+            body (dict[str, Any]): Тело письма, сериализуется в JSON
+            sender (str): Адрес отправителя
+
+        Returns:
+            dict[str, Any]: Письмо в формате Mailhog
+        """
+        mailbox, _, domain = to.partition('@')
+        sender_mailbox, _, sender_domain = sender.partition('@')
+        content = json.dumps(body)
+        message = {
+            'ID': f'{uuid.uuid4()}@mailhog.local',
+            'From': {'Relays': None, 'Mailbox': sender_mailbox, 'Domain': sender_domain, 'Params': ''},
+            'To': [{'Relays': None, 'Mailbox': mailbox, 'Domain': domain, 'Params': ''}],
+            'Content': {
+                'Headers': {
+                    'Content-Type': ['text/plain; charset=utf-8'],
+                    'From': [sender],
+                    'Subject': [subject],
+                    'To': [to],
+                },
+                'Body': content,
+                'Size': len(content),
+                'MIME': None,
+            },
+            'Created': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
+            'MIME': None,
+            'Raw': {'From': sender, 'To': [to], 'Data': content, 'Helo': 'localhost'},
+        }
+        with self._lock:
+            self._messages.insert(0, message)
+            for subscriber in self._subscribers:
+                subscriber.put(message)
+        return message
+
+    def subscribe(self) -> Queue:
+        queue = Queue()
+        with self._lock:
+            self._subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: Queue) -> None:
+        with self._lock:
+            self._subscribers.remove(queue)
+
+    def delete(self, message_id: str) -> bool:
+        with self._lock:
+            for position, message in enumerate(self._messages):
+                if message['ID'] == message_id:
+                    del self._messages[position]
+                    return True
+        return False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._messages.clear()
+
+    def messages(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return list(self._messages)
+
+    def search(self, kind: str, query: str) -> list[dict[str, Any]]:
+        """
+        Поиск писем по правилам Mailhog: подстрока без учета регистра.
+
+        Args:
+            kind (str): `from`, `to` или `containing`
+            query (str): Строка поиска
+
+        Returns:
+            list[dict[str, Any]]: Найденные письма от новых к старым
+        """
+        query = query.lower()
+
+        def matches(message: dict[str, Any]) -> bool:
+            headers = message['Content']['Headers']
+            if kind == 'to':
+                return any(query in address.lower() for address in headers.get('To', []))
+            if kind == 'from':
+                return any(query in address.lower() for address in headers.get('From', []))
+            return query in message['Content']['Body'].lower() or any(
+                query in value.lower() for values in headers.values() for value in values
+            )
+
+        return [message for message in self.messages() if matches(message)]
+
+
+def _page(items: list[dict[str, Any]], query: dict[str, str]) -> dict[str, Any]:
+    start = int(query.get('start', 0))
+    limit = int(query.get('limit', 50))
+    page = items[start:start + limit]
+    return {'total': len(items), 'count': len(page), 'start': start, 'items': page}
+
+
+class MailhogHandler(JsonRequestHandler):
+    """
+    Обработчик Mailhog API локального стенда.
+
+    `/api/v2/websocket` транслирует новые письма подписчику, как Mailhog:
+    одно текстовое сообщение WebSocket с JSON письма на каждое письмо.
+    """
+
+    mailbox: Mailbox
+
+    def do_GET(self) -> None:
+        if urlsplit(self.path).path == '/api/v2/websocket' and self.headers.get('Upgrade', '').lower() == 'websocket':
+            self.stream_messages()
+        else:
+            self._dispatch()
+
+    def stream_messages(self) -> None:
+        queue = self.mailbox.subscribe()
+        try:
+            self.send_response(101, 'Switching Protocols')
+            self.send_header('Upgrade', 'websocket')
+            self.send_header('Connection', 'Upgrade')
+            self.send_header('Sec-WebSocket-Accept', accept_key(self.headers.get('Sec-WebSocket-Key', '')))
+            self.end_headers()
+            self.close_connection = True
+
+            while True:
+                try:
+                    message = queue.get(timeout=0.2)
+                except Empty:
+                    if self._client_closed():
+                        return
+                    continue
+                self.wfile.write(encode_frame(json.dumps(message).encode(), mask=False))
+        except OSError:
+            return
+        finally:
+            self.mailbox.unsubscribe(queue)
+
+    def _client_closed(self) -> bool:
+        if not select.select([self.connection], [], [], 0)[0]:
+            return False
+        try:
+            _, opcode, payload = read_frame(self.rfile)
+        except WebSocketError:
+            return True
+        if opcode == OPCODE_PING:
+            self.wfile.write(encode_frame(payload, OPCODE_PONG, mask=False))
+            return False
+        if opcode == OPCODE_CLOSE:
+            self.wfile.write(encode_frame(payload[:2], OPCODE_CLOSE, mask=False))
+            return True
+        return False
+
+    def get_messages(self):
+        return 200, _page(self.mailbox.messages(), self.query), None
+
+    def search_messages(self):
+        query = self.query
+        items = self.mailbox.search(kind=query.get('kind', 'containing'), query=query.get('query', ''))
+        return 200, _page(items, query), None
+
+    def delete_message(self, message_id: str):
+        if not self.mailbox.delete(message_id):
+            return 404, None, None
+        return 200, None, None
+
+    def delete_messages(self):
+        self.mailbox.clear()
+        return 200, None, None
+
+    routes = [
+        ('GET', re.compile(r'/api/v2/messages'), get_messages),
+        ('GET', re.compile(r'/api/v2/search'), search_messages),
+        ('DELETE', re.compile(r'/api/v1/messages'), delete_messages),
+        ('DELETE', re.compile(r'/api/v1/messages/(?P<message_id>[^/]+)'), delete_message),
+    ]
@@ -0,0 +1,74 @@
+from http.server import ThreadingHTTPServer
+from threading import Thread
+from urllib.parse import urlsplit
+
+from local_stand.dm_api_account import AccountStore, DmApiAccountHandler
+from local_stand.mailbox import Mailbox, MailhogHandler
+
+
+def _address(url: str) -> tuple[str, int]:
+    parts = urlsplit(url)
+    return parts.hostname or '127.0.0.1', parts.port or 0
+
+
+class LocalStand:
+    """
+    Локальный стенд DM API account и Mailhog в текущем процессе.
+
+    Реализует эндпоинты, которые используют `AccountApi`, `LoginApi` и
+    `MailhogApi`, и отправляет письма активации и сброса пароля в том же
+    формате, что и настоящий сервис. Порт 0 в адресе означает выбор
+    свободного порта, фактические адреса доступны в `dm_api_account_url`
+    и `mailhog_url` после `start()`.
+
+    Args:
+        dm_api_account_url (str): Адрес для DM API account
+        mailhog_url (str): Адрес для Mailhog
+    """
+
+    def __init__(self, dm_api_account_url: str = 'http://127.0.0.1:0', mailhog_url: str = 'http://127.0.0.1:0'):
+        self.mailbox = Mailbox()
+        self.store = AccountStore(mailbox=self.mailbox)
+
+        mailhog_handler = type('StandMailhogHandler', (MailhogHandler,), {'mailbox': self.mailbox})
+        dm_api_handler = type('StandDmApiAccountHandler', (DmApiAccountHandler,), {'store': self.store})
+
+        self._servers = [
+            ThreadingHTTPServer(_address(dm_api_account_url), dm_api_handler),
+            ThreadingHTTPServer(_address(mailhog_url), mailhog_handler),
+        ]
+        for server in self._servers:
+            server.daemon_threads = True
+        self._threads: list[Thread] = []
+
+    @property
+    def dm_api_account_url(self) -> str:
+        host, port = self._servers[0].server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def mailhog_url(self) -> str:
+        host, port = self._servers[1].server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> "LocalStand":
+        self.store.public_url = self.dm_api_account_url
+        for server in self._servers:
+            thread = Thread(target=server.serve_forever, name=f'local-stand-{server.server_port}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self) -> None:
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+
+    def __enter__(self) -> "LocalStand":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,142 @@
+from typing import Any, AsyncIterator
+
+from httpx import Response
+
+from rest_client.async_client import AsyncRestClient
+from rest_client.utilites import async_step
+
+
+class AsyncMailhogApi(AsyncRestClient):
+    """
+    Асинхронный API клиент для работы с Mailhog.
+
+    Повторяет методы `MailhogApi` поверх `AsyncRestClient`.
+    """
+
+    _v1_messages = '/api/v1/messages'
+    _v2_messages = '/api/v2/messages'
+    _v2_search = '/api/v2/search'
+
+    @async_step("Получение писем из почтового ящика Mailhog")
+    async def get_api_v2_messages(self, limit: int = 50, start: int = 0, **kwargs: Any) -> Response:
+        """
+        Получение писем из почтового ящика Mailhog.
+
+        Args:
+            limit (int, optional): Максимальное количество писем для получения.
+            По умолчанию 50
+            start (int, optional): Смещение первого письма. По умолчанию 0
+            **kwargs: Дополнительные параметры для HTTP запроса
+
+        Returns:
+            Response: HTTP ответ от сервера с письмами
+        """
+        params = {
+            'limit': limit,
+        }
+        if start:
+            params['start'] = start
+        return await self.get(
+            path=self._v2_messages,
+            params=params,
+            **kwargs
+        )
+
+    async def iter_api_v2_messages(
+            self,
+            page_size: int = 50,
+            max_messages: int | None = None,
+            **kwargs: Any
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Постраничный обход писем почтового ящика Mailhog, от новых к старым.
+
+        Args:
+            page_size (int, optional): Количество писем на странице. По умолчанию 50
+            max_messages (int | None, optional): Максимальное количество писем для обхода.
+            По умолчанию без ограничения
+            **kwargs: Дополнительные параметры для HTTP запроса
+
+        Yields:
+            dict[str, Any]: Письмо в формате `/api/v2/messages`
+        """
+        start = 0
+        while max_messages is None or start < max_messages:
+            limit = page_size if max_messages is None else min(page_size, max_messages - start)
+            page = (await self.get_api_v2_messages(limit=limit, start=start, **kwargs)).json()
+            items = page.get('items') or []
+            for item in items:
+                yield item
+
+            start += len(items)
+            if len(items) < limit or start >= page.get('total', 0):
+                return
+
+    @async_step("Поиск писем в почтовом ящике Mailhog")
+    async def get_api_v2_search(
+            self,
+            query: str,
+            kind: str = 'to',
+            start: int = 0,
+            limit: int = 50,
+            **kwargs: Any
+    ) -> Response:
+        """
+        Поиск писем в почтовом ящике Mailhog с фильтрацией на стороне сервера.
+
+        Args:
+            query (str): Строка поиска
+            kind (str, optional): Поле для поиска: `from`, `to` или `containing`.
+            По умолчанию `to`
+            start (int, optional): Смещение первого письма. По умолчанию 0
+            limit (int, optional): Максимальное количество писем для получения.
+            По умолчанию 50
+            **kwargs: Дополнительные параметры для HTTP запроса
+
+        Returns:
+            Response: HTTP ответ от сервера с найденными письмами
+        """
+        params = {
+            'kind': kind,
+            'query': query,
+            'start': start,
+            'limit': limit,
+        }
+        return await self.get(
+            path=self._v2_search,
+            params=params,
+            **kwargs
+        )
+
+    @async_step("Удаление письма из почтового ящика Mailhog")
+    async def delete_api_v1_message(self, message_id: str, **kwargs: Any) -> Response:
+        """
+        Удаление письма из почтового ящика Mailhog по идентификатору.
+
+        Args:
+            message_id (str): Значение поля `ID` письма
+            **kwargs: Дополнительные параметры для HTTP запроса
+
+        Returns:
+            Response: HTTP ответ от сервера
+        """
+        return await self.delete(
+            path=f'{self._v1_messages}/{message_id}',
+            **kwargs
+        )
+
+    @async_step("Удаление всех писем из почтового ящика Mailhog")
+    async def delete_api_v1_messages(self, **kwargs: Any) -> Response:
+        """
+        Удаление всех писем из почтового ящика Mailhog.
+
+        Args:
+            **kwargs: Дополнительные параметры для HTTP запроса
+
+        Returns:
+            Response: HTTP ответ от сервера
+        """
+        return await self.delete(
+            path=self._v1_messages,
+            **kwargs
+        )
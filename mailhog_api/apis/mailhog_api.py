@@ -1,9 +1,9 @@
-from typing import Any
+from typing import Any, Iterator
 
-import allure
 from requests.models import Response
 
 from rest_client.client import RestClient
+from rest_client.utilites import step
 
 
 class MailhogApi(RestClient):
@@ -15,16 +15,19 @@ class MailhogApi(RestClient):
     и получения токенов активации.
     """
 
+    _v1_messages = '/api/v1/messages'
     _v2_messages = '/api/v2/messages'
+    _v2_search = '/api/v2/search'
 
-    @allure.step("Получение писем из почтового ящика Mailhog")
-    def get_api_v2_messages(self, limit: int = 50, **kwargs: Any) -> Response:
+    @step("Получение писем из почтового ящика Mailhog")
+    def get_api_v2_messages(self, limit: int = 50, start: int = 0, **kwargs: Any) -> Response:
         """
         Получение писем из почтового ящика Mailhog.
         
         Args:
             limit (int, optional): Максимальное количество писем для получения. 
             По умолчанию 50
+            start (int, optional): Смещение первого письма. По умолчанию 0
             **kwargs: Дополнительные параметры для HTTP запроса
             
         Returns:
@@ -37,6 +40,8 @@ class MailhogApi(RestClient):
         params = {
             'limit': limit,
         }
+        if start:
+            params['start'] = start
         response = self.get(
             path=self._v2_messages,
             params=params,
@@ -44,3 +49,111 @@ class MailhogApi(RestClient):
             **kwargs
         )
         return response
+
+    def iter_api_v2_messages(
+            self,
+            page_size: int = 50,
+            max_messages: int | None = None,
+            **kwargs: Any
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Постраничный обход писем почтового ящика Mailhog, от новых к старым.
+
+        Страницы запрашиваются по мере чтения, в памяти держится только
+        текущая страница. Обход можно прервать в любой момент, после чего
+        следующие страницы не запрашиваются.
+
+        Args:
+            page_size (int, optional): Количество писем на странице. По умолчанию 50
+            max_messages (int | None, optional): Максимальное количество писем для обхода.
+            По умолчанию без ограничения
+            **kwargs: Дополнительные параметры для HTTP запроса
+
+        Yields:
+            dict[str, Any]: Письмо в формате `/api/v2/messages`
+        """
+        start = 0
+        while max_messages is None or start < max_messages:
+            limit = page_size if max_messages is None else min(page_size, max_messages - start)
+            page = self.get_api_v2_messages(limit=limit, start=start, **kwargs).json()
+            items = page.get('items') or []
+            yield from items
+
+            start += len(items)
+            if len(items) < limit or start >= page.get('total', 0):
+                return
+
+    @step("Поиск писем в почтовом ящике Mailhog")
+    def get_api_v2_search(
+            self,
+            query: str,
+            kind: str = 'to',
+            start: int = 0,
+            limit: int = 50,
+            **kwargs: Any
+    ) -> Response:
+        """
+        Поиск писем в почтовом ящике Mailhog с фильтрацией на стороне сервера.
+
+        Args:
+            query (str): Строка поиска
+            kind (str, optional): Поле для поиска: `from`, `to` или `containing`.
+            По умолчанию `to`
+            start (int, optional): Смещение первого письма. По умолчанию 0
+            limit (int, optional): Максимальное количество писем для получения.
+            По умолчанию 50
+            **kwargs: Дополнительные параметры для HTTP запроса
+
+        Returns:
+            Response: HTTP ответ от сервера с найденными письмами
+        """
+        params = {
+            'kind': kind,
+            'query': query,
+            'start': start,
+            'limit': limit,
+        }
+        response = self.get(
+            path=self._v2_search,
+            params=params,
+            verify=False,
+            **kwargs
+        )
+        return response
+
+    @step("Удаление письма из почтового ящика Mailhog")
+    def delete_api_v1_message(self, message_id: str, **kwargs: Any) -> Response:
+        """
+        Удаление письма из почтового ящика Mailhog по идентификатору.
+
+        Args:
+            message_id (str): Значение поля `ID` письма
+            **kwargs: Дополнительные параметры для HTTP запроса
+
+        Returns:
+            Response: HTTP ответ от сервера
+        """
+        response = self.delete(
+            path=f'{self._v1_messages}/{message_id}',
+            verify=False,
+            **kwargs
+        )
+        return response
+
+    @step("Удаление всех писем из почтового ящика Mailhog")
+    def delete_api_v1_messages(self, **kwargs: Any) -> Response:
+        """
+        Удаление всех писем из почтового ящика Mailhog.
+
+        Args:
+            **kwargs: Дополнительные параметры для HTTP запроса
+
+        Returns:
+            Response: HTTP ответ от сервера
+        """
+        response = self.delete(
+            path=self._v1_messages,
+            verify=False,
+            **kwargs
+        )
+        return response
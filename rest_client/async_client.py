@@ -0,0 +1,232 @@
+import time
+import uuid
+from json import JSONDecodeError
+from typing import Any
+from urllib.parse import urljoin
+
+import httpx
+
+from rest_client.client import HttpMethod
+from rest_client.configuration import Configuration
+from rest_client.log_sink import Lazy, get_logger, log_sink, redact_curl, redact_headers, snapshot
+from rest_client.metrics import RequestMetric, path_template
+from rest_client.utilites import async_allure_attach, httpx_to_curl
+
+
+def _log_curl(request: httpx.Request) -> str:
+    return redact_curl(httpx_to_curl(request))
+
+
+class AsyncRestClient:
+    """
+    Асинхронный HTTP клиент для работы с REST API.
+
+    Повторяет интерфейс `RestClient` (get, post, put, delete), но выполняет
+    запросы через `httpx.AsyncClient`, что позволяет запускать сотни
+    сценариев параллельно в одном event loop.
+    """
+
+    def __init__(self, configuration: Configuration):
+        self.host = configuration.host
+        self.disable_log = configuration.disable_log
+        self.performance_mode = configuration.performance_mode
+        self.metrics = configuration.metrics
+        self.session = httpx.AsyncClient(
+            verify=configuration.verify,
+            transport=httpx.AsyncHTTPTransport(
+                verify=configuration.verify,
+                retries=configuration.max_retries,
+                limits=httpx.Limits(
+                    max_connections=configuration.pool_maxsize,
+                    max_keepalive_connections=configuration.pool_maxsize if configuration.keep_alive else 0,
+                ),
+            ),
+        )
+        self.set_headers(configuration.headers)
+        self._log = None
+
+    @property
+    def log(self) -> Any:
+        """
+        Логгер structlog клиента, создается при первом логируемом запросе.
+        """
+        if self._log is None:
+            self._log = get_logger(__name__).bind(service='api')
+        return self._log
+
+    async def __aenter__(self) -> "AsyncRestClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Закрытие пула соединений клиента.
+        """
+        await self.session.aclose()
+
+    def set_headers(self, headers: dict[str, str] | None) -> None:
+        """
+        Установка заголовков для HTTP запросов.
+
+        Args:
+            headers (Optional[Dict[str, str]]): Словарь заголовков для установки.
+            Если None, заголовки не изменяются
+        """
+        if headers:
+            self.session.headers.update(headers)
+
+    async def get(self, path: str, **kwargs: Any) -> httpx.Response:
+        """
+        Выполнение GET запроса.
+
+        Args:
+            path (str): Путь к эндпоинту API
+            **kwargs: Дополнительные параметры для HTTP запроса
+            (params, headers, timeout и т.д.)
+
+        Returns:
+            httpx.Response: HTTP ответ от сервера
+        """
+        return await self._send_request(method="GET", path=path, **kwargs)
+
+    async def post(self, path: str, **kwargs: Any) -> httpx.Response:
+        """
+        Выполнение POST запроса.
+
+        Args:
+            path (str): Путь к эндпоинту API
+            **kwargs: Дополнительные параметры для HTTP запроса
+            (json, data, headers, timeout и т.д.)
+
+        Returns:
+            httpx.Response: HTTP ответ от сервера
+        """
+        return await self._send_request(method="POST", path=path, **kwargs)
+
+    async def put(self, path: str, **kwargs: Any) -> httpx.Response:
+        """
+        Выполнение PUT запроса.
+
+        Args:
+            path (str): Путь к эндпоинту API
+            **kwargs: Дополнительные параметры для HTTP запроса
+            (json, data, headers, timeout и т.д.)
+
+        Returns:
+            httpx.Response: HTTP ответ от сервера
+        """
+        return await self._send_request(method="PUT", path=path, **kwargs)
+
+    async def delete(self, path: str, **kwargs: Any) -> httpx.Response:
+        """
+        Выполнение DELETE запроса.
+
+        Args:
+            path (str): Путь к эндпоинту API
+            **kwargs: Дополнительные параметры для HTTP запроса
+            (headers, timeout и т.д.)
+
+        Returns:
+            httpx.Response: HTTP ответ от сервера
+        """
+        return await self._send_request(method="DELETE", path=path, **kwargs)
+
+    @async_allure_attach
+    async def _send_request(self, method: HttpMethod, path: str, **kwargs: Any) -> httpx.Response:
+        """
+        Внутренний метод для выполнения HTTP запросов.
+
+        Выполняет запрос, логирует детали запроса и ответа,
+        генерирует cURL команду для отладки.
+
+        Args:
+            method (HttpMethod): HTTP метод (GET, POST, PUT, DELETE)
+            path (str): Путь к эндпоинту API
+            **kwargs: Параметры для HTTP запроса
+
+        Returns:
+            httpx.Response: HTTP ответ от сервера
+        """
+        full_url = urljoin(self.host, path.lstrip("/"))
+
+        if self.performance_mode or self.disable_log:
+            rest_response = await self._request(method=method, url=full_url, path=path, **kwargs)
+            rest_response.raise_for_status()
+            return rest_response
+
+        log = self.log.bind(event_id=str(uuid.uuid4()))
+        log.msg(
+            event='Request',
+            method=method,
+            full_url=full_url,
+            params=snapshot(kwargs.get('params')),
+            headers=redact_headers(kwargs.get('headers')),
+            json=snapshot(kwargs.get('json')),
+            data=snapshot(kwargs.get('data')),
+        )
+
+        rest_response = await self._request(method=method, url=full_url, path=path, **kwargs)
+
+        log_sink.put(Lazy(_log_curl, rest_response.request))
+
+        log.msg(
+            event='Response',
+            status_code=rest_response.status_code,
+            headers=redact_headers(rest_response.headers),
+            json=Lazy(self._get_json, rest_response),
+        )
+
+        rest_response.raise_for_status()
+        return rest_response
+
+    async def _request(self, method: HttpMethod, url: str, path: str, **kwargs: Any) -> httpx.Response:
+        if self.metrics is None:
+            return await self.session.request(method=method, url=url, **kwargs)
+
+        marks: dict[str, float] = {}
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            marks[event_name.split('.', 1)[-1]] = time.perf_counter()
+
+        started = time.perf_counter()
+        rest_response = await self.session.request(
+            method=method, url=url, extensions={**kwargs.pop('extensions', {}), 'trace': trace}, **kwargs
+        )
+        total = time.perf_counter() - started
+
+        connect = None
+        if 'connect_tcp.started' in marks and 'connect_tcp.complete' in marks:
+            connect = marks['connect_tcp.complete'] - marks['connect_tcp.started']
+        headers_received = marks.get('receive_response_headers.complete')
+
+        self.metrics(
+            RequestMetric(
+                method=method,
+                endpoint=path_template(path),
+                status_code=rest_response.status_code,
+                total=total,
+                ttfb=headers_received - started if headers_received is not None else None,
+                connect=connect,
+                request_bytes=len(rest_response.request.content),
+                response_bytes=len(rest_response.content),
+            )
+        )
+        return rest_response
+
+    @staticmethod
+    def _get_json(rest_response: httpx.Response) -> dict[str, Any]:
+        """
+        Извлечение JSON данных из HTTP ответа.
+
+        Args:
+            rest_response (httpx.Response): HTTP ответ для извлечения JSON
+
+        Returns:
+            Dict[str, Any]: JSON данные или пустой словарь при ошибке
+        """
+        try:
+            return rest_response.json()
+        except JSONDecodeError:
+            return {}
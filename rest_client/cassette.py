@@ -0,0 +1,243 @@
+import json
+from collections import deque
+from pathlib import Path
+from threading import Lock
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from requests.adapters import BaseAdapter
+from requests.exceptions import ConnectionError
+from requests.models import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+
+
+class CassetteMiss(ConnectionError):
+    """
+    В кассете нет записанного ответа для запроса.
+    """
+
+
+def _normalize_url(url: str) -> str:
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit(('', '', parts.path, query, ''))
+
+
+def _normalize_body(body: bytes | str | None) -> str:
+    if not body:
+        return ''
+    if isinstance(body, bytes):
+        body = body.decode('utf-8', errors='replace')
+    try:
+        return json.dumps(json.loads(body), sort_keys=True, separators=(',', ':'))
+    except ValueError:
+        return body
+
+
+def request_key(method: str, url: str, body: bytes | str | None) -> tuple[str, str, str]:
+    """
+    Ключ запроса в кассете: метод, путь с отсортированными параметрами
+    и тело запроса (JSON приводится к каноническому виду).
+
+    Схема и адрес сервера в ключ не входят, поэтому кассета воспроизводится
+    на стенде с другим адресом или портом.
+
+    Args:
+        method (str): HTTP метод
+        url (str): Полный URL запроса
+        body (bytes | str | None): Тело запроса
+
+    Returns:
+        tuple[str, str, str]: Ключ запроса
+    """
+    return method.upper(), _normalize_url(url), _normalize_body(body)
+
+
+class Cassette:
+    """
+    JSONL кассета с парами запрос/ответ.
+
+    Каждая строка файла содержит один запрос и полученный на него ответ.
+    При чтении строится индекс по ключу запроса; одинаковые запросы
+    (например, повторные опросы Mailhog) воспроизводятся в порядке записи,
+    последний ответ повторяется.
+
+    Строки вида `{"meta": {...}}` хранят параметры запуска, от которых
+    зависят данные запросов (идентификатор запуска, seed генератора
+    тестовых данных), чтобы воспроизведение повторило те же запросы.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.meta: dict[str, Any] = {}
+        self._lock = Lock()
+        self._index: dict[tuple[str, str, str], deque[dict[str, Any]]] = {}
+        if self.path.exists():
+            with self.path.open(encoding='utf-8') as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    if 'meta' in entry:
+                        self.meta.update(entry['meta'])
+                    else:
+                        self._add(entry)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._index.values())
+
+    def _add(self, entry: dict[str, Any]) -> None:
+        key = request_key(entry['method'], entry['url'], entry.get('body'))
+        self._index.setdefault(key, deque()).append(entry)
+
+    def _append(self, entry: dict[str, Any]) -> None:
+        line = json.dumps(entry, ensure_ascii=False)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open('a', encoding='utf-8') as file:
+            file.write(line + '\n')
+
+    def write_meta(self, **values: Any) -> None:
+        """
+        Запись параметров запуска в кассету.
+
+        Args:
+            **values: Параметры запуска, значения должны сериализоваться в JSON
+        """
+        with self._lock:
+            self._append({'meta': values})
+            self.meta.update(values)
+
+    def rewrite(self, **values: Any) -> None:
+        """
+        Очистка кассеты перед новой записью.
+
+        Ранее записанные ответы и параметры запуска удаляются, в файл
+        записываются только новые параметры запуска.
+
+        Args:
+            **values: Параметры запуска, значения должны сериализоваться в JSON
+        """
+        with self._lock:
+            self._index.clear()
+            self.meta = {}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text('', encoding='utf-8')
+            self._append({'meta': values})
+            self.meta.update(values)
+
+    def record(self, request: PreparedRequest, response: Response) -> None:
+        """
+        Запись пары запрос/ответ в конец файла кассеты.
+
+        Args:
+            request (PreparedRequest): Отправленный запрос
+            response (Response): Полученный ответ
+        """
+        body = request.body
+        if isinstance(body, bytes):
+            body = body.decode('utf-8', errors='replace')
+        entry = {
+            'method': request.method,
+            'url': request.url,
+            'body': body,
+            'status_code': response.status_code,
+            'reason': response.reason,
+            'headers': dict(response.headers),
+            'response_body': response.content.decode('utf-8', errors='replace'),
+        }
+        with self._lock:
+            self._append(entry)
+            self._add(entry)
+
+    def play(self, request: PreparedRequest) -> dict[str, Any]:
+        """
+        Получение записанного ответа для запроса.
+
+        Args:
+            request (PreparedRequest): Запрос
+
+        Returns:
+            dict[str, Any]: Запись кассеты
+
+        Raises:
+            CassetteMiss: Если ответ для запроса не записан
+        """
+        key = request_key(request.method, request.url, request.body)
+        with self._lock:
+            entries = self._index.get(key)
+            if not entries:
+                raise CassetteMiss(f"В кассете {self.path} нет ответа для {key[0]} {key[1]}", request=request)
+            return entries.popleft() if len(entries) > 1 else entries[0]
+
+
+_cassettes: dict[Path, Cassette] = {}
+_cassettes_lock = Lock()
+
+
+def get_cassette(path: str | Path) -> Cassette:
+    """
+    Получение общей кассеты для файла.
+
+    Все клиенты, работающие с одним файлом, используют один индекс
+    и одну блокировку записи.
+
+    Args:
+        path (str | Path): Путь к файлу кассеты
+
+    Returns:
+        Cassette: Кассета
+    """
+    resolved = Path(path).resolve()
+    with _cassettes_lock:
+        cassette = _cassettes.get(resolved)
+        if cassette is None:
+            cassette = _cassettes[resolved] = Cassette(resolved)
+        return cassette
+
+
+class RecordingAdapter(BaseAdapter):
+    """
+    Транспорт, выполняющий реальный запрос и дописывающий его в кассету.
+    """
+
+    def __init__(self, cassette: Cassette, adapter: BaseAdapter):
+        super().__init__()
+        self.cassette = cassette
+        self.adapter = adapter
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        response = self.adapter.send(request, **kwargs)
+        response.connection = self
+        self.cassette.record(request, response)
+        return response
+
+    def close(self) -> None:
+        self.adapter.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Транспорт, отдающий ответы из кассеты без обращения к сети.
+    """
+
+    def __init__(self, cassette: Cassette):
+        super().__init__()
+        self.cassette = cassette
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        entry = self.cassette.play(request)
+
+        response = Response()
+        response.status_code = entry['status_code']
+        response.reason = entry.get('reason')
+        response.headers = CaseInsensitiveDict(entry.get('headers') or {})
+        response._content = entry.get('response_body', '').encode('utf-8')
+        response._content_consumed = True
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self) -> None:
+        pass
@@ -1,23 +1,51 @@
+import copy
+import time
 import uuid
-from typing import Literal, Any, Dict, Optional
+from threading import Lock
+from typing import Literal, Any, Callable, Dict, Optional
 from urllib.parse import urljoin
 
-import curlify
-import structlog
-from requests import session
+from requests import Session, session
 from requests.exceptions import JSONDecodeError
 from requests.models import Response
+from requests.structures import CaseInsensitiveDict
 
 from rest_client.configuration import Configuration
-from rest_client.utilites import allure_attach
+from rest_client.log_sink import Lazy, get_logger, log_sink, redact_curl, redact_headers, snapshot
+from rest_client.metrics import RequestMetric, path_template
+from rest_client.transport import get_adapter
+from rest_client.utilites import allure_attach, cache_json, get_curl
 
 HttpMethod = Literal["GET", "POST", "PUT", "DELETE"]
 
-structlog.configure(
-    processors=[
-        structlog.processors.JSONRenderer(indent=4, ensure_ascii=True)
-    ]
-)
+
+def _log_curl(response: Response) -> str:
+    return redact_curl(get_curl(response))
+
+
+class _LazySession:
+    """
+    Сессия requests, создаваемая при первом запросе.
+
+    Один экземпляр разделяется клиентом и всеми его копиями из `fork`.
+    """
+
+    def __init__(self, configuration: Configuration):
+        self.configuration = configuration
+        self._session: Session | None = None
+        self._lock = Lock()
+
+    def get(self) -> Session:
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    new_session = session()
+                    new_session.mount(self.configuration.host, get_adapter(self.configuration))
+                    new_session.verify = self.configuration.verify
+                    if not self.configuration.keep_alive:
+                        new_session.headers['Connection'] = 'close'
+                    self._session = new_session
+        return self._session
 
 
 class RestClient:
@@ -27,14 +55,55 @@ class RestClient:
     Предоставляет методы для выполнения HTTP запросов (GET, POST, PUT, DELETE)
     с автоматическим логированием, генерацией cURL команд и обработкой ответов.
     Поддерживает настройку заголовков, базового URL и отключение логирования.
+
+    Сессия и транспорт создаются при первом запросе. Заголовки клиента
+    хранятся отдельно от сессии и добавляются к каждому запросу, поэтому
+    копии из `fork` используют одну сессию, но свои заголовки.
     """
 
     def __init__(self, configuration: Configuration):
         self.host = configuration.host
-        self.set_headers(configuration.headers)
         self.disable_log = configuration.disable_log
-        self.session = session()
-        self.log = structlog.getLogger(__name__).bind(service='api')
+        self.performance_mode = configuration.performance_mode
+        self.metrics = configuration.metrics
+        self.retry_stats = configuration.retry_stats
+        self._lazy_session = _LazySession(configuration)
+        self.headers: CaseInsensitiveDict = CaseInsensitiveDict()
+        self._owns_headers = True
+        self.response_hooks: list[Callable[..., Any]] = []
+        self.set_headers(configuration.headers)
+        self._log = None
+
+    @property
+    def log(self) -> Any:
+        """
+        Логгер structlog клиента, создается при первом логируемом запросе.
+        """
+        if self._log is None:
+            self._log = get_logger(__name__).bind(service='api')
+        return self._log
+
+    @property
+    def session(self) -> Session:
+        """
+        Общая сессия requests клиента и его копий.
+        """
+        return self._lazy_session.get()
+
+    def fork(self) -> "RestClient":
+        """
+        Создание копии клиента с той же сессией и пулом соединений.
+
+        Заголовки копируются при первом изменении (copy-on-write),
+        поэтому авторизация в копии не влияет на исходный клиент и наоборот.
+
+        Returns:
+            RestClient: Копия клиента
+        """
+        clone = copy.copy(self)
+        self._owns_headers = clone._owns_headers = False
+        clone.response_hooks = list(self.response_hooks)
+        return clone
 
     def set_headers(self, headers: dict[str, str] | None) -> None:
         """
@@ -45,7 +114,10 @@ class RestClient:
             Если None, заголовки не изменяются
         """
         if headers:
-            self.session.headers.update(headers)
+            if not self._owns_headers:
+                self.headers = self.headers.copy()
+                self._owns_headers = True
+            self.headers.update(headers)
 
     def get(self, path: str, **kwargs: Any) -> Response:
         """
@@ -119,39 +191,63 @@ class RestClient:
         Returns:
             Response: HTTP ответ от сервера
         """
-        log = self.log.bind(event_id=str(uuid.uuid4()))
         full_url = urljoin(self.host, path.lstrip("/"))
+        if self.headers:
+            kwargs['headers'] = {**self.headers, **(kwargs.get('headers') or {})}
+        if self.response_hooks:
+            kwargs.setdefault('hooks', {'response': self.response_hooks})
 
-        if self.disable_log:
-            rest_response = self.session.request(method=method, url=full_url, **kwargs)
+        if self.performance_mode or self.disable_log:
+            rest_response = cache_json(self._request(method=method, url=full_url, path=path, **kwargs))
             rest_response.raise_for_status()
             return rest_response
 
+        log = self.log.bind(event_id=str(uuid.uuid4()))
         log.msg(
             event='Request',
             method=method,
             full_url=full_url,
-            params=kwargs.get('params'),
-            headers=kwargs.get('headers'),
-            json=kwargs.get('json'),
-            data=kwargs.get('data'),
+            params=snapshot(kwargs.get('params')),
+            headers=redact_headers(kwargs.get('headers')),
+            json=snapshot(kwargs.get('json')),
+            data=snapshot(kwargs.get('data')),
         )
 
-        rest_response = self.session.request(method=method, url=full_url, **kwargs)
+        rest_response = cache_json(self._request(method=method, url=full_url, path=path, **kwargs))
 
-        curl = curlify.to_curl(rest_response.request)
-        print(curl)
+        log_sink.put(Lazy(_log_curl, rest_response))
 
         log.msg(
             event='Response',
             status_code=rest_response.status_code,
-            headers=rest_response.headers,
-            json=self._get_json(rest_response=rest_response),
+            headers=redact_headers(rest_response.headers),
+            json=Lazy(self._get_json, rest_response),
         )
 
         rest_response.raise_for_status()
         return rest_response
 
+    def _request(self, method: HttpMethod, url: str, path: str, **kwargs: Any) -> Response:
+        if self.metrics is None:
+            return self.session.request(method=method, url=url, **kwargs)
+
+        started = time.perf_counter()
+        rest_response = self.session.request(method=method, url=url, **kwargs)
+        total = time.perf_counter() - started
+
+        self.metrics(
+            RequestMetric(
+                method=method,
+                endpoint=path_template(path),
+                status_code=rest_response.status_code,
+                total=total,
+                ttfb=rest_response.elapsed.total_seconds(),
+                request_bytes=len(rest_response.request.body or b''),
+                response_bytes=len(rest_response.content),
+            )
+        )
+        return rest_response
+
     @staticmethod
     def _get_json(rest_response: Response) -> dict[str, Any]:
         """
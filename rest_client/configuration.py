@@ -1,5 +1,79 @@
+from rest_client.metrics import MetricsHook
+from rest_client.retry import RetryStats, retry_stats as default_retry_stats
+
+
 class Configuration:
-    def __init__(self, host: str, headers: dict = None, disable_log: bool = False):
+    """
+    Настройки HTTP клиента.
+
+    Args:
+        host (str): Базовый URL сервиса
+        headers (dict | None): Заголовки по умолчанию
+        disable_log (bool): Отключение логирования запросов
+        pool_connections (int): Количество пулов соединений (по одному на хост)
+        pool_maxsize (int): Максимальное количество соединений в пуле хоста
+        max_retries (int): Количество повторов на уровне транспорта при ошибках
+            соединения и ответах с кодами из `retry_statuses`
+        keep_alive (bool): Переиспользование соединений между запросами
+        share_transport (bool): Общий пул соединений для всех клиентов одного хоста
+        performance_mode (bool): Режим без логирования, cURL и вложений Allure,
+            запрос стоит только сетевого обмена
+        cassette_path (str | None): Путь к JSONL кассете запросов
+        cassette_mode (str | None): `record` - записывать запросы в кассету,
+            `replay` - отвечать из кассеты без обращения к сети
+        metrics (MetricsHook | None): Обработчик метрик, вызывается после каждого
+            запроса с `RequestMetric`, например `LatencyMetrics`
+        retry_backoff (float): Базовая пауза экспоненциального backoff между повторами, сек
+        retry_backoff_max (float): Максимальная пауза между повторами, в том числе
+            из заголовка `Retry-After`, сек
+        retry_statuses (tuple[int, ...]): Коды ответов, после которых запрос повторяется
+        retry_post (bool): Повторять POST запросы. По умолчанию повторяются только
+            GET, DELETE, HEAD и OPTIONS
+        retry_put (bool): Повторять PUT запросы. Выключено по умолчанию: PUT
+            активации и сброса пароля расходуют токен
+        retry_stats (RetryStats | None): Счетчики повторов. По умолчанию общие
+            для процесса `rest_client.retry.retry_stats`
+        verify (bool): Проверка TLS сертификата сервера
+    """
+
+    def __init__(
+            self,
+            host: str,
+            headers: dict = None,
+            disable_log: bool = False,
+            pool_connections: int = 10,
+            pool_maxsize: int = 10,
+            max_retries: int = 3,
+            keep_alive: bool = True,
+            share_transport: bool = True,
+            performance_mode: bool = False,
+            cassette_path: str | None = None,
+            cassette_mode: str | None = None,
+            metrics: MetricsHook | None = None,
+            retry_backoff: float = 0.2,
+            retry_backoff_max: float = 5.0,
+            retry_statuses: tuple[int, ...] = (429, 502, 503, 504),
+            retry_post: bool = False,
+            retry_put: bool = False,
+            retry_stats: RetryStats | None = None,
+            verify: bool = True
+    ):
         self.host = host
         self.headers = headers
         self.disable_log = disable_log
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.keep_alive = keep_alive
+        self.share_transport = share_transport
+        self.performance_mode = performance_mode
+        self.cassette_path = cassette_path
+        self.cassette_mode = cassette_mode
+        self.metrics = metrics
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+        self.retry_statuses = tuple(retry_statuses)
+        self.retry_post = retry_post
+        self.retry_put = retry_put
+        self.retry_stats = default_retry_stats if retry_stats is None else retry_stats
+        self.verify = verify
@@ -0,0 +1,127 @@
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic.fields import FieldInfo
+from pydantic_core import from_json
+
+ModelT = TypeVar('ModelT', bound=BaseModel)
+
+_adapters: dict[tuple[type[BaseModel], str], TypeAdapter] = {}
+_fields: dict[type[BaseModel], dict[str, FieldInfo]] = {}
+
+
+def _model_fields(model: type[BaseModel]) -> dict[str, FieldInfo]:
+    fields = _fields.get(model)
+    if fields is None:
+        fields = _fields[model] = dict(model.model_fields)
+    return fields
+
+
+def _field_adapter(model: type[BaseModel], name: str, field: FieldInfo) -> TypeAdapter:
+    adapter = _adapters.get((model, name))
+    if adapter is None:
+        adapter = _adapters[(model, name)] = TypeAdapter(field.annotation)
+    return adapter
+
+
+def _nested_model(field: FieldInfo) -> type[BaseModel] | None:
+    annotation = field.annotation
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+class LazyModelView(Generic[ModelT]):
+    """
+    Ленивое представление ответа в виде модели pydantic.
+
+    JSON разбирается один раз, а поля модели валидируются только при первом
+    обращении: вложенные модели возвращаются как такие же ленивые
+    представления, остальные поля проверяются по аннотации поля модели.
+    Имена атрибутов совпадают с именами полей модели, поэтому проверки
+    `has_property`/`has_properties` работают без изменений.
+    Полная проверка (включая `extra="forbid"`) выполняется в `to_model()`.
+
+    Args:
+        model (type[ModelT]): Класс модели
+        data (dict[str, Any]): Разобранный JSON
+    """
+
+    __slots__ = ('_model', '_data', '_cache')
+
+    def __init__(self, model: type[ModelT], data: dict[str, Any]):
+        if not isinstance(data, dict):
+            model.model_validate(data)
+        object.__setattr__(self, '_model', model)
+        object.__setattr__(self, '_data', data)
+        object.__setattr__(self, '_cache', {})
+
+    def __getattr__(self, name: str) -> Any:
+        cache = self._cache
+        if name in cache:
+            return cache[name]
+
+        field = _model_fields(self._model).get(name)
+        if field is None:
+            raise AttributeError(f"{self._model.__name__} не содержит поля {name!r}")
+
+        key = field.alias or name
+        if key in self._data:
+            raw = self._data[key]
+        elif name in self._data:
+            raw = self._data[name]
+        elif not field.is_required():
+            cache[name] = value = field.get_default(call_default_factory=True)
+            return value
+        else:
+            self._model.model_validate(self._data)
+            raise AttributeError(name)
+
+        nested = _nested_model(field)
+        if nested is not None and isinstance(raw, dict):
+            value = LazyModelView(nested, raw)
+        else:
+            value = _field_adapter(self._model, name, field).validate_python(raw)
+        cache[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} только для чтения")
+
+    def __repr__(self) -> str:
+        return f"LazyModelView[{self._model.__name__}]({self._data!r})"
+
+    def to_model(self) -> ModelT:
+        """
+        Полная валидация данных моделью.
+
+        Returns:
+            ModelT: Экземпляр модели
+        """
+        return self._model.model_validate(self._data)
+
+
+def validate_envelope(model: type[ModelT], content: bytes, lazy: bool = False) -> ModelT | LazyModelView[ModelT]:
+    """
+    Валидация тела ответа моделью.
+
+    Args:
+        model (type[ModelT]): Класс модели ответа
+        content (bytes): Тело ответа
+        lazy (bool): Вернуть ленивое представление вместо полной валидации
+
+    Returns:
+        ModelT | LazyModelView[ModelT]: Модель или ленивое представление ответа
+
+    Raises:
+        ValidationError: Если тело ответа не является JSON или не соответствует модели
+    """
+    if not lazy:
+        return model.model_validate_json(content)
+    try:
+        data = from_json(content)
+    except ValueError:
+        # Та же ошибка `json_invalid`, что и при полной валидации.
+        model.model_validate_json(content)
+        raise
+    return LazyModelView(model, data)
@@ -0,0 +1,241 @@
+import atexit
+import copy
+import json
+import re
+import sys
+import traceback
+from queue import Queue
+from threading import Lock, Thread
+from typing import Any, Callable, TextIO
+
+
+class Lazy:
+    """
+    Отложенное значение для лога.
+
+    Вычисляется только фоновым обработчиком непосредственно перед выводом,
+    поэтому поток запроса не тратит время на сериализацию.
+    """
+
+    __slots__ = ('_function', '_args')
+
+    def __init__(self, function: Callable[..., Any], *args: Any):
+        self._function = function
+        self._args = args
+
+    def __call__(self) -> Any:
+        return self._function(*self._args)
+
+
+SENSITIVE_HEADERS = frozenset({'x-dm-auth-token', 'authorization', 'cookie', 'set-cookie'})
+REDACTED = '***'
+
+_curl_header = re.compile(
+    r"(-H ['\"](?:" + '|'.join(map(re.escape, SENSITIVE_HEADERS)) + r"):\s*)[^'\"]*",
+    re.IGNORECASE
+)
+
+
+def redact_headers(headers: Any) -> dict[str, Any] | None:
+    """
+    Копия заголовков для лога с замаскированными токенами авторизации.
+
+    Args:
+        headers (Any): Заголовки запроса или ответа (dict, CaseInsensitiveDict, httpx.Headers)
+
+    Returns:
+        dict[str, Any] | None: Заголовки, безопасные для вывода в лог
+    """
+    if headers is None:
+        return None
+    return {
+        name: REDACTED if name.lower() in SENSITIVE_HEADERS else value
+        for name, value in dict(headers).items()
+    }
+
+
+def redact_curl(curl: str) -> str:
+    """
+    cURL команда для лога с замаскированными токенами авторизации.
+
+    Args:
+        curl (str): cURL команда запроса
+
+    Returns:
+        str: cURL команда, безопасная для вывода в лог
+    """
+    return _curl_header.sub(lambda match: match.group(1) + REDACTED, curl)
+
+
+def snapshot(value: Any) -> Any:
+    """
+    Копия изменяемого значения на момент постановки события в очередь.
+
+    События выводятся фоновым потоком позже, поэтому словари и списки,
+    которые вызывающий код может изменить после запроса, копируются.
+
+    Args:
+        value (Any): Значение для лога
+
+    Returns:
+        Any: Копия словаря или списка, остальные значения без изменений
+    """
+    return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+
+class BackgroundLogSink:
+    """
+    Фоновый вывод логов через очередь.
+
+    Поток запроса только кладет событие в очередь. Форматирование
+    (`JSONRenderer(indent=4)`), вычисление `Lazy` значений и запись
+    в консоль выполняются в отдельном daemon-потоке. Ошибка форматирования
+    или записи события не останавливает поток: вместо события в
+    `sys.__stderr__` выводится сообщение об ошибке с трассировкой.
+    """
+
+    def __init__(self) -> None:
+        self._renderer: Callable[..., str] | None = None
+        self._queue: Queue[tuple[TextIO, Any]] = Queue()
+        self._thread: Thread | None = None
+        self._lock = Lock()
+
+    def put(self, item: dict[str, Any] | Lazy) -> None:
+        """
+        Постановка события в очередь вывода.
+
+        Поток вывода фиксируется в момент вызова, чтобы событие попало в тот же
+        `sys.stdout`, что и при синхронной записи (например, в захват pytest).
+
+        Args:
+            item (dict[str, Any] | Lazy): Событие structlog или отложенная строка
+        """
+        self._ensure_started()
+        self._queue.put((sys.stdout, item))
+
+    def flush(self) -> None:
+        """
+        Ожидание вывода всех событий из очереди.
+
+        Если поток вывода завершился, ожидание прекращается, а не
+        блокирует процесс навсегда.
+        """
+        thread = self._thread
+        if thread is None:
+            return
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks and thread.is_alive():
+                self._queue.all_tasks_done.wait(0.1)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = Thread(target=self._worker, name='rest-client-log-sink', daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _worker(self) -> None:
+        try:
+            import structlog
+            self._renderer = structlog.processors.JSONRenderer(indent=4, ensure_ascii=True)
+        except Exception:
+            self._report_error('structlog недоступен, события выводятся через json')
+            self._renderer = _render_json
+        while True:
+            file, item = self._queue.get()
+            try:
+                file.write(self._render(item) + '\n')
+            except Exception:
+                self._report_error('ошибка вывода события лога')
+            finally:
+                self._queue.task_done()
+
+    @staticmethod
+    def _report_error(message: str) -> None:
+        stderr = sys.__stderr__
+        if stderr is None:
+            return
+        try:
+            stderr.write(f"rest-client-log-sink: {message}\n{traceback.format_exc()}")
+            stderr.flush()
+        except Exception:
+            pass
+
+    def _render(self, item: dict[str, Any] | Lazy) -> str:
+        if isinstance(item, Lazy):
+            return str(item())
+        event_dict = {key: value() if isinstance(value, Lazy) else value for key, value in item.items()}
+        return self._renderer(None, '', event_dict)
+
+
+def _render_json(logger: Any, method_name: str, event_dict: dict[str, Any]) -> str:
+    """
+    Замена `JSONRenderer(indent=4)` structlog на стандартной библиотеке.
+    """
+    return json.dumps(event_dict, indent=4, ensure_ascii=True, default=repr)
+
+
+class QueueLogger:
+    """
+    Логгер structlog, передающий события в `BackgroundLogSink`.
+    """
+
+    def __init__(self, sink: BackgroundLogSink):
+        self._sink = sink
+
+    def msg(self, event_dict: dict[str, Any]) -> None:
+        self._sink.put(event_dict)
+
+    log = debug = info = warning = warn = error = critical = exception = fatal = msg
+
+
+class QueueLoggerFactory:
+
+    def __init__(self, sink: BackgroundLogSink):
+        self._sink = sink
+
+    def __call__(self, *args: Any) -> QueueLogger:
+        return QueueLogger(self._sink)
+
+
+def defer_rendering(logger: Any, method_name: str, event_dict: dict[str, Any]) -> tuple[tuple, dict]:
+    """
+    Финальный процессор structlog: передает событие логгеру без форматирования.
+    """
+    return (event_dict,), {}
+
+
+log_sink = BackgroundLogSink()
+
+
+_configure_lock = Lock()
+_configured = False
+
+
+def get_logger(name: str) -> Any:
+    """
+    Логгер structlog, передающий события в `log_sink`.
+
+    structlog импортируется и настраивается при первом вызове, а не при
+    импорте клиента, поэтому запуски с отключенным логированием его не
+    загружают.
+
+    Args:
+        name (str): Имя логгера
+
+    Returns:
+        Any: Логгер structlog
+    """
+    global _configured
+    import structlog
+    if not _configured:
+        with _configure_lock:
+            if not _configured:
+                structlog.configure(
+                    processors=[defer_rendering],
+                    logger_factory=QueueLoggerFactory(log_sink),
+                )
+                _configured = True
+    return structlog.getLogger(name)
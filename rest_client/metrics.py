@@ -0,0 +1,263 @@
+import json
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable
+
+_uuid_segment = re.compile(r'[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}')
+_id_segment = re.compile(r'(?<=/)(?:\d+|[^/]*(?:@|%40)[^/]*)(?=/|$)')
+
+
+def path_template(path: str) -> str:
+    """
+    Приведение пути запроса к шаблону эндпоинта.
+
+    Параметры запроса отбрасываются, UUID токены заменяются на `{token}`,
+    числовые сегменты, идентификаторы писем Mailhog и email адреса
+    (в том числе с закодированным `@`) - на `{id}`.
+
+    Args:
+        path (str): Путь запроса, например `/v1/account/5d7c...`
+
+    Returns:
+        str: Шаблон пути, например `/v1/account/{token}`
+    """
+    path = '/' + path.split('?', 1)[0].lstrip('/')
+    return _id_segment.sub('{id}', _uuid_segment.sub('{token}', path))
+
+
+class Histogram:
+    """
+    Гистограмма задержек в стиле HDR Histogram.
+
+    Значения хранятся в микросекундах в логарифмически-линейных корзинах:
+    значения меньше `2 ** precision_bits` хранятся точно, большие - с
+    относительной погрешностью не более `2 ** (1 - precision_bits)`.
+    Память зависит только от разброса значений, а не от их количества.
+
+    Args:
+        precision_bits (int): Точность корзин, 7 бит дают погрешность до 1.6%
+    """
+
+    def __init__(self, precision_bits: int = 7):
+        self.precision_bits = precision_bits
+        self._sub_buckets = 1 << precision_bits
+        self._half = self._sub_buckets >> 1
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min: int | None = None
+        self.max: int | None = None
+
+    def _index(self, value: int) -> int:
+        if value < self._sub_buckets:
+            return value
+        shift = value.bit_length() - self.precision_bits
+        return self._sub_buckets + (shift - 1) * self._half + (value >> shift) - self._half
+
+    def _value(self, index: int) -> int:
+        if index < self._sub_buckets:
+            return index
+        shift, top = divmod(index - self._sub_buckets, self._half)
+        shift += 1
+        top += self._half
+        return (top << shift) + (1 << shift) // 2
+
+    def record(self, seconds: float) -> None:
+        """
+        Добавление значения.
+
+        Args:
+            seconds (float): Значение в секундах
+        """
+        value = max(int(seconds * 1_000_000), 0)
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "Histogram") -> None:
+        """
+        Добавление значений другой гистограммы с той же точностью.
+
+        Args:
+            other (Histogram): Гистограмма для объединения
+        """
+        if other.precision_bits != self.precision_bits:
+            raise ValueError("Нельзя объединить гистограммы с разной точностью")
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, rank: float) -> float:
+        """
+        Значение перцентиля.
+
+        Args:
+            rank (float): Ранг в процентах, например 99
+
+        Returns:
+            float: Значение в секундах или 0 для пустой гистограммы
+        """
+        if not self.count:
+            return 0.0
+        target = max(int(rank / 100 * self.count + 0.999999), 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(max(self._value(index), self.min), self.max) / 1_000_000
+        return self.max / 1_000_000
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count / 1_000_000 if self.count else 0.0
+
+    @property
+    def sum(self) -> float:
+        return self.total / 1_000_000
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            'count': self.count,
+            'sum_s': self.sum,
+            'mean_ms': self.mean * 1000,
+            'p50_ms': self.percentile(50) * 1000,
+            'p95_ms': self.percentile(95) * 1000,
+            'p99_ms': self.percentile(99) * 1000,
+            'max_ms': (self.max or 0) / 1000,
+        }
+
+
+@dataclass(frozen=True)
+class RequestMetric:
+    """
+    Измерения одного HTTP запроса.
+
+    Attributes:
+        method (str): HTTP метод
+        endpoint (str): Шаблон пути, см. `path_template`
+        status_code (int): Код ответа
+        total (float): Полное время запроса, сек
+        ttfb (float | None): Время до получения заголовков ответа, сек
+        connect (float | None): Время установки соединения (включая DNS),
+            сек; None, если соединение было переиспользовано или транспорт не сообщает его
+        request_bytes (int): Размер тела запроса
+        response_bytes (int): Размер тела ответа
+    """
+    method: str
+    endpoint: str
+    status_code: int
+    total: float
+    ttfb: float | None = None
+    connect: float | None = None
+    request_bytes: int = 0
+    response_bytes: int = 0
+
+
+MetricsHook = Callable[[RequestMetric], None]
+
+
+@dataclass
+class EndpointMetrics:
+    """
+    Накопленные измерения одного эндпоинта.
+    """
+    total: Histogram = field(default_factory=Histogram)
+    ttfb: Histogram = field(default_factory=Histogram)
+    connect: Histogram = field(default_factory=Histogram)
+    statuses: Counter = field(default_factory=Counter)
+    request_bytes: int = 0
+    response_bytes: int = 0
+
+    def add(self, metric: RequestMetric) -> None:
+        self.total.record(metric.total)
+        if metric.ttfb is not None:
+            self.ttfb.record(metric.ttfb)
+        if metric.connect is not None:
+            self.connect.record(metric.connect)
+        self.statuses[metric.status_code] += 1
+        self.request_bytes += metric.request_bytes
+        self.response_bytes += metric.response_bytes
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            'total': self.total.summary(),
+            'ttfb': self.ttfb.summary(),
+            'connect': self.connect.summary(),
+            'statuses': {str(status): count for status, count in sorted(self.statuses.items())},
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes,
+        }
+
+
+class LatencyMetrics:
+    """
+    Потокобезопасный сборщик метрик запросов по эндпоинтам.
+
+    Экземпляр передается в `Configuration(metrics=...)` и вызывается
+    клиентом после каждого запроса.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.endpoints: dict[tuple[str, str], EndpointMetrics] = {}
+
+    def __call__(self, metric: RequestMetric) -> None:
+        key = (metric.method, metric.endpoint)
+        with self._lock:
+            endpoint = self.endpoints.get(key)
+            if endpoint is None:
+                endpoint = self.endpoints[key] = EndpointMetrics()
+            endpoint.add(metric)
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """
+        Сводка по эндпоинтам, отсортированная по суммарному времени запросов.
+
+        Returns:
+            dict[str, dict[str, Any]]: Сводка по ключу `<метод> <шаблон пути>`
+        """
+        with self._lock:
+            ordered = sorted(self.endpoints.items(), key=lambda item: item[1].total.total, reverse=True)
+            return {f"{method} {endpoint}": metrics.summary() for (method, endpoint), metrics in ordered}
+
+    def export(self, path: str | Path) -> None:
+        """
+        Сохранение сводки в JSON файл.
+
+        Args:
+            path (str | Path): Путь к файлу
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.summary(), ensure_ascii=False, indent=2), encoding='utf-8')
+
+    def format(self, limit: int | None = None) -> str:
+        """
+        Текстовая таблица эндпоинтов по убыванию суммарного времени.
+
+        Args:
+            limit (int | None): Количество строк
+
+        Returns:
+            str: Таблица
+        """
+        lines = [f"{'Эндпоинт':<40} {'count':>6} {'sum s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}  statuses"]
+        for name, summary in list(self.summary().items())[:limit]:
+            total = summary['total']
+            statuses = ' '.join(f"{status}:{count}" for status, count in summary['statuses'].items())
+            lines.append(
+                f"{name:<40} {total['count']:>6} {total['sum_s']:>8.2f} {total['p50_ms']:>8.1f} "
+                f"{total['p95_ms']:>8.1f} {total['p99_ms']:>8.1f}  {statuses}"
+            )
+        return '\n'.join(lines)
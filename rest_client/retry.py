@@ -0,0 +1,130 @@
+from collections import Counter
+from threading import Lock
+from typing import Any
+
+from urllib3.util.retry import Retry
+
+DEFAULT_RETRY_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'DELETE'})
+
+
+class RetryStats:
+    """
+    Счетчики повторов запросов на уровне транспорта.
+
+    Повторы учитываются по паре (метод, причина), где причина - код
+    ответа или имя исключения соединения.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.counts: Counter[tuple[str, str]] = Counter()
+
+    def record(self, method: str | None, reason: str) -> None:
+        with self._lock:
+            self.counts[(method or '?', reason)] += 1
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def snapshot(self) -> dict[str, int]:
+        """
+        Копия счетчиков для отчета.
+
+        Returns:
+            dict[str, int]: Количество повторов по ключу `<метод> <причина>`
+        """
+        with self._lock:
+            return {f"{method} {reason}": count for (method, reason), count in self.counts.most_common()}
+
+    def format(self) -> str:
+        return ', '.join(f"{key}: {count}" for key, count in self.snapshot().items())
+
+
+retry_stats = RetryStats()
+
+
+class CountingRetry(Retry):
+    """
+    `Retry` urllib3, который записывает каждый повтор в `RetryStats`.
+
+    Значение `Retry-After` ограничивается `backoff_max`, чтобы ответ стенда
+    не мог остановить тест на произвольное время.
+
+    Args:
+        stats (RetryStats | None): Счетчики повторов
+        *args, **kwargs: Параметры `urllib3.util.retry.Retry`
+    """
+
+    def __init__(self, *args: Any, stats: RetryStats | None = None, **kwargs: Any):
+        self.stats = stats
+        super().__init__(*args, **kwargs)
+
+    def new(self, **kwargs: Any) -> "CountingRetry":
+        retry = super().new(**kwargs)
+        retry.stats = self.stats
+        return retry
+
+    def increment(self, method: str | None = None, url: str | None = None, response: Any = None,
+                  error: Exception | None = None, *args: Any, **kwargs: Any) -> "CountingRetry":
+        retry = super().increment(method, url, response, error, *args, **kwargs)
+        if self.stats is not None:
+            reason = str(response.status) if response is not None and error is None else type(error).__name__
+            self.stats.record(method, reason)
+        return retry
+
+    def get_retry_after(self, response: Any) -> float | None:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.backoff_max)
+
+
+def create_retry(
+        total: int,
+        backoff: float,
+        backoff_max: float,
+        statuses: tuple[int, ...],
+        retry_post: bool = False,
+        retry_put: bool = False,
+        stats: RetryStats | None = None
+) -> CountingRetry:
+    """
+    Политика повторов для транспортного адаптера.
+
+    Ошибки соединения, тайм-ауты чтения и ответы с кодами из `statuses`
+    повторяются для GET, HEAD, OPTIONS и DELETE. POST и PUT повторяются
+    только при `retry_post=True` и `retry_put=True`: PUT активации и сброса
+    пароля расходуют токен, и повтор запроса, который уже дошел до сервера,
+    получил бы ошибку вместо результата. Пауза между попытками растет экспоненциально
+    (`backoff * 2 ** (попытка - 1)`, не больше `backoff_max`) или берется
+    из заголовка `Retry-After`. После исчерпания попыток возвращается
+    последний ответ, чтобы его код проверил вызывающий код.
+
+    Args:
+        total (int): Максимальное количество повторов
+        backoff (float): Базовая пауза экспоненциального backoff, сек
+        backoff_max (float): Максимальная пауза между попытками, сек
+        statuses (tuple[int, ...]): Коды ответов, после которых запрос повторяется
+        retry_post (bool): Повторять POST запросы
+        retry_put (bool): Повторять PUT запросы
+        stats (RetryStats | None): Счетчики повторов
+
+    Returns:
+        CountingRetry: Политика повторов
+    """
+    methods = set(DEFAULT_RETRY_METHODS)
+    if retry_post:
+        methods.add('POST')
+    if retry_put:
+        methods.add('PUT')
+    return CountingRetry(
+        total=total,
+        allowed_methods=frozenset(methods),
+        status_forcelist=statuses,
+        backoff_factor=backoff,
+        backoff_max=backoff_max,
+        raise_on_status=False,
+        respect_retry_after_header=True,
+        stats=stats,
+    )
@@ -0,0 +1,108 @@
+from threading import Lock
+
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from rest_client.cassette import RecordingAdapter, ReplayAdapter, get_cassette
+from rest_client.configuration import Configuration
+from rest_client.retry import create_retry
+
+_adapters: dict[tuple, HTTPAdapter] = {}
+_adapters_lock = Lock()
+
+
+def _adapter_key(configuration: Configuration) -> tuple:
+    return (
+        configuration.host,
+        configuration.pool_connections,
+        configuration.pool_maxsize,
+        configuration.max_retries,
+        configuration.retry_backoff,
+        configuration.retry_backoff_max,
+        configuration.retry_statuses,
+        configuration.retry_post,
+        configuration.retry_put,
+        id(configuration.retry_stats),
+    )
+
+
+def _create_adapter(configuration: Configuration) -> HTTPAdapter:
+    return HTTPAdapter(
+        pool_connections=configuration.pool_connections,
+        pool_maxsize=configuration.pool_maxsize,
+        max_retries=create_retry(
+            total=configuration.max_retries,
+            backoff=configuration.retry_backoff,
+            backoff_max=configuration.retry_backoff_max,
+            statuses=configuration.retry_statuses,
+            retry_post=configuration.retry_post,
+            retry_put=configuration.retry_put,
+            stats=configuration.retry_stats,
+        ),
+    )
+
+
+def get_adapter(configuration: Configuration) -> BaseAdapter:
+    """
+    Получение транспортного адаптера для клиента.
+
+    В режимах кассеты `record` и `replay` возвращает адаптер записи или
+    воспроизведения, иначе - адаптер с пулом соединений хоста.
+
+    Args:
+        configuration (Configuration): Настройки клиента
+
+    Returns:
+        BaseAdapter: Адаптер для монтирования в `requests.Session`
+
+    Raises:
+        ValueError: Если режим кассеты неизвестен или не указан путь к кассете
+    """
+    if configuration.cassette_mode is None:
+        return get_pooled_adapter(configuration)
+
+    if configuration.cassette_mode not in ('record', 'replay'):
+        raise ValueError(f"Неизвестный режим кассеты: {configuration.cassette_mode}")
+    if not configuration.cassette_path:
+        raise ValueError("Для режима кассеты требуется cassette_path")
+
+    cassette = get_cassette(configuration.cassette_path)
+    if configuration.cassette_mode == 'replay':
+        return ReplayAdapter(cassette)
+    return RecordingAdapter(cassette, get_pooled_adapter(configuration))
+
+
+def get_pooled_adapter(configuration: Configuration) -> HTTPAdapter:
+    """
+    Получение транспортного адаптера с пулом соединений для хоста.
+
+    Адаптер повторяет запросы по политике `rest_client.retry.create_retry`.
+    При `share_transport=True` адаптер создается один раз на хост и набор
+    настроек пула и повторов, и все клиенты этого хоста переиспользуют уже открытые
+    соединения. Сессии клиентов при этом остаются раздельными, поэтому
+    заголовки авторизации не смешиваются.
+
+    Args:
+        configuration (Configuration): Настройки клиента
+
+    Returns:
+        HTTPAdapter: Адаптер для монтирования в `requests.Session`
+    """
+    if not configuration.share_transport:
+        return _create_adapter(configuration)
+
+    key = _adapter_key(configuration)
+    with _adapters_lock:
+        adapter = _adapters.get(key)
+        if adapter is None:
+            adapter = _adapters[key] = _create_adapter(configuration)
+        return adapter
+
+
+def close_adapters() -> None:
+    """
+    Закрытие всех общих пулов соединений.
+    """
+    with _adapters_lock:
+        for adapter in _adapters.values():
+            adapter.close()
+        _adapters.clear()
@@ -1,40 +1,202 @@
 import json
+from functools import wraps
+from typing import Any
 
-import allure
-import curlify
+from requests.models import Response
+
+
+class JsonCachingResponse(Response):
+    """
+    Ответ requests, который разбирает JSON тела один раз.
+
+    Клиент, логирование и вложения Allure обращаются к `json()` несколько
+    раз за запрос, поэтому результат разбора (или ошибка разбора)
+    сохраняется на объекте ответа.
+    """
+
+    def json(self, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().json(**kwargs)
+        try:
+            cached = self.__dict__['_json_cache']
+        except KeyError:
+            try:
+                cached = super().json()
+            except json.JSONDecodeError as error:
+                cached = error
+            self.__dict__['_json_cache'] = cached
+        if isinstance(cached, json.JSONDecodeError):
+            raise cached
+        return cached
+
+
+def cache_json(response: Response) -> Response:
+    """
+    Включение кэширования разобранного JSON для ответа requests.
+
+    Args:
+        response (Response): HTTP ответ
+
+    Returns:
+        Response: Тот же объект ответа с кэшируемым `json()`
+    """
+    response.__class__ = JsonCachingResponse
+    return response
+
+
+def get_curl(response: Response) -> str:
+    """
+    Получение cURL команды запроса с кэшированием на объекте ответа.
+
+    Args:
+        response (Response): HTTP ответ
+
+    Returns:
+        str: cURL команда запроса
+    """
+    curl = response.__dict__.get('_curl_cache')
+    if curl is None:
+        import curlify
+        curl = response.__dict__['_curl_cache'] = curlify.to_curl(response.request)
+    return curl
+
+
+def step(title: str):
+    """
+    Ленивый аналог `allure.step` для методов клиентов и хелперов.
+
+    allure импортируется и оборачивает функцию при первом вызове, а не при
+    импорте модуля, поэтому короткие запуски без отчетов не тратят время
+    на загрузку allure. Поведение шага, включая параметры вызова в отчете,
+    совпадает с `allure.step`.
+
+    Args:
+        title (str): Название шага в отчете Allure
+    """
+
+    def decorator(fn):
+        stepped = None
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            nonlocal stepped
+            if stepped is None:
+                import allure
+                stepped = allure.step(title)(fn)
+            return stepped(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
 
 
 def allure_attach(fn):
+    @wraps(fn)
     def wrapper(*args, **kwargs):
-        body = kwargs.get('json')
-        if body:
-            allure.attach(
-                json.dumps(body, indent=4),
-                name="request_body",
-                attachment_type=allure.attachment_type.JSON
-            )
+        if args[0].performance_mode:
+            return fn(*args, **kwargs)
+
+        import allure
+        _attach_request_body(kwargs)
         response = fn(*args, **kwargs)
 
-        curl = curlify.to_curl(response.request)
+        curl = get_curl(response)
         allure.attach(curl, name="curl", attachment_type=allure.attachment_type.TEXT)
+        _attach_response_body(response)
 
-        try:
-            response_json = response.json()
-        except json.decoder.JSONDecodeError:
-            response_text = response.text
-            status_code = f"status_code: {response.status_code}"
-            allure.attach(
-                response_text if len(response_text) > 0 else status_code,
-                name="response_body",
-                attachment_type=allure.attachment_type.TEXT
-            )
-        else:
-            allure.attach(
-                json.dumps(response_json, indent=4),
-                name="response_body",
-                attachment_type=allure.attachment_type.JSON
-            )
+        return response
+
+    return wrapper
+
+
+def async_allure_attach(fn):
+    @wraps(fn)
+    async def wrapper(*args, **kwargs):
+        if args[0].performance_mode:
+            return await fn(*args, **kwargs)
+
+        import allure
+        _attach_request_body(kwargs)
+        response = await fn(*args, **kwargs)
+
+        curl = httpx_to_curl(response.request)
+        allure.attach(curl, name="curl", attachment_type=allure.attachment_type.TEXT)
+        _attach_response_body(response)
 
         return response
 
     return wrapper
+
+
+def async_step(title: str):
+    """
+    Аналог `allure.step` для корутин.
+
+    `allure.step` закрывает шаг сразу после создания корутины, поэтому
+    для async методов шаг открывается внутри обертки на время await.
+
+    Args:
+        title (str): Название шага в отчете Allure
+    """
+
+    def decorator(fn):
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            import allure
+            with allure.step(title):
+                return await fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def httpx_to_curl(request: Any) -> str:
+    """
+    Генерация cURL команды для запроса httpx.
+
+    Args:
+        request (httpx.Request): Отправленный запрос
+
+    Returns:
+        str: cURL команда
+    """
+    parts = [f"curl -X {request.method}"]
+    for name, value in request.headers.items():
+        parts.append(f"-H '{name}: {value}'")
+    body = request.content.decode(errors='replace')
+    if body:
+        parts.append(f"-d '{body}'")
+    parts.append(f"'{request.url}'")
+    return ' '.join(parts)
+
+
+def _attach_request_body(kwargs: dict[str, Any]) -> None:
+    body = kwargs.get('json')
+    if body:
+        import allure
+        allure.attach(
+            json.dumps(body, indent=4),
+            name="request_body",
+            attachment_type=allure.attachment_type.JSON
+        )
+
+
+def _attach_response_body(response: Any) -> None:
+    import allure
+    try:
+        response_json = response.json()
+    except json.decoder.JSONDecodeError:
+        response_text = response.text
+        status_code = f"status_code: {response.status_code}"
+        allure.attach(
+            response_text if len(response_text) > 0 else status_code,
+            name="response_body",
+            attachment_type=allure.attachment_type.TEXT
+        )
+    else:
+        allure.attach(
+            json.dumps(response_json, indent=4),
+            name="response_body",
+            attachment_type=allure.attachment_type.JSON
+        )
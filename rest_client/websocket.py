@@ -0,0 +1,233 @@
+import base64
+import hashlib
+import os
+import socket
+import ssl
+import struct
+from typing import BinaryIO, Iterator
+from urllib.parse import urlsplit
+
+OPCODE_CONTINUATION = 0x0
+OPCODE_TEXT = 0x1
+OPCODE_BINARY = 0x2
+OPCODE_CLOSE = 0x8
+OPCODE_PING = 0x9
+OPCODE_PONG = 0xA
+
+_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+
+class WebSocketError(ConnectionError):
+    """
+    Ошибка протокола WebSocket или разрыв соединения.
+    """
+
+
+def accept_key(key: str) -> str:
+    """
+    Значение `Sec-WebSocket-Accept` для ключа рукопожатия.
+
+    Args:
+        key (str): Значение `Sec-WebSocket-Key`
+
+    Returns:
+        str: Ожидаемое значение `Sec-WebSocket-Accept`
+    """
+    return base64.b64encode(hashlib.sha1((key + _GUID).encode()).digest()).decode()
+
+
+def encode_frame(payload: bytes, opcode: int = OPCODE_TEXT, mask: bool = True) -> bytes:
+    """
+    Кодирование одного завершенного фрейма.
+
+    Args:
+        payload (bytes): Данные фрейма
+        opcode (int): Код операции
+        mask (bool): Маскировать данные (обязательно для фреймов клиента)
+
+    Returns:
+        bytes: Фрейм для отправки в сокет
+    """
+    length = len(payload)
+    header = bytearray([0x80 | opcode])
+    mask_bit = 0x80 if mask else 0
+    if length < 126:
+        header.append(mask_bit | length)
+    elif length < 1 << 16:
+        header.append(mask_bit | 126)
+        header += struct.pack('!H', length)
+    else:
+        header.append(mask_bit | 127)
+        header += struct.pack('!Q', length)
+
+    if not mask:
+        return bytes(header) + payload
+    key = os.urandom(4)
+    return bytes(header) + key + bytes(byte ^ key[index % 4] for index, byte in enumerate(payload))
+
+
+def _read_exact(reader: BinaryIO, size: int) -> bytes:
+    data = reader.read(size)
+    if data is None or len(data) < size:
+        raise WebSocketError("Соединение WebSocket закрыто")
+    return data
+
+
+def read_frame(reader: BinaryIO) -> tuple[bool, int, bytes]:
+    """
+    Чтение одного фрейма.
+
+    Args:
+        reader (BinaryIO): Буферизованный поток сокета
+
+    Returns:
+        tuple[bool, int, bytes]: Признак последнего фрагмента, код операции и данные
+
+    Raises:
+        WebSocketError: Если соединение закрыто посреди фрейма
+    """
+    first, second = _read_exact(reader, 2)
+    length = second & 0x7F
+    if length == 126:
+        length = struct.unpack('!H', _read_exact(reader, 2))[0]
+    elif length == 127:
+        length = struct.unpack('!Q', _read_exact(reader, 8))[0]
+
+    key = _read_exact(reader, 4) if second & 0x80 else None
+    payload = _read_exact(reader, length) if length else b''
+    if key is not None:
+        payload = bytes(byte ^ key[index % 4] for index, byte in enumerate(payload))
+    return bool(first & 0x80), first & 0x0F, payload
+
+
+class WebSocketClient:
+    """
+    Минимальный клиент WebSocket (RFC 6455) на стандартной библиотеке.
+
+    Поддерживает только получение сообщений сервера: отвечает на ping,
+    собирает фрагментированные сообщения и завершает работу по фрейму
+    close. `close()` можно вызывать из другого потока, чтобы прервать
+    блокирующее чтение.
+
+    Args:
+        url (str): Адрес `ws://` или `wss://`
+        timeout (float | None): Таймаут установки соединения и рукопожатия, сек
+    """
+
+    def __init__(self, url: str, timeout: float | None = 10.0):
+        self.url = url
+        self.timeout = timeout
+        self._socket: socket.socket | None = None
+        self._reader: BinaryIO | None = None
+
+    def connect(self) -> "WebSocketClient":
+        """
+        Установка соединения и рукопожатие.
+
+        Returns:
+            WebSocketClient: Текущий клиент
+
+        Raises:
+            WebSocketError: Если сервер не перешел на протокол WebSocket
+        """
+        parts = urlsplit(self.url)
+        secure = parts.scheme in ('wss', 'https')
+        port = parts.port or (443 if secure else 80)
+        sock = socket.create_connection((parts.hostname, port), timeout=self.timeout)
+        if secure:
+            sock = ssl.create_default_context().wrap_socket(sock, server_hostname=parts.hostname)
+
+        key = base64.b64encode(os.urandom(16)).decode()
+        path = (parts.path or '/') + (f'?{parts.query}' if parts.query else '')
+        request = (
+            f"GET {path} HTTP/1.1\r\n"
+            f"Host: {parts.netloc}\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\n"
+            "Sec-WebSocket-Version: 13\r\n\r\n"
+        )
+        sock.sendall(request.encode())
+        reader = sock.makefile('rb')
+
+        status = reader.readline().decode('latin-1').split(' ', 2)
+        headers = {}
+        while True:
+            line = reader.readline().decode('latin-1').strip()
+            if not line:
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if len(status) < 2 or status[1] != '101' or headers.get('sec-websocket-accept') != accept_key(key):
+            reader.close()
+            sock.close()
+            raise WebSocketError(f"Сервер {self.url} отклонил рукопожатие WebSocket: {' '.join(status).strip()}")
+
+        sock.settimeout(None)
+        self._socket, self._reader = sock, reader
+        return self
+
+    def recv(self) -> str | bytes | None:
+        """
+        Получение следующего сообщения сервера.
+
+        Returns:
+            str | bytes | None: Текстовое или бинарное сообщение, None после закрытия соединения
+        """
+        if self._reader is None:
+            return None
+
+        opcode, parts = None, []
+        try:
+            while True:
+                fin, frame_opcode, payload = read_frame(self._reader)
+                if frame_opcode == OPCODE_PING:
+                    self._socket.sendall(encode_frame(payload, OPCODE_PONG))
+                    continue
+                if frame_opcode == OPCODE_PONG:
+                    continue
+                if frame_opcode == OPCODE_CLOSE:
+                    self._socket.sendall(encode_frame(payload[:2], OPCODE_CLOSE))
+                    self.close()
+                    return None
+                if frame_opcode != OPCODE_CONTINUATION:
+                    opcode = frame_opcode
+                parts.append(payload)
+                if fin:
+                    break
+        except (OSError, ValueError, AttributeError):
+            self.close()
+            return None
+
+        message = b''.join(parts)
+        return message.decode() if opcode == OPCODE_TEXT else message
+
+    def __iter__(self) -> Iterator[str | bytes]:
+        while (message := self.recv()) is not None:
+            yield message
+
+    def close(self) -> None:
+        """
+        Закрытие соединения.
+        """
+        sock, self._socket = self._socket, None
+        reader, self._reader = self._reader, None
+        if sock is None:
+            return
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        sock.close()
+        if reader is not None:
+            try:
+                reader.close()
+            except OSError:
+                pass
+
+    def __enter__(self) -> "WebSocketClient":
+        return self.connect()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
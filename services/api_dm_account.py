@@ -1,3 +1,5 @@
+import copy
+
 from dm_api_account.apis.account_api import AccountApi
 from dm_api_account.apis.login_api import LoginApi
 from rest_client.configuration import Configuration
@@ -9,3 +11,15 @@ class ApiDmAccount:
         self.configuration = configuration
         self.login_api = LoginApi(configuration=self.configuration)
         self.account_api = AccountApi(configuration=self.configuration)
+
+    def fork(self) -> "ApiDmAccount":
+        """
+        Копия сервиса с общими сессиями и собственными заголовками клиентов.
+
+        Returns:
+            ApiDmAccount: Копия сервиса
+        """
+        clone = copy.copy(self)
+        clone.login_api = self.login_api.fork()
+        clone.account_api = self.account_api.fork()
+        return clone
@@ -1,3 +1,5 @@
+import copy
+
 from mailhog_api.apis.mailhog_api import MailhogApi
 from rest_client.configuration import Configuration
 
@@ -7,3 +9,14 @@ class ApiMailhog:
     def __init__(self, configuration: Configuration):
         self.configuration = configuration
         self.mailhog_api = MailhogApi(configuration=self.configuration)
+
+    def fork(self) -> "ApiMailhog":
+        """
+        Копия сервиса с общей сессией.
+
+        Returns:
+            ApiMailhog: Копия сервиса
+        """
+        clone = copy.copy(self)
+        clone.mailhog_api = self.mailhog_api.fork()
+        return clone
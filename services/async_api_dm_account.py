@@ -0,0 +1,15 @@
+from dm_api_account.apis.async_account_api import AsyncAccountApi
+from dm_api_account.apis.async_login_api import AsyncLoginApi
+from rest_client.configuration import Configuration
+
+
+class AsyncApiDmAccount:
+
+    def __init__(self, configuration: Configuration):
+        self.configuration = configuration
+        self.login_api = AsyncLoginApi(configuration=self.configuration)
+        self.account_api = AsyncAccountApi(configuration=self.configuration)
+
+    async def aclose(self) -> None:
+        await self.login_api.aclose()
+        await self.account_api.aclose()
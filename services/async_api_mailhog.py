@@ -0,0 +1,12 @@
+from mailhog_api.apis.async_mailhog_api import AsyncMailhogApi
+from rest_client.configuration import Configuration
+
+
+class AsyncApiMailhog:
+
+    def __init__(self, configuration: Configuration):
+        self.configuration = configuration
+        self.mailhog_api = AsyncMailhogApi(configuration=self.configuration)
+
+    async def aclose(self) -> None:
+        await self.mailhog_api.aclose()
@@ -1,13 +1,25 @@
+import random
 from collections import namedtuple
-from datetime import datetime
 from pathlib import Path
 
 import pytest
 from faker import Faker
 from vyper import v
 
+from dm_api_account.models.Registration import Registration
 from helpers.account_helper import AccountHelper
+from helpers.auth_token_cache import AuthTokenCache
+from helpers.data_namespace import DataNamespace, xdist_worker_id
+from helpers.mail_listener import MailListener
+from helpers.mailbox_index import MailboxIndex
+from helpers.parallel_runner import run_workers, shard
+from helpers.user_pool import UserPool, UserPoolStore
+from local_stand.stand import LocalStand
+from rest_client.cassette import get_cassette
 from rest_client.configuration import Configuration
+from rest_client.log_sink import log_sink
+from rest_client.metrics import LatencyMetrics
+from rest_client.retry import RetryStats
 from services.api_dm_account import ApiDmAccount
 from services.api_mailhog import ApiMailhog
 
@@ -30,39 +42,302 @@ def set_config(request):
         v.set(f"{option}", request.config.getoption(f"--{option}"))
 
 
+@pytest.fixture(scope="session", autouse=True)
+def local_stand(set_config):
+    if not v.get('stand.local'):
+        yield None
+        return
+
+    stand = LocalStand(dm_api_account_url=v.get('service.dm_api_account'), mailhog_url=v.get('service.mailhog'))
+    stand.store.add_user(login=v.get('user.login'), password=v.get('user.password'),
+                         email=f"{v.get('user.login')}@mail.ru")
+    with stand:
+        v.set('service.dm_api_account', stand.dm_api_account_url)
+        v.set('service.mailhog', stand.mailhog_url)
+        yield stand
+
+
+@pytest.fixture(autouse=True)
+def flush_logs():
+    yield
+    log_sink.flush()
+
+
 def pytest_addoption(parser):
     parser.addoption("--env", action="store", default="dev", help="run dev")
+    parser.addoption("--cassette", action="store", default=None, help="путь к JSONL кассете запросов")
+    parser.addoption(
+        "--cassette-mode", action="store", default=None, choices=("record", "replay"),
+        help="record - записывать запросы в кассету, replay - отвечать из кассеты без сети"
+    )
+
+    parser.addoption("--user-pool-size", action="store", type=int, default=5, help="размер пула пользователей")
+    parser.addoption(
+        "--user-pool-store", action="store", default=None,
+        help="файл пула пользователей, по умолчанию .user_pool/<env>.jsonl (для локального стенда - в памяти)"
+    )
+
+    parser.addoption(
+        "--auth-token-cache", action="store", default=None,
+        help="файл кэша токенов авторизации, общий для параллельных воркеров (по умолчанию - в памяти)"
+    )
+    parser.addoption("--auth-token-ttl", action="store", type=float, default=3600.0, help="время жизни токена, сек")
+
+    parser.addoption(
+        "--metrics-report", action="store", default=None,
+        help="путь к JSON отчету с задержками запросов по эндпоинтам, сохраняется в конце сессии"
+    )
+
+    parser.addoption(
+        "--max-retries", action="store", type=int, default=3,
+        help="количество повторов запроса на уровне транспорта (502/503/504/429 и ошибки соединения)"
+    )
+    parser.addoption(
+        "--retry-post", action="store_true", default=False,
+        help="повторять также POST запросы (по умолчанию только GET, DELETE, HEAD и OPTIONS)"
+    )
+    parser.addoption(
+        "--retry-put", action="store_true", default=False,
+        help="повторять также PUT запросы (активация и сброс пароля расходуют токен)"
+    )
+
+    parser.addoption(
+        "--no-mail-listener", action="store_true", default=False,
+        help="получать токены из писем поллингом Mailhog вместо подписки на /api/v2/websocket"
+    )
+
+    parser.addoption(
+        "--delete-consumed-mail", action="store_true", default=False,
+        help="удалять письмо из Mailhog после использования его токена"
+    )
+    parser.addoption(
+        "--purge-mailbox", action="store_true", default=False,
+        help="очищать ящик Mailhog в начале и в конце сессии (не используется при параллельном запуске)"
+    )
+
+    parser.addoption("--workers", action="store", type=int, default=1, help="количество параллельных воркеров")
+    parser.addoption("--worker-id", action="store", default=None, help="идентификатор воркера (задается раннером)")
+    parser.addoption("--run-id", action="store", default=None, help="идентификатор запуска (задается раннером)")
 
     for option in options:
         parser.addoption(f"--{option}", action="store", default=None)
 
 
+def _worker_id(config) -> str | None:
+    return config.getoption("--worker-id") or xdist_worker_id()
+
+
+def pytest_collection_modifyitems(config, items):
+    worker_id = config.getoption("--worker-id")
+    workers = config.getoption("--workers")
+    if worker_id is None or workers <= 1:
+        return
+
+    selected, deselected = shard(items, worker_id, workers)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def pytest_runtestloop(session):
+    config = session.config
+    workers = config.getoption("--workers")
+    if workers <= 1 or _worker_id(config) is not None or config.option.collectonly:
+        return None
+
+    run_id = config.getoption("--run-id") or DataNamespace().run_id
+    results = run_workers(
+        args=config.invocation_params.args, workers=workers, run_id=run_id, cwd=config.invocation_params.dir
+    )
+
+    reporter = config.pluginmanager.get_plugin('terminalreporter')
+    for result in results:
+        if result.failed:
+            reporter.write_sep('-', f"вывод воркера {result.worker_id}")
+            reporter.write(result.output)
+    for result in results:
+        summary = result.output.strip().splitlines()[-1:] or ['нет вывода']
+        reporter.write_line(f"воркер {result.worker_id}: {summary[0]}")
+
+    session.testsfailed = sum(result.failed for result in results)
+    return True
+
+
+request_metrics_key = pytest.StashKey[LatencyMetrics]()
+
+
+@pytest.fixture(scope="session")
+def request_metrics(request):
+    report_path = request.config.getoption("--metrics-report")
+    if report_path is None:
+        yield None
+        return
+
+    worker_id = _worker_id(request.config)
+    if worker_id is not None:
+        report_path = Path(report_path)
+        report_path = report_path.with_name(f"{report_path.stem}-{worker_id}{report_path.suffix}")
+
+    metrics = request.config.stash[request_metrics_key] = LatencyMetrics()
+    yield metrics
+    metrics.export(report_path)
+
+
+retry_stats_key = pytest.StashKey[RetryStats]()
+
+
+@pytest.fixture(scope="session")
+def retry_stats(request):
+    stats = request.config.stash[retry_stats_key] = RetryStats()
+    return stats
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    metrics = config.stash.get(request_metrics_key, None)
+    if metrics is not None and metrics.endpoints:
+        terminalreporter.write_sep('-', "задержки запросов по эндпоинтам")
+        terminalreporter.write_line(metrics.format(limit=20))
+
+    stats = config.stash.get(retry_stats_key, None)
+    if stats is not None and stats.total:
+        terminalreporter.write_sep('-', f"повторы запросов на уровне транспорта: {stats.total}")
+        terminalreporter.write_line(stats.format())
+
+
+@pytest.fixture(scope="session")
+def transport_options(request, run_identity, request_metrics, retry_stats):
+    return {
+        'cassette_path': request.config.getoption("--cassette"),
+        'cassette_mode': request.config.getoption("--cassette-mode"),
+        'metrics': request_metrics,
+        'max_retries': request.config.getoption("--max-retries"),
+        'retry_post': request.config.getoption("--retry-post"),
+        'retry_put': request.config.getoption("--retry-put"),
+        'retry_stats': retry_stats,
+    }
+
+
+@pytest.fixture(scope="session")
+def auth_token_cache(request):
+    return AuthTokenCache(
+        ttl=request.config.getoption("--auth-token-ttl"),
+        path=request.config.getoption("--auth-token-cache"),
+    )
+
+
+@pytest.fixture(scope="session")
+def parallel_run(request) -> bool:
+    return _worker_id(request.config) is not None
+
+
+@pytest.fixture(scope="session", autouse=True)
+def run_identity(request) -> dict[str, str | int]:
+    """
+    Идентификатор запуска и seed Faker.
+
+    При записи кассеты генерируются новые значения, а кассета
+    перезаписывается: повторная запись с прежними логинами упала бы
+    на регистрации уже существующих пользователей. При воспроизведении
+    значения берутся из кассеты, чтобы логины, email адреса и пароли
+    совпали с записанными запросами.
+    """
+    identity = {'run_id': request.config.getoption("--run-id") or DataNamespace().run_id,
+                'seed': random.randrange(2 ** 32)}
+
+    cassette_path = request.config.getoption("--cassette")
+    cassette_mode = request.config.getoption("--cassette-mode")
+    if cassette_path and cassette_mode:
+        cassette = get_cassette(cassette_path)
+        if cassette_mode == 'record':
+            cassette.rewrite(**identity)
+        else:
+            identity.update(cassette.meta)
+
+    Faker.seed(identity['seed'])
+    return identity
+
+
+@pytest.fixture(scope="session")
+def data_namespace(request, run_identity):
+    return DataNamespace(run_id=run_identity['run_id'], worker_id=_worker_id(request.config) or 'w0')
+
+
+@pytest.fixture(scope="session")
+def shared_mailhog_client(transport_options):
+    mailhog_configuration = Configuration(host=v.get('service.mailhog'), disable_log=True, **transport_options)
+    return ApiMailhog(configuration=mailhog_configuration)
+
+
+@pytest.fixture(scope="session")
+def mailbox_index(parallel_run: bool, data_namespace: DataNamespace):
+    return MailboxIndex(recipient_filter=data_namespace.owns if parallel_run else None)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def purge_mailbox(request, shared_mailhog_client: ApiMailhog, parallel_run: bool):
+    purge = request.config.getoption("--purge-mailbox") and not parallel_run
+    if purge:
+        shared_mailhog_client.mailhog_api.delete_api_v1_messages()
+    yield
+    if purge:
+        shared_mailhog_client.mailhog_api.delete_api_v1_messages()
+
+
+@pytest.fixture(scope="session")
+def mail_listener(request, mailbox_index: MailboxIndex):
+    if request.config.getoption("--no-mail-listener") or request.config.getoption("--cassette-mode"):
+        yield None
+        return
+
+    listener = MailListener(host=v.get('service.mailhog'), mailbox_index=mailbox_index)
+    listener.start()
+    yield listener
+    listener.stop()
+
+
+@pytest.fixture(scope="session")
+def shared_account_client(transport_options):
+    dm_api_configuration = Configuration(host=v.get('service.dm_api_account'), disable_log=False, **transport_options)
+    return ApiDmAccount(configuration=dm_api_configuration)
+
+
 @pytest.fixture()
-def mailhog_client():
-    mailhog_configuration = Configuration(host=v.get('service.mailhog'), disable_log=True)
-    mailhog_client = ApiMailhog(configuration=mailhog_configuration)
-    return mailhog_client
+def mailhog_client(shared_mailhog_client: ApiMailhog):
+    return shared_mailhog_client.fork()
 
 
 @pytest.fixture()
-def account_client():
-    dm_api_configuration = Configuration(host=v.get('service.dm_api_account'), disable_log=False)
-    account_client = ApiDmAccount(configuration=dm_api_configuration)
-    return account_client
+def account_client(shared_account_client: ApiDmAccount):
+    return shared_account_client.fork()
 
 
 @pytest.fixture()
-def account_helper(account_client: ApiDmAccount, mailhog_client: ApiMailhog):
-    account_helper = AccountHelper(api_dm_account=account_client, api_mailhog=mailhog_client)
+def account_helper(request, account_client: ApiDmAccount, mailhog_client: ApiMailhog, mailbox_index: MailboxIndex,
+                   auth_token_cache: AuthTokenCache, parallel_run: bool, mail_listener: MailListener | None):
+    account_helper = AccountHelper(
+        api_dm_account=account_client,
+        api_mailhog=mailhog_client,
+        search_by_email=parallel_run,
+        auth_token_cache=auth_token_cache,
+        mail_listener=mail_listener,
+        delete_consumed_mail=request.config.getoption("--delete-consumed-mail"),
+        mailbox_index=mailbox_index
+    )
     return account_helper
 
 
 @pytest.fixture()
-def auth_account_helper(mailhog_client: ApiMailhog):
-    dm_api_configuration = Configuration(host=v.get('service.dm_api_account'), disable_log=False)
-    account_client = ApiDmAccount(configuration=dm_api_configuration)
-
-    account_helper = AccountHelper(api_dm_account=account_client, api_mailhog=mailhog_client)
+def auth_account_helper(request, shared_account_client: ApiDmAccount, mailhog_client: ApiMailhog,
+                        mailbox_index: MailboxIndex, auth_token_cache: AuthTokenCache,
+                        mail_listener: MailListener | None):
+    account_helper = AccountHelper(
+        api_dm_account=shared_account_client.fork(),
+        api_mailhog=mailhog_client,
+        auth_token_cache=auth_token_cache,
+        mail_listener=mail_listener,
+        delete_consumed_mail=request.config.getoption("--delete-consumed-mail"),
+        mailbox_index=mailbox_index
+    )
 
     login = v.get('user.login')
     password = v.get('user.password')
@@ -73,15 +348,67 @@ def auth_account_helper(mailhog_client: ApiMailhog):
 
 
 @pytest.fixture
-def prepare_user():
-    now = datetime.now()
-    data = now.strftime("%d_%m_%Y_%H_%M_%S")
+def prepare_user(data_namespace: DataNamespace):
     faker = Faker()
 
-    login = faker.name().replace(' ', '') + "_" + data
+    login = data_namespace.login(faker.name().replace(' ', ''))
     password = faker.password(length=10, special_chars=False)
-    email = f'{login}@mail.ru'
+    email = data_namespace.email(login)
     User = namedtuple("user", ["login", "password", "email"])
     user = User(login=login, password=password, email=email)
 
     return user
+
+
+@pytest.fixture(scope="session")
+def user_pool(request, transport_options, data_namespace: DataNamespace, parallel_run: bool):
+    faker = Faker()
+
+    def credentials_factory():
+        login = data_namespace.login(faker.name().replace(' ', ''))
+        return Registration(
+            login=login,
+            password=faker.password(length=10, special_chars=False),
+            email=data_namespace.email(login)
+        )
+
+    def account_helper_factory():
+        # Пул пополняется в фоновом потоке между тестами, где нет текущего
+        # теста Allure, поэтому вложения запросов отключены.
+        return AccountHelper(
+            api_dm_account=ApiDmAccount(
+                configuration=Configuration(
+                    host=v.get('service.dm_api_account'), disable_log=True, performance_mode=True, **transport_options
+                )
+            ),
+            api_mailhog=ApiMailhog(
+                configuration=Configuration(
+                    host=v.get('service.mailhog'), disable_log=True, performance_mode=True, **transport_options
+                )
+            ),
+        )
+
+    store_path = request.config.getoption("--user-pool-store")
+    if store_path is None and not v.get('stand.local'):
+        store_name = request.config.getoption("--env")
+        if parallel_run:
+            store_name = f"{store_name}-{data_namespace.worker_id}"
+        store_path = Path(__file__).parent.parent / '.user_pool' / f'{store_name}.jsonl'
+
+    pool = UserPool(
+        account_helper_factory=account_helper_factory,
+        credentials_factory=credentials_factory,
+        store=UserPoolStore(store_path),
+        size=request.config.getoption("--user-pool-size"),
+    )
+    pool.start()
+    yield pool
+    pool.stop()
+
+
+@pytest.fixture
+def pooled_user(user_pool: UserPool, auth_token_cache: AuthTokenCache):
+    user = user_pool.lease()
+    if user.auth_token:
+        auth_token_cache.put(host=v.get('service.dm_api_account'), login=user.login, token=user.auth_token)
+    return user
@@ -0,0 +1,37 @@
+import asyncio
+
+import allure
+from vyper import v
+
+from dm_api_account.models.UserEnvelope import UserEnvelope
+from helpers.async_account_helper import AsyncAccountHelper
+from rest_client.configuration import Configuration
+from services.async_api_dm_account import AsyncApiDmAccount
+from services.async_api_mailhog import AsyncApiMailhog
+
+
+async def _register_and_login(user) -> tuple[UserEnvelope, UserEnvelope, str]:
+    dm_account = AsyncApiDmAccount(configuration=Configuration(host=v.get('service.dm_api_account'), disable_log=True))
+    mailhog = AsyncApiMailhog(configuration=Configuration(host=v.get('service.mailhog'), disable_log=True))
+    account_helper = AsyncAccountHelper(api_dm_account=dm_account, api_mailhog=mailhog)
+    try:
+        activated = await account_helper.register_new_user(login=user.login, password=user.password, email=user.email)
+        logged_in = await account_helper.user_login(login=user.login, password=user.password, validate_response=True)
+        await account_helper.auth_user(login=user.login, password=user.password)
+        return activated, logged_in, account_helper.dm_account.account_api.session.headers['x-dm-auth-token']
+    finally:
+        await dm_account.aclose()
+        await mailhog.aclose()
+
+
+@allure.suite("Тесты AsyncAccountHelper")
+class TestsAsyncAccountHelper:
+    @allure.sub_suite("Позитивные тесты")
+    @allure.title("Проверка регистрации, активации и входа пользователя через асинхронный клиент")
+    def test_register_activate_login(self, prepare_user):
+        activated, logged_in, token = asyncio.run(_register_and_login(prepare_user))
+
+        assert activated.resource.login == prepare_user.login
+        assert 'Player' in [role.value for role in activated.resource.roles]
+        assert logged_in.resource.login == prepare_user.login
+        assert token
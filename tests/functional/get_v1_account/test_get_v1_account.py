@@ -1,4 +1,5 @@
 import allure
+from vyper import v
 from checkers.get_v1_account import GetV1Account
 from checkers.http_checkers import check_status_code_http
 
@@ -12,6 +13,28 @@ class TestsGetV1Account:
 
             GetV1Account.check_response_values(response=response, login="DarrenDalton12_08_2025_22_43_04")
 
+    @allure.sub_suite("Позитивные тесты")
+    @allure.title("Проверка получения информации об авторизованном пользователе с ленивой валидацией ответа")
+    def test_get_v1_account_auth_lazy(self, auth_account_helper):
+        with check_status_code_http():
+            response = auth_account_helper.dm_account.account_api.get_v1_account(lazy_response=True)
+
+            GetV1Account.check_response_values(response=response, login="DarrenDalton12_08_2025_22_43_04")
+
+    @allure.sub_suite("Позитивные тесты")
+    @allure.title("Проверка повторного входа, если сервис отклонил токен из кэша")
+    def test_get_v1_account_auth_stale_cached_token(self, account_helper, auth_token_cache):
+        host = v.get('service.dm_api_account')
+        login = v.get('user.login')
+        auth_token_cache.put(host=host, login=login, token='stale-token')
+
+        account_helper.auth_user(login=login, password=v.get('user.password'))
+        with check_status_code_http():
+            response = account_helper.dm_account.account_api.get_v1_account()
+
+            GetV1Account.check_response_values(response=response, login="DarrenDalton12_08_2025_22_43_04")
+        assert auth_token_cache.get(host=host, login=login) not in (None, 'stale-token')
+
     @allure.sub_suite("Негативные тесты")
     @allure.title("Проверка получения информации о неавторизованном пользователе")
     def test_get_v1_account(self, account_helper):
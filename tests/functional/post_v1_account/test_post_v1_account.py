@@ -1,15 +1,12 @@
-from datetime import datetime
-
 import allure
 import pytest
 from faker import Faker
 
 from checkers.http_checkers import check_status_code_http
 from checkers.post_v1_account import PostV1Account
+from dm_api_account.models.Registration import Registration
 
 faker = Faker()
-now = datetime.now()
-data = now.strftime("%d_%m_%Y_%H_%M_%S")
 
 
 @allure.suite("Тесты на проверку метода POST v1/account")
@@ -27,28 +24,33 @@ class TestsPostV1Account:
 
         PostV1Account.check_response_values(prepare_user=prepare_user, response=response)
 
-    @pytest.mark.parametrize(
-        "login, password, email", [
-            (
-                    f"{faker.name().replace(' ', '')}_{data}",
-                    f"{faker.password(5)}",
-                    f"{faker.email()}",
-            ),
-            (
-                    f"{faker.name().replace(' ', '')}_{data}",
-                    f"{faker.password(10)}",
-                    f"{faker.email().replace('@', '')}",
-            ),
-            (
-                    f"{faker.name()[0]}",
-                    f"{faker.password(10)}",
-                    f"{faker.email()}",
+    @allure.sub_suite("Позитивные тесты")
+    @allure.title("Проверка пакетной регистрации пользователей")
+    def test_post_v1_account_batch(self, account_helper, prepare_user):
+        batch = [
+            Registration(
+                login=f"{prepare_user.login}_{index}",
+                password=prepare_user.password,
+                email=f"{prepare_user.login}_{index}@mail.ru"
             )
-
+            for index in range(3)
         ]
+
+        responses = account_helper.register_users(batch=batch)
+
+        assert [response.resource.login for response in responses] == [reg_data.login for reg_data in batch]
+
+    @pytest.mark.parametrize(
+        "invalid_credentials", [
+            lambda user: (user.login, faker.password(5), user.email),
+            lambda user: (user.login, faker.password(10), user.email.replace('@', '')),
+            lambda user: (user.login[0], faker.password(10), user.email),
+        ],
+        ids=["short_password", "invalid_email", "short_login"]
     )
     @allure.sub_suite("Негативные тесты")
     @allure.title("Проверка регистрации нового пользователя с невалидными кредами")
-    def test_post_v1_account_invalid_credentials(self, account_helper, login, password, email):
+    def test_post_v1_account_invalid_credentials(self, account_helper, prepare_user, invalid_credentials):
+        login, password, email = invalid_credentials(prepare_user)
         with check_status_code_http(400, "Validation failed"):
             account_helper.register_new_user(login=login, password=password, email=email)
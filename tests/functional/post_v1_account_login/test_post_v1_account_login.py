@@ -4,6 +4,5 @@ import allure
 class TestsPostV1AccountLogin:
     @allure.sub_suite("Позитивные тесты")
     @allure.title("Проверка авторизации пользователя")
-    def test_post_v1_account_login(self, account_helper, prepare_user):
-        account_helper.register_new_user(login=prepare_user.login, password=prepare_user.password, email=prepare_user.email)
-        account_helper.user_login(login=prepare_user.login, password=prepare_user.password)
\ No newline at end of file
+    def test_post_v1_account_login(self, account_helper, pooled_user):
+        account_helper.user_login(login=pooled_user.login, password=pooled_user.password)
\ No newline at end of file
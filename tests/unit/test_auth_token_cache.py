@@ -0,0 +1,55 @@
+import allure
+
+from helpers.auth_token_cache import AuthTokenCache
+
+HOST = 'http://dm-api.local'
+
+
+@allure.suite("Тесты AuthTokenCache")
+class TestsAuthTokenCache:
+    @allure.title("Проверка хранения токена в памяти и истечения срока жизни")
+    def test_memory_ttl(self):
+        cache = AuthTokenCache(ttl=60)
+        cache.put(host=HOST, login='user', token='token-1')
+
+        assert cache.get(host=HOST, login='user') == 'token-1'
+        assert cache.get(host='http://other', login='user') is None
+
+        expired = AuthTokenCache(ttl=-1)
+        expired.put(host=HOST, login='user', token='token-1')
+        assert expired.get(host=HOST, login='user') is None
+
+    @allure.title("Проверка, что токен, удаленный другим воркером, не выдается")
+    def test_invalidation_seen_by_other_worker(self, tmp_path):
+        path = tmp_path / 'tokens.json'
+        first, second = AuthTokenCache(path=path), AuthTokenCache(path=path)
+        first.put(host=HOST, login='user', token='token-1')
+        assert second.get(host=HOST, login='user') == 'token-1'
+
+        first.invalidate_token('token-1')
+
+        assert second.get(host=HOST, login='user') is None
+        assert first.get(host=HOST, login='user') is None
+
+    @allure.title("Проверка удаления из файла токена, которого нет в памяти процесса")
+    def test_invalidate_token_not_in_memory(self, tmp_path):
+        path = tmp_path / 'tokens.json'
+        AuthTokenCache(path=path).put(host=HOST, login='user', token='token-1')
+        AuthTokenCache(path=path).put(host=HOST, login='other', token='token-2')
+
+        AuthTokenCache(path=path).invalidate_token('token-1')
+
+        fresh = AuthTokenCache(path=path)
+        assert fresh.get(host=HOST, login='user') is None
+        assert fresh.get(host=HOST, login='other') == 'token-2'
+
+    @allure.title("Проверка, что новый токен другого воркера заменяет токен в памяти")
+    def test_replaced_token_seen_by_other_worker(self, tmp_path):
+        path = tmp_path / 'tokens.json'
+        first, second = AuthTokenCache(path=path), AuthTokenCache(path=path)
+        first.put(host=HOST, login='user', token='token-1')
+        assert second.get(host=HOST, login='user') == 'token-1'
+
+        first.put(host=HOST, login='user', token='token-2')
+
+        assert second.get(host=HOST, login='user') == 'token-2'
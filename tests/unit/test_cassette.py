@@ -0,0 +1,110 @@
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import allure
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from rest_client.cassette import Cassette, CassetteMiss, RecordingAdapter, ReplayAdapter, request_key
+
+
+class _CounterHandler(BaseHTTPRequestHandler):
+    """
+    Отвечает номером обращения к серверу и телом запроса.
+    """
+
+    def _respond(self) -> None:
+        self.server.calls += 1
+        length = int(self.headers.get('Content-Length') or 0)
+        body = json.dumps({'call': self.server.calls, 'path': self.path,
+                           'body': self.rfile.read(length).decode() if length else None}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _respond
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def counter_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _CounterHandler)
+    server.calls = 0
+    thread = Thread(target=server.serve_forever, kwargs={'poll_interval': 0.01}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _session(adapter) -> requests.Session:
+    session = requests.Session()
+    session.mount('http://', adapter)
+    return session
+
+
+@allure.suite("Тесты записи и воспроизведения кассет")
+class TestsCassette:
+    @allure.title("Проверка, что ключ запроса не зависит от адреса сервера, порядка параметров и формата JSON")
+    def test_request_key(self):
+        assert request_key('get', 'http://localhost:5051/v1/account?b=2&a=1', None) == \
+            request_key('GET', 'https://dm.example:443/v1/account?a=1&b=2', b'')
+        assert request_key('POST', 'http://a/v1/account', '{"login": "x", "email": "y"}') == \
+            request_key('POST', 'http://b/v1/account', b'{"email":"y","login":"x"}')
+        assert request_key('GET', 'http://a/v1/account?a=1', None) != request_key('GET', 'http://a/v1/account', None)
+
+    @allure.title("Проверка воспроизведения записанных ответов на сервере с другим адресом")
+    def test_record_replay_round_trip(self, counter_server, tmp_path):
+        path = tmp_path / 'cassette.jsonl'
+        recording = _session(RecordingAdapter(Cassette(path), HTTPAdapter()))
+        recorded = [
+            recording.get(f"{counter_server}/api/v2/messages?limit=1&start=0"),
+            recording.post(f"{counter_server}/v1/account", json={'login': 'user'}),
+        ]
+
+        cassette = Cassette(path)
+        replay = _session(ReplayAdapter(cassette))
+        replayed = [
+            replay.get("http://other-host:1/api/v2/messages?start=0&limit=1"),
+            replay.post("http://other-host:1/v1/account", json={'login': 'user'}),
+        ]
+
+        assert len(cassette) == 2
+        assert [response.json() for response in replayed] == [response.json() for response in recorded]
+        assert [response.status_code for response in replayed] == [200, 200]
+        assert replayed[0].headers['Content-Type'] == 'application/json'
+        with pytest.raises(CassetteMiss):
+            replay.post("http://other-host:1/v1/account", json={'login': 'other'})
+
+    @allure.title("Проверка, что одинаковые запросы воспроизводятся по порядку, а последний ответ повторяется")
+    def test_repeated_requests_replayed_in_order(self, counter_server, tmp_path):
+        path = tmp_path / 'cassette.jsonl'
+        recording = _session(RecordingAdapter(Cassette(path), HTTPAdapter()))
+        for _ in range(3):
+            recording.get(f"{counter_server}/api/v2/messages")
+
+        replay = _session(ReplayAdapter(Cassette(path)))
+        calls = [replay.get(f"{counter_server}/api/v2/messages").json()['call'] for _ in range(5)]
+
+        assert calls == [1, 2, 3, 3, 3]
+
+    @allure.title("Проверка, что перезапись кассеты удаляет прежние ответы и параметры запуска")
+    def test_rewrite(self, counter_server, tmp_path):
+        path = tmp_path / 'cassette.jsonl'
+        cassette = Cassette(path)
+        cassette.write_meta(run_id='old', seed=1)
+        _session(RecordingAdapter(cassette, HTTPAdapter())).get(f"{counter_server}/v1/account")
+
+        cassette.rewrite(run_id='new', seed=2)
+
+        assert len(cassette) == 0
+        assert cassette.meta == {'run_id': 'new', 'seed': 2}
+        reloaded = Cassette(path)
+        assert len(reloaded) == 0
+        assert reloaded.meta == {'run_id': 'new', 'seed': 2}
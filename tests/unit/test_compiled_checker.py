@@ -0,0 +1,129 @@
+from datetime import datetime
+
+import allure
+import pytest
+from hamcrest import equal_to, has_properties, has_property, instance_of, none, starts_with
+from hamcrest.core.string_description import StringDescription
+
+from checkers.compiled import Arg, CompiledChecker, _predicate
+from dm_api_account.models.UserEnvelope import UserEnvelope
+
+
+@pytest.fixture
+def user_envelope() -> UserEnvelope:
+    return UserEnvelope.model_validate({
+        'resource': {
+            'login': 'other_login',
+            'roles': ['Guest'],
+            'status': 'busy',
+            'rating': {'enabled': True, 'quality': 1, 'quantity': 0},
+            'registration': '2026-01-01T00:00:00',
+        }
+    })
+
+
+def _tree_mismatch(matcher, actual) -> str:
+    """
+    Описание несовпадения вложенного `has_properties` с путем через точку,
+    как его выводит `CompiledChecker`.
+    """
+    description = StringDescription()
+    matcher.describe_mismatch(actual, description)
+    return str(description).replace("' property '", ".")
+
+
+@allure.suite("Тесты CompiledChecker")
+class TestsCompiledChecker:
+    @allure.title("Проверка описаний несовпадений в сравнении с деревом has_properties")
+    @pytest.mark.parametrize("spec, tree", [
+        (
+            {"resource": {"status": equal_to("")}},
+            has_property("resource", has_properties({"status": equal_to("")})),
+        ),
+        (
+            {"resource": {"status": none()}},
+            has_property("resource", has_properties({"status": none()})),
+        ),
+        (
+            {"resource": {"registration": instance_of(str)}},
+            has_property("resource", has_properties({"registration": instance_of(str)})),
+        ),
+        (
+            {"resource": {"login": starts_with("user")}},
+            has_property("resource", has_properties({"login": starts_with("user")})),
+        ),
+        (
+            {"resource": {"rating": {"quality": equal_to(0)}}},
+            has_property("resource", has_properties({"rating": has_properties({"quality": equal_to(0)})})),
+        ),
+        (
+            {"resource": {"rating": {"quality": 0}}},
+            has_property("resource", has_properties({"rating": has_properties({"quality": 0})})),
+        ),
+    ], ids=["equal_to", "none", "instance_of", "starts_with", "nested_path", "plain_value"])
+    def test_mismatch_matches_hamcrest(self, user_envelope, spec, tree):
+        mismatches = CompiledChecker(spec).mismatches(user_envelope)
+
+        assert not tree.matches(user_envelope)
+        assert len(mismatches) == 1
+        expected, but = mismatches[0].split('\n')
+        assert expected.startswith("Expected: object with property 'resource.")
+        assert but == f"     but: {_tree_mismatch(tree, user_envelope)}"
+
+    @allure.title("Проверка описания отсутствующего атрибута")
+    def test_missing_attribute(self, user_envelope):
+        tree = has_property("resource", has_properties({"icq": none()}))
+
+        mismatches = CompiledChecker({"resource": {"icq": none()}}).mismatches(user_envelope)
+
+        assert not tree.matches(user_envelope)
+        assert mismatches == [
+            "Expected: object with property 'resource.icq' matching None\n"
+            "     but: no property 'resource.icq'"
+        ]
+
+    @allure.title("Проверка ожидания Arg")
+    def test_arg(self, user_envelope):
+        checker = CompiledChecker({"resource": {"login": Arg("login", starts_with)}})
+        tree = has_property("resource", has_property("login", starts_with("user")))
+
+        assert checker.mismatches(user_envelope, login="other") == []
+        assert checker.mismatches(user_envelope, login="user") == [
+            "Expected: object with property 'resource.login' matching a string starting with 'user'\n"
+            f"     but: {_tree_mismatch(tree, user_envelope)}"
+        ]
+        with pytest.raises(AssertionError, match="resource.login"):
+            checker.check(user_envelope, login="user")
+
+    @allure.title("Проверка совпадения с деревом has_properties для корректного объекта")
+    def test_no_mismatches(self, user_envelope):
+        spec = {"resource": {
+            "login": starts_with("other"),
+            "status": equal_to("busy"),
+            "name": none(),
+            "registration": instance_of(datetime),
+            "rating": {"enabled": True, "quality": equal_to(1)},
+        }}
+        tree = has_property("resource", has_properties({
+            "login": starts_with("other"),
+            "status": equal_to("busy"),
+            "name": none(),
+            "registration": instance_of(datetime),
+            "rating": has_properties({"enabled": True, "quality": equal_to(1)}),
+        }))
+
+        assert tree.matches(user_envelope)
+        assert CompiledChecker(spec).mismatches(user_envelope) == []
+
+    @allure.title("Проверка совпадения быстрых проверок с matcher.matches")
+    @pytest.mark.parametrize("matcher", [
+        equal_to(0), equal_to(""), equal_to(True), equal_to(None),
+        none(),
+        instance_of(int), instance_of(datetime), instance_of(str),
+        starts_with("user"), starts_with(""),
+    ], ids=str)
+    @pytest.mark.parametrize("value", [
+        0, 1, True, False, "", "user_1", "other", None, 1.0, datetime(2026, 1, 1),
+    ], ids=repr)
+    def test_predicate_matches_hamcrest(self, matcher, value):
+        assert _predicate(matcher)(value) == matcher.matches(value)
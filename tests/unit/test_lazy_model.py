@@ -0,0 +1,81 @@
+import json
+
+import allure
+import pytest
+from pydantic import ValidationError
+
+from dm_api_account.models.UserDetailsEnvelope import UserDetailsEnvelope
+from dm_api_account.models.UserEnvelope import UserEnvelope
+from rest_client.lazy_model import LazyModelView, validate_envelope
+
+USER = {
+    "login": "DarrenDalton_3f2504e0w0n1",
+    "roles": ["Guest", "Player"],
+    "mediumPictureUrl": None,
+    "rating": {"enabled": True, "quality": 0, "quantity": 0},
+    "online": "2025-08-12T22:43:04.123456+00:00",
+    "registration": "2025-08-12T22:43:04.123456+00:00",
+}
+
+
+def _errors(error: ValidationError) -> list[tuple]:
+    return [(item['type'], item['loc']) for item in error.errors()]
+
+
+@allure.suite("Тесты ленивой валидации ответов")
+class TestsLazyModel:
+    @allure.title("Проверка, что ленивое и полное представление ответа совпадают")
+    @pytest.mark.parametrize("model, payload", [
+        (UserEnvelope, {"resource": USER, "metadata": None}),
+        (UserDetailsEnvelope, {"resource": {**USER, "info": "", "settings": {
+            "colorSchema": "Modern",
+            "paging": {"postsPerPage": 10, "commentsPerPage": 10, "topicsPerPage": 10,
+                       "messagesPerPage": 10, "entitiesPerPage": 10},
+        }}}),
+    ])
+    def test_lazy_equals_eager(self, model, payload):
+        body = json.dumps(payload).encode()
+
+        eager = validate_envelope(model, body)
+        lazy = validate_envelope(model, body, lazy=True)
+
+        assert isinstance(lazy, LazyModelView)
+        assert lazy.to_model() == eager
+        assert lazy.resource.login == eager.resource.login
+        assert lazy.resource.roles == eager.resource.roles
+        assert lazy.resource.online == eager.resource.online
+        assert lazy.resource.rating.quality == eager.resource.rating.quality
+        assert lazy.resource.medium_picture_url == eager.resource.medium_picture_url
+        assert lazy.resource.status == eager.resource.status
+        assert lazy.metadata == eager.metadata
+
+    @allure.title("Проверка одинаковой ошибки на некорректном JSON")
+    @pytest.mark.parametrize("body", [b'', b'{"resource":', b'<html>502 Bad Gateway</html>'])
+    def test_invalid_json_same_error(self, body):
+        with pytest.raises(ValidationError) as eager:
+            validate_envelope(UserEnvelope, body)
+        with pytest.raises(ValidationError) as lazy:
+            validate_envelope(UserEnvelope, body, lazy=True)
+
+        assert _errors(lazy.value) == _errors(eager.value)
+
+    @allure.title("Проверка одинаковой ошибки на JSON, который не является объектом")
+    def test_not_object_same_error(self):
+        with pytest.raises(ValidationError) as eager:
+            validate_envelope(UserEnvelope, b'[]')
+        with pytest.raises(ValidationError) as lazy:
+            validate_envelope(UserEnvelope, b'[]', lazy=True)
+
+        assert _errors(lazy.value) == _errors(eager.value)
+
+    @allure.title("Проверка, что ошибка поля возникает при обращении к нему")
+    def test_invalid_field_deferred(self):
+        payload = {"resource": {**USER, "roles": ["Unknown"]}}
+
+        view = validate_envelope(UserEnvelope, json.dumps(payload).encode(), lazy=True)
+
+        assert view.resource.login == USER["login"]
+        with pytest.raises(ValidationError):
+            view.resource.roles
+        with pytest.raises(ValidationError):
+            view.to_model()
@@ -0,0 +1,53 @@
+import allure
+from requests.structures import CaseInsensitiveDict
+from vyper import v
+
+from rest_client.client import RestClient
+from rest_client.configuration import Configuration
+from rest_client.log_sink import log_sink, redact_curl, redact_headers, snapshot
+
+
+@allure.suite("Тесты логирования запросов")
+class TestsLogSink:
+    @allure.title("Проверка маскирования заголовков авторизации")
+    def test_redact_headers(self):
+        headers = CaseInsensitiveDict({'X-Dm-Auth-Token': 'secret', 'Cookie': 'a=b', 'Accept': 'application/json'})
+
+        assert redact_headers(headers) == {'X-Dm-Auth-Token': '***', 'Cookie': '***', 'Accept': 'application/json'}
+        assert headers['X-Dm-Auth-Token'] == 'secret'
+        assert redact_headers(None) is None
+
+    @allure.title("Проверка маскирования заголовков авторизации в cURL")
+    def test_redact_curl(self):
+        curl = "curl -X GET -H 'x-dm-auth-token: secret' -H 'Accept: */*' 'http://localhost/v1/account'"
+
+        assert redact_curl(curl) == "curl -X GET -H 'x-dm-auth-token: ***' -H 'Accept: */*' 'http://localhost/v1/account'"
+
+    @allure.title("Проверка копирования изменяемых значений")
+    def test_snapshot(self):
+        body = {'login': 'user', 'roles': ['Guest']}
+
+        copied = snapshot(body)
+        body['roles'].append('Player')
+
+        assert copied == {'login': 'user', 'roles': ['Guest']}
+        assert snapshot('text') == 'text'
+
+    @allure.title("Проверка, что лог запроса не содержит токен и не видит изменений тела после вызова")
+    def test_request_log(self, capsys):
+        client = RestClient(configuration=Configuration(
+            host=v.get('service.dm_api_account'), headers={'x-dm-auth-token': 'secret-token'}, max_retries=0
+        ))
+        body = {'login': v.get('user.login'), 'password': v.get('user.password'), 'rememberMe': True}
+
+        response = client.post(path='/v1/account/login', json=body)
+        body['login'] = 'changed-after-request'
+        log_sink.flush()
+        output = capsys.readouterr().out
+
+        assert response.status_code == 200
+        assert 'secret-token' not in output
+        assert response.headers['x-dm-auth-token'] not in output
+        assert 'changed-after-request' not in output
+        assert v.get('user.login') in output
+        assert '***' in output
@@ -0,0 +1,83 @@
+import allure
+import pytest
+from vyper import v
+
+from helpers.mail_listener import MailListener
+from helpers.mailbox_index import MailKind
+
+
+@pytest.fixture
+def listener():
+    listener = MailListener(
+        host=v.get('service.mailhog'),
+        timeout=5.0,
+        reconnect_delay=0.1
+    )
+    yield listener
+    listener.stop()
+
+
+@allure.suite("Тесты MailListener")
+class TestsMailListener:
+    @allure.title("Проверка ошибки ожидания токена без логина и email")
+    def test_wait_token_without_recipient(self, listener):
+        with pytest.raises(ValueError):
+            listener.wait_token(MailKind.ACTIVATION)
+
+    @allure.title("Проверка пропуска письма, обработка которого завершилась ошибкой")
+    def test_dispatch_error_skips_message(self, local_stand, listener, monkeypatch):
+        if local_stand is None:
+            pytest.skip("требуется локальный стенд")
+
+        index = listener.mailbox_index
+        ingest_message = index.ingest_message
+        failed = []
+
+        def fail_first(item):
+            if not failed:
+                failed.append(item['ID'])
+                raise RuntimeError("ошибка разбора письма")
+            return ingest_message(item)
+
+        monkeypatch.setattr(index, 'ingest_message', fail_first)
+        assert listener.start()
+
+        for token in ('token-1', 'token-2'):
+            local_stand.mailbox.send(
+                to='listener@mail.ru',
+                subject='Активация',
+                body={'Login': 'listener', 'ConfirmationLinkUrl': f'http://localhost/activate/{token}'}
+            )
+
+        assert listener.wait_token(MailKind.ACTIVATION, login='listener') == 'token-2'
+        assert failed
+        assert listener.connected
+        assert listener.received == 2
+
+    @allure.title("Проверка остановки слушателя во время подключения")
+    def test_stop_during_connect(self, listener, monkeypatch):
+        closed = []
+
+        class StoppingClient:
+
+            def __init__(self, url):
+                self.url = url
+
+            def connect(self):
+                listener._stopped.set()
+                return self
+
+            def close(self):
+                closed.append(self.url)
+
+            def __iter__(self):
+                raise AssertionError("закрытый клиент не должен читаться")
+
+        monkeypatch.setattr('helpers.mail_listener.WebSocketClient', StoppingClient)
+
+        assert not listener.start(connect_timeout=0.5)
+        listener._thread.join(5)
+
+        assert not listener._thread.is_alive()
+        assert closed == [listener.url]
+        assert not listener.connected
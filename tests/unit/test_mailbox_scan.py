@@ -0,0 +1,80 @@
+import allure
+import pytest
+from vyper import v
+
+from helpers.account_helper import AccountHelper
+from helpers.mailbox_index import MailKind
+from rest_client.configuration import Configuration
+from services.api_dm_account import ApiDmAccount
+from services.api_mailhog import ApiMailhog
+
+
+class _MessagesRequests:
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, metric):
+        if metric.endpoint == '/api/v2/messages':
+            self.count += 1
+
+
+@pytest.fixture
+def messages_requests():
+    return _MessagesRequests()
+
+
+@pytest.fixture
+def scan_account_helper(local_stand, messages_requests):
+    if local_stand is None:
+        pytest.skip("требуется локальный стенд")
+    for number in range(120):
+        local_stand.mailbox.send(to=f'scan{number}@mail.ru', subject='Письмо', body={'Login': f'scan{number}'})
+    return AccountHelper(
+        api_dm_account=ApiDmAccount(configuration=Configuration(host=v.get('service.dm_api_account'), disable_log=True)),
+        api_mailhog=ApiMailhog(
+            configuration=Configuration(host=v.get('service.mailhog'), disable_log=True, metrics=messages_requests)
+        ),
+    )
+
+
+@allure.suite("Тесты обхода почтового ящика")
+class TestsMailboxScan:
+    @allure.title("Проверка, что повторный опрос до прихода письма запрашивает одну страницу")
+    def test_repeated_miss(self, local_stand, scan_account_helper, messages_requests):
+        assert scan_account_helper._get_token_from_mailbox(login='absent', kind=MailKind.ACTIVATION) is None
+        assert messages_requests.count > 1
+
+        for _ in range(3):
+            messages_requests.count = 0
+            assert scan_account_helper._get_token_from_mailbox(login='absent', kind=MailKind.ACTIVATION) is None
+            assert messages_requests.count == 1
+
+        local_stand.mailbox.send(
+            to='absent@mail.ru',
+            subject='Активация',
+            body={'Login': 'absent', 'ConfirmationLinkUrl': 'http://localhost/activate/absent-token'}
+        )
+        messages_requests.count = 0
+        assert scan_account_helper._get_token_from_mailbox(login='absent', kind=MailKind.ACTIVATION) == 'absent-token'
+        assert messages_requests.count == 1
+
+    @allure.title("Проверка, что группа находит письма, просмотренные предыдущими опросами")
+    def test_tokens_by_logins_after_miss(self, local_stand, scan_account_helper, messages_requests):
+        local_stand.mailbox.send(
+            to='first@mail.ru',
+            subject='Активация',
+            body={'Login': 'first', 'ConfirmationLinkUrl': 'http://localhost/activate/first-token'}
+        )
+        assert scan_account_helper._get_token_from_mailbox(login='second', kind=MailKind.ACTIVATION) is None
+
+        local_stand.mailbox.send(
+            to='second@mail.ru',
+            subject='Активация',
+            body={'Login': 'second', 'ConfirmationLinkUrl': 'http://localhost/activate/second-token'}
+        )
+        messages_requests.count = 0
+        tokens = scan_account_helper.get_activation_tokens_by_logins(logins=['first', 'second'])
+
+        assert tokens == {'first': 'first-token', 'second': 'second-token'}
+        assert messages_requests.count == 1
@@ -0,0 +1,68 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import allure
+
+from helpers.mailbox_index import MailboxIndex, MailKind
+from helpers.message_store import ParsedMessageStore
+
+
+def _message(login: str, token: str, message_id: str | None = None) -> dict:
+    item = {
+        'To': [{'Mailbox': login, 'Domain': 'mail.ru'}],
+        'Created': '2026-01-01T00:00:00.000000000Z',
+        'Content': {'Body': json.dumps({'Login': login, 'ConfirmationLinkUrl': f'http://localhost/activate/{token}'})},
+    }
+    if message_id is not None:
+        item['ID'] = message_id
+    return item
+
+
+@allure.suite("Тесты ParsedMessageStore")
+class TestsParsedMessageStore:
+    @allure.title("Проверка повторного использования разобранного письма по ID")
+    def test_parse_cached_by_id(self):
+        store = ParsedMessageStore()
+
+        first = store.parse(_message('first', 'token-1', message_id='1@mailhog'))
+        second = store.parse(_message('second', 'token-2', message_id='1@mailhog'))
+
+        assert second is first
+        assert '1@mailhog' in store
+        assert len(store) == 1
+
+    @allure.title("Проверка разбора писем без ID")
+    def test_parse_without_id(self):
+        store = ParsedMessageStore()
+
+        first = store.parse(_message('first', 'token-1'))
+        second = store.parse(_message('second', 'token-2'))
+
+        assert (first.login, second.login) == ('first', 'second')
+        assert None not in store
+        assert len(store) == 0
+
+    @allure.title("Проверка индексации писем без ID")
+    def test_index_messages_without_id(self):
+        index = MailboxIndex()
+
+        index.ingest([_message('first', 'token-1'), _message('second', 'token-2')])
+
+        assert index.get_token(login='first', kind=MailKind.ACTIVATION) == 'token-1'
+        assert index.get_token(login='second', kind=MailKind.ACTIVATION) == 'token-2'
+        assert index.get_token_by_email(email='second@mail.ru', kind=MailKind.ACTIVATION) == 'token-2'
+
+    @allure.title("Проверка параллельного пополнения индекса")
+    def test_concurrent_ingest_keeps_newest(self):
+        index = MailboxIndex()
+        items = []
+        for number in range(200):
+            item = _message('shared', f'token-{number:03}', message_id=f'{number}@mailhog')
+            item['Created'] = f'2026-01-01T00:00:{number // 10:02}.{number % 10}00000Z'
+            items.append(item)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(index.ingest_message, reversed(items)))
+
+        assert index.get_token(login='shared', kind=MailKind.ACTIVATION) == 'token-199'
+        assert index.get_token_by_email(email='shared@mail.ru', kind=MailKind.ACTIVATION) == 'token-199'
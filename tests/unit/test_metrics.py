@@ -0,0 +1,83 @@
+import random
+
+import allure
+import pytest
+
+from rest_client.metrics import Histogram, path_template
+
+
+def _exact_percentile(values: list[int], rank: float) -> int:
+    ordered = sorted(values)
+    target = max(int(rank / 100 * len(ordered) + 0.999999), 1)
+    return ordered[target - 1]
+
+
+def _recorded(values: list[int], precision_bits: int = 7) -> Histogram:
+    histogram = Histogram(precision_bits=precision_bits)
+    for value in values:
+        histogram.record(value / 1_000_000)
+    return histogram
+
+
+@allure.suite("Тесты метрик запросов")
+class TestsMetrics:
+    @allure.title("Проверка погрешности перцентилей гистограммы")
+    @pytest.mark.parametrize("precision_bits", [4, 7, 10])
+    def test_percentile_error_bound(self, precision_bits):
+        generator = random.Random(precision_bits)
+        values = [int(generator.lognormvariate(9, 1.5)) for _ in range(5000)]
+        histogram = _recorded(values, precision_bits=precision_bits)
+        recorded = [int(value / 1_000_000 * 1_000_000) for value in values]
+        bound = 2 ** (1 - precision_bits)
+
+        for rank in (1, 10, 50, 90, 95, 99, 99.9, 100):
+            exact = _exact_percentile(recorded, rank)
+            estimate = histogram.percentile(rank) * 1_000_000
+            assert abs(estimate - exact) <= exact * bound + 1e-6, rank
+
+    @allure.title("Проверка точного хранения малых значений")
+    def test_small_values_exact(self):
+        values = list(range(128))
+        histogram = _recorded(values)
+
+        assert [histogram.percentile(rank) * 1_000_000 for rank in (1, 50, 100)] == pytest.approx([1, 63, 127])
+        assert histogram.count == 128
+        assert histogram.mean == pytest.approx(sum(values) / 128 / 1_000_000)
+
+    @allure.title("Проверка, что перцентили не выходят за минимум и максимум")
+    def test_percentile_clamped(self):
+        histogram = _recorded([1007, 76 << 16])
+
+        assert histogram.percentile(0) * 1_000_000 == pytest.approx(1007)
+        assert histogram.percentile(100) * 1_000_000 == pytest.approx(76 << 16)
+        assert Histogram().percentile(99) == 0.0
+
+    @allure.title("Проверка объединения гистограмм")
+    def test_merge(self):
+        generator = random.Random(1)
+        values = [generator.randrange(1, 10_000_000) for _ in range(1000)]
+        merged = _recorded(values[:400])
+        merged.merge(_recorded(values[400:]))
+
+        expected = _recorded(values)
+        assert merged.counts == expected.counts
+        assert (merged.count, merged.total, merged.min, merged.max) == \
+            (expected.count, expected.total, expected.min, expected.max)
+        with pytest.raises(ValueError):
+            merged.merge(Histogram(precision_bits=5))
+
+    @allure.title("Проверка приведения пути к шаблону эндпоинта")
+    @pytest.mark.parametrize("path, template", [
+        ('/v1/account/5d7c5f3e-2a6b-4c1d-9e8f-0a1b2c3d4e5f', '/v1/account/{token}'),
+        ('/v1/account/5D7C5F3E2A6B4C1D9E8F0A1B2C3D4E5F', '/v1/account/{token}'),
+        ('v1/account/password', '/v1/account/password'),
+        ('/v1/account/login/all', '/v1/account/login/all'),
+        ('/v1/account/user_1a2b3c4dw0n7@mail.ru', '/v1/account/{id}'),
+        ('/v1/account/user_1a2b3c4dw0n7%40mail.ru', '/v1/account/{id}'),
+        ('/api/v1/messages/1XcN_Y7g@mailhog.example', '/api/v1/messages/{id}'),
+        ('/api/v1/messages/42', '/api/v1/messages/{id}'),
+        ('/api/v2/search?kind=to&query=user_1a2b3c4dw0n7@mail.ru', '/api/v2/search'),
+        ('/api/v2/messages?limit=50&start=0', '/api/v2/messages'),
+    ])
+    def test_path_template(self, path, template):
+        assert path_template(path) == template
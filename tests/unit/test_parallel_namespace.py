@@ -0,0 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import allure
+import pytest
+
+from helpers.data_namespace import MAX_LOGIN_LENGTH, DataNamespace
+from helpers.parallel_runner import shard
+
+
+@allure.suite("Тесты разделения тестов и данных между воркерами")
+class TestsParallelNamespace:
+    @allure.title("Проверка, что шарды не пересекаются и покрывают все тесты")
+    @pytest.mark.parametrize("total, workers", [(0, 2), (1, 3), (10, 1), (10, 3), (17, 4), (5, 8)])
+    def test_shards_disjoint_and_complete(self, total, workers):
+        items = [f"test_{number}" for number in range(total)]
+
+        shards = [shard(items, f"w{index}", workers) for index in range(workers)]
+
+        selected = [item for worker_items, _ in shards for item in worker_items]
+        assert sorted(selected) == sorted(items)
+        assert len(selected) == len(set(selected))
+        for worker_items, deselected in shards:
+            assert sorted(worker_items + deselected) == sorted(items)
+            assert max(len(worker_items) for worker_items, _ in shards) - len(worker_items) <= 1
+
+    @allure.title("Проверка уникальности логинов между воркерами одного запуска")
+    def test_logins_unique_across_workers(self):
+        namespaces = [DataNamespace(run_id='run1', worker_id=f"w{index}") for index in range(12)]
+
+        logins = [namespace.login('user') for namespace in namespaces for _ in range(15)]
+
+        assert len(logins) == len(set(logins))
+        for namespace in namespaces:
+            owned = [login for login in logins if namespace.owns(login)]
+            assert len(owned) == 15
+            assert all(namespace.owns(namespace.email(login)) for login in owned)
+
+    @allure.title("Проверка уникальности логинов при генерации из нескольких потоков")
+    def test_logins_unique_across_threads(self):
+        namespace = DataNamespace(run_id='run1', worker_id='w0')
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            logins = list(executor.map(lambda _: namespace.login('user'), range(500)))
+
+        assert len(set(logins)) == 500
+
+    @allure.title("Проверка, что логин не превышает ограничение длины API")
+    def test_login_length_limit(self):
+        namespace = DataNamespace(worker_id='w15')
+        base = 'ОченьДлинноеИмя' * 20
+
+        logins = [namespace.login(base) for _ in range(3)]
+
+        assert all(len(login) <= MAX_LOGIN_LENGTH for login in logins)
+        assert len(set(logins)) == 3
+        assert all(namespace.owns(login) for login in logins)
+        assert namespace.login('user') == f"user_{namespace.run_id}w15n4"
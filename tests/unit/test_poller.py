@@ -0,0 +1,117 @@
+import asyncio
+from types import SimpleNamespace
+
+import allure
+import pytest
+
+from helpers import poller as poller_module
+from helpers.poller import Poller
+
+
+class _FakeClock:
+    """
+    Часы, время которых сдвигается только ожиданием.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    async def async_sleep(self, seconds: float) -> None:
+        self.sleep(seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(poller_module, 'time', SimpleNamespace(monotonic=clock.monotonic, sleep=clock.sleep))
+    monkeypatch.setattr(poller_module, 'asyncio', SimpleNamespace(sleep=clock.async_sleep))
+    return clock
+
+
+def _results(*values):
+    results = iter(values)
+    return lambda: next(results)
+
+
+@allure.suite("Тесты Poller")
+class TestsPoller:
+    @allure.title("Проверка ограничения задержки значением max_delay")
+    def test_delay_capped(self):
+        poller = Poller(initial_delay=0.1, max_delay=1.0, multiplier=2.0, jitter=0.0)
+
+        assert [poller.delay(attempt) for attempt in range(1, 7)] == pytest.approx([0.1, 0.2, 0.4, 0.8, 1.0, 1.0])
+
+    @allure.title("Проверка, что джиттер только уменьшает задержку")
+    def test_delay_jitter(self):
+        poller = Poller(initial_delay=1.0, max_delay=1.0, jitter=0.5)
+
+        delays = [poller.delay(1) for _ in range(200)]
+
+        assert all(0.5 <= delay <= 1.0 for delay in delays)
+
+    @allure.title("Проверка результата и статистики успешного опроса")
+    def test_success_recorded(self, clock):
+        poller = Poller(timeout=10, initial_delay=0.1, max_delay=1.0, jitter=0.0)
+
+        assert poller.poll(_results(None, '', 'token')) == 'token'
+
+        assert clock.sleeps == pytest.approx([0.1, 0.2])
+        stats = poller.stats[-1]
+        assert stats.success
+        assert stats.attempts == 3
+        assert stats.waited == pytest.approx(0.3)
+        assert stats.elapsed == pytest.approx(0.3)
+
+    @allure.title("Проверка ошибки и статистики при истечении дедлайна")
+    def test_timeout(self, clock):
+        poller = Poller(timeout=3, initial_delay=1.0, max_delay=1.0, jitter=0.0, error_message="Нет токена")
+
+        with pytest.raises(AssertionError, match="Нет токена за 3 сек, попыток: 4"):
+            poller.poll(lambda: None)
+
+        assert clock.sleeps == pytest.approx([1.0, 1.0, 1.0])
+        stats = poller.stats[-1]
+        assert not stats.success
+        assert stats.attempts == 4
+        assert stats.waited == pytest.approx(3.0)
+
+    @allure.title("Проверка, что последнее ожидание не выходит за дедлайн")
+    def test_sleep_limited_by_deadline(self, clock):
+        poller = Poller(timeout=2.5, initial_delay=1.0, max_delay=1.0, jitter=0.0)
+
+        with pytest.raises(AssertionError):
+            poller.poll(lambda: None)
+
+        assert clock.sleeps == pytest.approx([1.0, 1.0, 0.5])
+        assert clock.now == pytest.approx(2.5)
+
+    @allure.title("Проверка асинхронного опроса и его статистики")
+    def test_poll_async(self, clock):
+        poller = Poller(timeout=10, initial_delay=0.5, max_delay=0.5, jitter=0.0)
+        results = _results(None, 'token')
+
+        @poller
+        async def get_token():
+            return results()
+
+        assert asyncio.run(get_token()) == 'token'
+        assert clock.sleeps == pytest.approx([0.5])
+        assert poller.stats[-1].name.endswith('get_token')
+        assert poller.stats[-1].attempts == 2
+
+    @allure.title("Проверка ограничения размера статистики")
+    def test_stats_size(self, clock):
+        poller = Poller(stats_size=2)
+
+        for value in ('a', 'b', 'c'):
+            poller.poll(lambda: value)
+
+        assert len(poller.stats) == 2
@@ -0,0 +1,144 @@
+import socket
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import allure
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from rest_client.retry import CountingRetry, RetryStats, create_retry
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    """
+    Отвечает `failures` раз кодом `status` с `Retry-After`, затем 200.
+    """
+
+    def _respond(self) -> None:
+        server = self.server
+        server.calls.append(self.command)
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        if len(server.calls) <= server.failures:
+            self.send_response(server.status)
+            if server.retry_after is not None:
+                self.send_header('Retry-After', str(server.retry_after))
+        else:
+            self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def flaky_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _FlakyHandler)
+    server.calls, server.failures, server.status, server.retry_after = [], 2, 503, None
+    thread = Thread(target=server.serve_forever, kwargs={'poll_interval': 0.01}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _session(retry: CountingRetry) -> requests.Session:
+    session = requests.Session()
+    session.mount('http://', HTTPAdapter(max_retries=retry))
+    return session
+
+
+def _url(server) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}/v1/account"
+
+
+@allure.suite("Тесты повторов запросов на уровне транспорта")
+class TestsRetry:
+    @allure.title("Проверка повтора GET и счетчиков повторов")
+    def test_get_retried(self, flaky_server):
+        stats = RetryStats()
+        retry = create_retry(total=3, backoff=0, backoff_max=1, statuses=(503,), stats=stats)
+
+        response = _session(retry).get(_url(flaky_server))
+
+        assert response.status_code == 200
+        assert flaky_server.calls == ['GET', 'GET', 'GET']
+        assert stats.total == 2
+        assert stats.snapshot() == {'GET 503': 2}
+        assert stats.format() == 'GET 503: 2'
+
+    @allure.title("Проверка, что после исчерпания повторов возвращается последний ответ")
+    def test_retries_exhausted(self, flaky_server):
+        flaky_server.failures = 10
+        stats = RetryStats()
+        retry = create_retry(total=2, backoff=0, backoff_max=1, statuses=(503,), stats=stats)
+
+        response = _session(retry).get(_url(flaky_server))
+
+        assert response.status_code == 503
+        assert len(flaky_server.calls) == 3
+        assert stats.total == 2
+
+    @allure.title("Проверка, что POST и PUT по умолчанию не повторяются")
+    @pytest.mark.parametrize("method", ['POST', 'PUT'])
+    def test_not_retried_by_default(self, flaky_server, method):
+        stats = RetryStats()
+        retry = create_retry(total=3, backoff=0, backoff_max=1, statuses=(503,), stats=stats)
+
+        response = _session(retry).request(method, _url(flaky_server), json={})
+
+        assert response.status_code == 503
+        assert flaky_server.calls == [method]
+        assert stats.total == 0
+
+    @allure.title("Проверка повтора POST и PUT по явному разрешению")
+    @pytest.mark.parametrize("method, options", [('POST', {'retry_post': True}), ('PUT', {'retry_put': True})])
+    def test_retried_when_enabled(self, flaky_server, method, options):
+        stats = RetryStats()
+        retry = create_retry(total=3, backoff=0, backoff_max=1, statuses=(503,), stats=stats, **options)
+
+        response = _session(retry).request(method, _url(flaky_server), json={})
+
+        assert response.status_code == 200
+        assert flaky_server.calls == [method] * 3
+        assert stats.snapshot() == {f'{method} 503': 2}
+
+    @allure.title("Проверка ограничения Retry-After значением backoff_max")
+    def test_retry_after_capped(self, flaky_server):
+        flaky_server.status, flaky_server.retry_after = 429, 120
+        retry = create_retry(total=3, backoff=0, backoff_max=0.05, statuses=(429,), stats=RetryStats())
+
+        started = time.perf_counter()
+        response = _session(retry).get(_url(flaky_server))
+
+        assert response.status_code == 200
+        assert time.perf_counter() - started < 5
+        assert retry.get_retry_after(type('Response', (), {'headers': {'Retry-After': '120'}})()) == 0.05
+
+    @allure.title("Проверка учета ошибок соединения")
+    def test_connection_error_counted(self):
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        stats = RetryStats()
+        retry = create_retry(total=2, backoff=0, backoff_max=1, statuses=(503,), stats=stats)
+
+        with pytest.raises(requests.ConnectionError):
+            _session(retry).get(f"http://127.0.0.1:{port}/")
+
+        assert stats.total == 2
+        assert all(method == 'GET' for method, _ in stats.counts)
+        assert all(reason.endswith('Error') for _, reason in stats.counts)
+
+    @allure.title("Проверка, что new сохраняет счетчики")
+    def test_new_keeps_stats(self):
+        stats = RetryStats()
+        retry = CountingRetry(total=3, stats=stats)
+
+        assert retry.new(total=2).stats is stats
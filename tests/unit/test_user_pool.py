@@ -0,0 +1,107 @@
+import itertools
+from threading import Event, Lock
+
+import allure
+import pytest
+
+from dm_api_account.models.Registration import Registration
+from helpers.user_pool import PooledUser, UserPool, UserPoolStore
+
+
+class _Response:
+
+    def __init__(self, token: str):
+        self.headers = {'x-dm-auth-token': token}
+
+
+class _ProvisioningHelper:
+    """
+    Helper, который регистрирует пользователей без обращения к стенду.
+
+    Первые `failures` вызовов `register_users` завершаются ошибкой.
+    """
+
+    def __init__(self, failures: int = 0, gate: Event | None = None):
+        self.failures = failures
+        self.gate = gate
+        self.registered: list[str] = []
+        self._lock = Lock()
+
+    def register_users(self, batch: list[Registration], validate_response: bool = True) -> None:
+        if self.gate is not None:
+            self.gate.wait(5)
+        with self._lock:
+            if self.failures:
+                self.failures -= 1
+                raise ConnectionError("стенд недоступен")
+            self.registered.extend(credentials.login for credentials in batch)
+
+    def user_login(self, login: str, password: str) -> _Response:
+        return _Response(f'token-{login}')
+
+
+def _pool(helper: _ProvisioningHelper, **kwargs) -> UserPool:
+    numbers = itertools.count(1)
+
+    def credentials_factory() -> Registration:
+        login = f'pool_user{next(numbers)}'
+        return Registration(login=login, password='password', email=f'{login}@mail.ru')
+
+    return UserPool(account_helper_factory=lambda: helper, credentials_factory=credentials_factory, **kwargs)
+
+
+@pytest.fixture
+def pools():
+    created = []
+    yield created
+    for pool in created:
+        pool.stop()
+
+
+@allure.suite("Тесты UserPool")
+class TestsUserPool:
+    @allure.title("Проверка выдачи пользователей и фонового пополнения")
+    def test_lease_and_refill(self, pools):
+        helper = _ProvisioningHelper()
+        pool = _pool(helper, size=4, low_watermark=2)
+        pools.append(pool)
+
+        leased = [pool.lease(timeout=5) for _ in range(6)]
+
+        assert len({user.login for user in leased}) == 6
+        assert all(user.auth_token == f'token-{user.login}' for user in leased)
+        assert len(helper.registered) >= 6
+
+    @allure.title("Проверка ожидания новой попытки после ошибки пополнения")
+    def test_lease_after_refill_error(self, pools):
+        helper = _ProvisioningHelper(failures=1)
+        pool = _pool(helper, size=2)
+        pools.append(pool)
+
+        with pytest.raises(AssertionError, match="стенд недоступен"):
+            pool.lease(timeout=5)
+
+        assert pool.lease(timeout=5).login.startswith('pool_user')
+
+    @allure.title("Проверка ошибки по истечении времени ожидания")
+    def test_lease_timeout(self, pools):
+        gate = Event()
+        pool = _pool(_ProvisioningHelper(gate=gate), size=1)
+        pools.append(pool)
+
+        with pytest.raises(AssertionError, match="истекло время ожидания"):
+            pool.lease(timeout=0.1)
+        gate.set()
+
+    @allure.title("Проверка восстановления невыданных пользователей из журнала")
+    def test_store_restores_unleased(self, tmp_path, pools):
+        store = UserPoolStore(tmp_path / 'pool.jsonl')
+        first = _pool(_ProvisioningHelper(), store=store, size=2)
+        users = first.fill(3)
+        first.lease()
+
+        restored = _pool(_ProvisioningHelper(), store=UserPoolStore(tmp_path / 'pool.jsonl'), size=2)
+
+        assert len(restored) == 2
+        assert [restored.lease(), restored.lease()] == users[1:]
+        assert isinstance(users[0], PooledUser)
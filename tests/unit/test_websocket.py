@@ -0,0 +1,102 @@
+import io
+import socket
+import struct
+
+import allure
+import pytest
+
+from rest_client.websocket import OPCODE_BINARY, OPCODE_CLOSE, OPCODE_CONTINUATION, OPCODE_PING, OPCODE_PONG, \
+    OPCODE_TEXT, WebSocketClient, WebSocketError, encode_frame, read_frame
+
+
+def _server_frame(payload: bytes, opcode: int, fin: bool = True) -> bytes:
+    return bytes([(0x80 if fin else 0) | opcode, len(payload)]) + payload
+
+
+@pytest.fixture
+def connection():
+    client_socket, server_socket = socket.socketpair()
+    client = WebSocketClient('ws://localhost/api/v2/websocket')
+    client._socket, client._reader = client_socket, client_socket.makefile('rb')
+    server_reader = server_socket.makefile('rb')
+    yield client, server_socket, server_reader
+    client.close()
+    server_reader.close()
+    server_socket.close()
+
+
+@allure.suite("Тесты кодирования фреймов WebSocket")
+class TestsWebSocketFrames:
+    @allure.title("Проверка длины фрейма в 7, 16 и 64 битах")
+    @pytest.mark.parametrize("size, length_byte, header_size", [(125, 125, 2), (300, 126, 4), (70000, 127, 10)])
+    def test_frame_length(self, size, length_byte, header_size):
+        payload = bytes(index % 251 for index in range(size))
+        frame = encode_frame(payload, OPCODE_BINARY, mask=False)
+
+        assert frame[1] == length_byte
+        assert len(frame) == header_size + size
+        if length_byte == 126:
+            assert struct.unpack('!H', frame[2:4])[0] == size
+        if length_byte == 127:
+            assert struct.unpack('!Q', frame[2:10])[0] == size
+        assert read_frame(io.BytesIO(frame)) == (True, OPCODE_BINARY, payload)
+
+    @allure.title("Проверка маскирования фрейма клиента")
+    @pytest.mark.parametrize("size", [5, 300, 70000])
+    def test_masked_frame(self, size):
+        payload = b'x' * size
+        frame = encode_frame(payload)
+
+        assert frame[1] & 0x80
+        assert payload not in frame
+        assert read_frame(io.BytesIO(frame)) == (True, OPCODE_TEXT, payload)
+
+    @allure.title("Проверка ошибки при обрыве фрейма")
+    def test_truncated_frame(self):
+        frame = encode_frame(b'x' * 300, mask=False)
+
+        with pytest.raises(WebSocketError):
+            read_frame(io.BytesIO(frame[:-1]))
+
+
+@allure.suite("Тесты получения сообщений WebSocketClient")
+class TestsWebSocketClient:
+    @allure.title("Проверка сборки фрагментированного сообщения")
+    def test_fragmented_message(self, connection):
+        client, server_socket, _ = connection
+        server_socket.sendall(
+            _server_frame(b'{"ID": ', OPCODE_TEXT, fin=False)
+            + _server_frame(b'"1', OPCODE_CONTINUATION, fin=False)
+            + _server_frame(b'"}', OPCODE_CONTINUATION)
+        )
+
+        assert client.recv() == '{"ID": "1"}'
+
+    @allure.title("Проверка ответа pong на ping")
+    def test_ping_pong(self, connection):
+        client, server_socket, server_reader = connection
+        server_socket.sendall(
+            _server_frame(b'hel', OPCODE_TEXT, fin=False)
+            + _server_frame(b'ping-1', OPCODE_PING)
+            + _server_frame(b'lo', OPCODE_CONTINUATION)
+        )
+
+        assert client.recv() == 'hello'
+        assert read_frame(server_reader) == (True, OPCODE_PONG, b'ping-1')
+
+    @allure.title("Проверка завершения по фрейму close")
+    def test_close(self, connection):
+        client, server_socket, server_reader = connection
+        server_socket.sendall(_server_frame(struct.pack('!H', 1000) + b'bye', OPCODE_CLOSE))
+
+        assert client.recv() is None
+        assert read_frame(server_reader) == (True, OPCODE_CLOSE, struct.pack('!H', 1000))
+        assert client.recv() is None
+
+    @allure.title("Проверка завершения при разрыве соединения")
+    def test_connection_lost(self, connection):
+        client, server_socket, _ = connection
+        server_socket.sendall(_server_frame(b'done', OPCODE_TEXT))
+        server_socket.shutdown(socket.SHUT_WR)
+
+        assert list(client) == ['done']